@@ -0,0 +1,212 @@
+"""Benchmark Orchestrator.run with synthetic components.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 10 1000 100000 --latency 0.001 --executor thread
+    python -m benchmarks.run --save-baseline
+    python -m benchmarks.run --compare
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.synthetic import SyntheticEvaluate, SyntheticMeasure
+from impact_engine_orchestrator.components.allocate.mock import MockAllocate
+from impact_engine_orchestrator.components.base import PipelineComponent
+from impact_engine_orchestrator.config import InitiativeConfig, PipelineConfig
+from impact_engine_orchestrator.orchestrator import Orchestrator
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+class StageTimer(PipelineComponent):
+    """Wrap a component and record the latency of every call.
+
+    MEASURE calls carrying a ``sample_size`` are recorded as the ``scale``
+    stage. Latencies are only collected in-process (thread and inline
+    backends).
+    """
+
+    def __init__(self, component: PipelineComponent, stage: str, latencies: dict):
+        self.component = component
+        self.stage = stage
+        self.latencies = latencies
+
+    def __getstate__(self):
+        """Send only the wrapped component to worker processes."""
+        return {"component": self.component, "stage": self.stage, "latencies": {}}
+
+    def execute(self, event: dict) -> dict:
+        """Time the wrapped component's execute."""
+        start = time.perf_counter()
+        try:
+            return self.component.execute(event)
+        finally:
+            stage = "scale" if self.stage == "measure" and "sample_size" in event else self.stage
+            self.latencies.setdefault(stage, []).append(time.perf_counter() - start)
+
+
+def _percentiles(samples: list[float]) -> dict:
+    values = np.asarray(samples) * 1000
+    return {
+        "count": len(values),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p99_ms": float(np.percentile(values, 99)),
+    }
+
+
+def build_orchestrator(size: int, args: argparse.Namespace, latencies: dict) -> Orchestrator:
+    """Build an orchestrator over ``size`` synthetic initiatives."""
+    component_kwargs = {
+        "latency": args.latency,
+        "cpu_cost": args.cpu_cost,
+        "failure_rate": args.failure_rate,
+        "seed": args.seed,
+    }
+    initiatives = [
+        InitiativeConfig(initiative_id=f"init-{k:06d}", cost_to_scale=1000 + (k % 10) * 500) for k in range(size)
+    ]
+    # Budget for roughly half of the portfolio, so SCALE sees real work
+    budget = sum(i.cost_to_scale for i in initiatives) / 2
+    config = PipelineConfig(
+        budget=budget,
+        scale_sample_size=5000,
+        initiatives=initiatives,
+        max_workers=args.max_workers,
+        executor=args.executor,
+        streaming=args.streaming,
+    )
+    return Orchestrator(
+        measure=StageTimer(SyntheticMeasure(payload_size=args.payload_size, **component_kwargs), "measure", latencies),
+        evaluate=StageTimer(SyntheticEvaluate(**component_kwargs), "evaluate", latencies),
+        allocate=StageTimer(MockAllocate(), "allocate", latencies),
+        config=config,
+    )
+
+
+def run_scenario(size: int, args: argparse.Namespace) -> dict:
+    """Run one portfolio size and return its metrics."""
+    latencies = {}
+    orchestrator = build_orchestrator(size, args, latencies)
+
+    start = time.perf_counter()
+    try:
+        orchestrator.run()
+    except Exception as exc:
+        return {"size": size, "error": f"{type(exc).__name__}: {exc}"}
+    wall = time.perf_counter() - start
+
+    # Peak memory from a separate traced run, so tracing overhead doesn't skew timings
+    orchestrator = build_orchestrator(size, args, {})
+    tracemalloc.start()
+    orchestrator.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "size": size,
+        "wall_seconds": wall,
+        "throughput_per_second": size / wall,
+        "peak_memory_mb": peak / 2**20,
+        "stages": {stage: _percentiles(samples) for stage, samples in sorted(latencies.items())},
+    }
+
+
+def scenario_key(size: int, args: argparse.Namespace) -> str:
+    """Identify a scenario across runs (used to match baselines)."""
+    mode = "streaming" if args.streaming else "barrier"
+    return (
+        f"{args.executor}-{mode}-w{args.max_workers}-n{size}"
+        f"-lat{args.latency}-cpu{args.cpu_cost}-fail{args.failure_rate}-payload{args.payload_size}"
+    )
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return regressions of throughput or peak memory beyond ``tolerance``, and scenarios without a baseline."""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            regressions.append(f"{key}: no baseline for this scenario (record one with --save-baseline)")
+            continue
+        if "error" in current or "error" in previous:
+            continue
+        if current["throughput_per_second"] < previous["throughput_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{key}: throughput {current['throughput_per_second']:.0f}/s "
+                f"vs baseline {previous['throughput_per_second']:.0f}/s"
+            )
+        if current["peak_memory_mb"] > previous["peak_memory_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{key}: peak memory {current['peak_memory_mb']:.1f} MB vs baseline {previous['peak_memory_mb']:.1f} MB"
+            )
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    """Print a human-readable summary."""
+    for key, metrics in results.items():
+        print(f"\n{key}")
+        if "error" in metrics:
+            print(f"  ERROR: {metrics['error']}")
+            continue
+        print(f"  Wall:       {metrics['wall_seconds']:.3f} s")
+        print(f"  Throughput: {metrics['throughput_per_second']:,.0f} initiatives/s")
+        print(f"  Peak mem:   {metrics['peak_memory_mb']:.1f} MB")
+        for stage, stats in metrics["stages"].items():
+            print(f"  {stage:<9}   p50 {stats['p50_ms']:8.3f} ms   p99 {stats['p99_ms']:8.3f} ms   n={stats['count']}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark Orchestrator.run with synthetic components")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--executor", default="thread")
+    parser.add_argument("--max-workers", type=int, default=8)
+    parser.add_argument("--streaming", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of sleep per component call")
+    parser.add_argument("--cpu-cost", type=int, default=0, help="Busy-loop iterations per component call")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=10, help="Entries in each diagnostics dict")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Merge results into the baseline file")
+    parser.add_argument("--compare", action="store_true", help="Exit non-zero on regressions against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the benchmark suite."""
+    args = parse_args(argv)
+    results = {scenario_key(size, args): run_scenario(size, args) for size in args.sizes}
+    print_results(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"\nNo baseline at {args.baseline}; record one with --save-baseline")
+            return 1
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
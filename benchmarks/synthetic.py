@@ -0,0 +1,104 @@
+"""Synthetic pipeline components with tunable cost profiles."""
+
+import hashlib
+import time
+from dataclasses import asdict
+
+from impact_engine_orchestrator.components.base import PipelineComponent
+from impact_engine_orchestrator.contracts.measure import MeasureResult
+from impact_engine_orchestrator.contracts.types import ModelType
+
+
+class SyntheticFailure(RuntimeError):
+    """Raised by synthetic components to simulate a failing initiative."""
+
+
+def _unit_hash(*parts) -> float:
+    """Deterministic value in [0, 1) derived from ``parts``."""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
+
+def _burn(iterations: int) -> int:
+    """Spend CPU time holding the GIL."""
+    total = 0
+    for k in range(iterations):
+        total += k * k
+    return total
+
+
+class _SyntheticComponent(PipelineComponent):
+    """Shared cost model: sleep, burn CPU, fail deterministically."""
+
+    def __init__(self, latency: float = 0.0, cpu_cost: int = 0, failure_rate: float = 0.0, seed: int = 0):
+        assert latency >= 0, f"latency must be non-negative, got {latency}"
+        assert cpu_cost >= 0, f"cpu_cost must be non-negative, got {cpu_cost}"
+        assert 0.0 <= failure_rate <= 1.0, f"failure_rate must be in [0, 1], got {failure_rate}"
+        self.latency = latency
+        self.cpu_cost = cpu_cost
+        self.failure_rate = failure_rate
+        self.seed = seed
+
+    def _spend(self, event: dict) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        if self.cpu_cost:
+            _burn(self.cpu_cost)
+        if self.failure_rate and _unit_hash(self.seed, type(self).__name__, event["initiative_id"]) < self.failure_rate:
+            raise SyntheticFailure(f"synthetic failure for {event['initiative_id']}")
+
+
+class SyntheticMeasure(_SyntheticComponent):
+    """MEASURE stand-in returning a valid MeasureResult dict.
+
+    Parameters
+    ----------
+    latency : float
+        Seconds to sleep per call (I/O wait).
+    cpu_cost : int
+        Pure-Python loop iterations per call (GIL-holding CPU work).
+    failure_rate : float
+        Fraction of initiatives that raise :class:`SyntheticFailure`.
+    payload_size : int
+        Number of entries in the ``diagnostics`` dict.
+    seed : int
+        Seed for effects and failures.
+    """
+
+    def __init__(self, payload_size: int = 10, **kwargs):
+        super().__init__(**kwargs)
+        self.payload_size = payload_size
+
+    def execute(self, event: dict) -> dict:
+        """Return a deterministic MeasureResult dict for the initiative."""
+        self._spend(event)
+        initiative_id = event["initiative_id"]
+        effect = _unit_hash(self.seed, initiative_id) * 0.2 - 0.05
+        result = MeasureResult(
+            initiative_id=initiative_id,
+            effect_estimate=effect,
+            ci_lower=effect - 0.02,
+            ci_upper=effect + 0.02,
+            p_value=0.05,
+            sample_size=event.get("sample_size", 100),
+            model_type=ModelType("experiment"),
+            diagnostics={f"metric_{k}": float(k) for k in range(self.payload_size)},
+        )
+        return asdict(result)
+
+
+class SyntheticEvaluate(_SyntheticComponent):
+    """EVALUATE stand-in returning the fields ALLOCATE and reporting read."""
+
+    def execute(self, event: dict) -> dict:
+        """Return scenario returns and a deterministic confidence for the initiative."""
+        self._spend(event)
+        return {
+            "initiative_id": event["initiative_id"],
+            "confidence": 0.5 + 0.5 * _unit_hash(self.seed, "confidence", event["initiative_id"]),
+            "cost": event["cost_to_scale"],
+            "return_best": event["ci_upper"],
+            "return_median": event["effect_estimate"],
+            "return_worst": event["ci_lower"],
+            "model_type": event["model_type"],
+        }
@@ -10,14 +10,22 @@ from pathlib import Path
 
 from impact_engine_orchestrator.config import load_config
 from impact_engine_orchestrator.orchestrator import Orchestrator
+from impact_engine_orchestrator.sinks import CallbackSink
 
 
-def print_reports(result):
-    print("\n" + "=" * 70)
-    print("OUTCOME REPORTS")
-    print("=" * 70)
+class ReportPrinter:
+    """Print each outcome report as it arrives and keep running totals for the summary."""
 
-    for report in result["outcome_reports"]:
+    def __init__(self):
+        self.budget_used = 0.0
+        self.abs_error = 0.0
+        self.count = 0
+
+    def __call__(self, report):
+        if self.count == 0:
+            print("\n" + "=" * 70)
+            print("OUTCOME REPORTS")
+            print("=" * 70)
         print(f"\n{report['initiative_id']}")
         print("-" * 40)
         print(f"  Predicted: {report['predicted_return']:.2%}")
@@ -26,19 +34,21 @@ def print_reports(result):
         print(f"  Confidence: {report['confidence_score']:.2f} ({report['model_type'].value})")
         print(f"  Budget:    ${report['budget_allocated']:,.0f}")
         print(f"  Samples:   {report['sample_size_pilot']} → {report['sample_size_scale']}")
+        self.budget_used += report["budget_allocated"]
+        self.abs_error += abs(report["prediction_error"])
+        self.count += 1
 
-    print("\n" + "=" * 70)
-    print("SUMMARY")
-    print("=" * 70)
-    print(f"  Initiatives evaluated: {len(result['pilot_results'])}")
-    print(f"  Initiatives selected:  {len(result['outcome_reports'])}")
-    if not result["outcome_reports"]:
-        print("  No initiatives selected for scaling.")
-        return
-    total_budget = sum(r["budget_allocated"] for r in result["outcome_reports"])
-    print(f"  Total budget used:     ${total_budget:,.0f}")
-    avg_error = sum(abs(r["prediction_error"]) for r in result["outcome_reports"]) / len(result["outcome_reports"])
-    print(f"  Avg prediction error:  {avg_error:.2%}")
+    def print_summary(self, result):
+        print("\n" + "=" * 70)
+        print("SUMMARY")
+        print("=" * 70)
+        print(f"  Initiatives evaluated: {len(result['pilot_results'])}")
+        print(f"  Initiatives selected:  {self.count}")
+        if not self.count:
+            print("  No initiatives selected for scaling.")
+            return
+        print(f"  Total budget used:     ${self.budget_used:,.0f}")
+        print(f"  Avg prediction error:  {self.abs_error / self.count:.2%}")
 
 
 def main():
@@ -49,8 +59,10 @@ def main():
 
     config = load_config(args.config)
     orchestrator = Orchestrator.from_config(config)
-    result = orchestrator.run()
-    print_reports(result)
+    printer = ReportPrinter()
+    # Reports are printed as each scale measurement completes
+    result = orchestrator.run(sink=CallbackSink(printer))
+    printer.print_summary(result)
 
 
 if __name__ == "__main__":
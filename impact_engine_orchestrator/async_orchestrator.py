@@ -0,0 +1,309 @@
+"""Asyncio pipeline runner for I/O-bound components."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from impact_engine_orchestrator.components.base import AsyncPipelineComponent
+from impact_engine_orchestrator.concurrency import AIMDController
+from impact_engine_orchestrator.instrumentation import timed_call_async
+from impact_engine_orchestrator.orchestrator import Orchestrator
+from impact_engine_orchestrator.sinks import ReportSink
+
+
+async def _gather(coros):
+    """Run coroutines concurrently; on the first failure cancel the rest and re-raise."""
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class _Limiter:
+    """Admit at most ``limit()`` holders at a time, in arrival order; the limit may change between admissions."""
+
+    def __init__(self, limit):
+        self._limit = limit
+        self._active = 0
+        self._changed = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._active < self._limit())
+            self._active += 1
+
+    async def __aexit__(self, *exc_info):
+        async with self._changed:
+            self._active -= 1
+            self._changed.notify_all()
+
+
+class AsyncOrchestrator(Orchestrator):
+    """Run the pipeline on an asyncio event loop.
+
+    Components may be :class:`~impact_engine_orchestrator.components.base.AsyncPipelineComponent`
+    instances, awaited directly on the loop, or regular synchronous components,
+    offloaded to the configured executor backend. Pilot MEASURE, EVALUATE and
+    scale MEASURE each admit at most their ``stage_workers`` entry, or
+    ``max_concurrency``, calls at a time, so thousands of I/O-bound
+    initiatives can be in flight while synchronous work still runs on
+    ``max_workers`` threads or processes. With ``adaptive_concurrency`` that
+    admission limit is tuned at runtime, with the same cap as its ceiling.
+
+    :meth:`run`, :meth:`resume`, :meth:`rerun` and :meth:`sweep` are coroutines::
+
+        result = asyncio.run(AsyncOrchestrator.from_config(config).run())
+
+    Journaling, instrumentation, stage timeouts, ``on_failure`` and
+    ``runtime_history`` behave as in :class:`Orchestrator`, except that in
+    streaming mode the pilot phase as a whole is bounded by the sum of the
+    MEASURE and EVALUATE timeouts.
+    """
+
+    async def run(self, sink: ReportSink | None = None) -> dict:
+        """Execute all pipeline stages on the running event loop (see :meth:`Orchestrator.run`)."""
+        return await super().run(sink)
+
+    async def resume(self, run_id: str, sink: ReportSink | None = None) -> dict:
+        """Continue a journaled run (see :meth:`Orchestrator.resume`)."""
+        return await super().resume(run_id, sink)
+
+    async def rerun(self, previous_run_id: str, sink: ReportSink | None = None) -> dict:
+        """Run incrementally against a previous run (see :meth:`Orchestrator.rerun`)."""
+        return await super().rerun(previous_run_id, sink)
+
+    async def sweep(self, budgets: list[float]) -> dict:
+        """Run the pipeline at several budgets, measuring and evaluating once (see :meth:`Orchestrator.sweep`)."""
+        assert len(budgets) > 0, "budgets must not be empty"
+        assert all(b > 0 for b in budgets), f"budgets must be positive, got {budgets}"
+
+        self._begin(None)
+        with self._pool() as pool:
+            pilot_results, eval_results = await self._measure_and_evaluate_async(pool)
+
+            with self._span("allocate") as span:
+                alloc_results = await _gather(
+                    [self._allocate_async({"initiatives": eval_results, "budget": budget}) for budget in budgets]
+                )
+                span["payload"] = alloc_results
+
+            # Scale each selected initiative once, however many budgets select it
+            selected_ids = list(dict.fromkeys(iid for a in alloc_results for iid in a["selected_initiatives"]))
+            scale_results = await self._run_stage_async(
+                "measure", self._scale_inputs(selected_ids), pool, label="scale"
+            )
+
+        return self._sweep_result(budgets, pilot_results, eval_results, alloc_results, scale_results)
+
+    def _begin(self, journal):
+        super()._begin(journal)
+        self._limiters = {
+            label: _Limiter(lambda label=label: self._limit(label)) for label in ("measure", "evaluate", "scale")
+        }
+
+    def _limit(self, label):
+        """Return the most calls stage ``label`` may have in flight (``stage_workers`` entry or ``max_concurrency``)."""
+        if self.config.adaptive_concurrency:
+            return self._controller(label).limit
+        return self.config.stage_workers.get(label, self.config.max_concurrency)
+
+    def _controller(self, label):
+        """Return the adaptive concurrency controller for ``label``, starting halfway to its admission cap."""
+        if label not in self._controllers:
+            ceiling = self.config.stage_workers.get(label, self.config.max_concurrency)
+            self._controllers[label] = AIMDController(initial=max(1, ceiling // 2), maximum=ceiling)
+        return self._controllers[label]
+
+    async def _run(self, journal, sink=None):
+        self._begin(journal)
+        with self._pool() as pool:
+            pilot_results, eval_results = await self._measure_and_evaluate_async(pool)
+
+            alloc_result = self._journaled("allocate").get("allocate")
+            if alloc_result is None:
+                with self._span("allocate") as span:
+                    alloc_result = await self._allocate_async(
+                        {"initiatives": eval_results, "budget": self.config.budget}
+                    )
+                    span["payload"] = alloc_result
+                self._record("allocate", "allocate", alloc_result)
+
+            scale_inputs = self._scale_inputs(alloc_result["selected_initiatives"])
+            write = self._report_writer(pilot_results, eval_results, alloc_result, sink)
+            scale_results = await self._run_stage_async("measure", scale_inputs, pool, label="scale", on_result=write)
+
+        return self._finish(pilot_results, eval_results, alloc_result, scale_results, sink)
+
+    async def _call(self, pool, stage, event, label=None):
+        """Execute one event for ``stage``, admitted by the stage's limiter."""
+        label = label or stage
+        component = getattr(self, stage)
+        submitted = time.monotonic()
+        async with self._limiters[label]:
+            if isinstance(component, AsyncPipelineComponent):
+                if self._timings is None and self._history is None:
+                    result = await component.execute(event)
+                else:
+                    result, record = await timed_call_async(component.execute, event, label, time.time())
+                    self._note(result, record)
+            else:
+                future = self._submit(pool, stage, event, label)
+                await asyncio.wrap_future(future)
+                result = self._collect(future)
+            # Observed before releasing, so a raised limit admits the next waiter
+            self._observe(label, submitted)
+        return result
+
+    async def _allocate_async(self, event):
+        """Run ALLOCATE on the loop if async, otherwise in a thread."""
+        if isinstance(self.allocate, AsyncPipelineComponent):
+            return await self.allocate.execute(event)
+        return await asyncio.to_thread(self.allocate.execute, event)
+
+    async def _run_stage_async(self, stage, inputs, pool, label=None, on_result=None):
+        """Run per-initiative ``inputs`` concurrently, reusing and recording journaled results."""
+        label = label or stage
+        done = self._journaled(label)
+        position = {inp["initiative_id"]: index for index, inp in enumerate(inputs)}
+        results = self._collector()
+        unique, duplicates = self._deduplicate(stage, [inp for inp in inputs if inp["initiative_id"] not in done])
+        for iid, index in position.items():
+            if iid in done:
+                results.add(index, done[iid])
+                if on_result is not None:
+                    on_result(done[iid])
+
+        completed = set()
+        failed = set()
+
+        def fail(inp, exc):
+            initiative_ids = [inp["initiative_id"], *duplicates.get(inp["initiative_id"], [])]
+            self._record_failure(label, initiative_ids, exc)
+            failed.update(initiative_ids)
+
+        async def one(inp):
+            try:
+                result = await self._call(pool, stage, inp, label)
+            except Exception as exc:
+                if self.config.on_failure != "skip":
+                    raise
+                fail(inp, exc)
+                return
+            for copy in self._copies(result, duplicates):
+                self._record(label, copy["initiative_id"], copy)
+                results.add(position[copy["initiative_id"]], copy)
+                completed.add(copy["initiative_id"])
+                if on_result is not None:
+                    on_result(copy)
+
+        def timed_out(exc):
+            for inp in unique:
+                if inp["initiative_id"] not in completed and inp["initiative_id"] not in failed:
+                    fail(inp, exc)
+
+        coros = [one(unique[k]) for k in self._order(label, unique)]
+        await self._within(label, self.config.stage_timeouts.get(label), coros, timed_out)
+        return results.build()
+
+    async def _within(self, label, timeout, coros, on_timeout):
+        """Run ``coros`` concurrently within ``timeout`` seconds.
+
+        On timeout the unfinished coroutines are cancelled, and the timeout
+        either propagates or, with ``on_failure: skip``, is passed to
+        ``on_timeout``.
+        """
+        task = asyncio.ensure_future(_gather(coros))
+        try:
+            await asyncio.wait({task}, timeout=timeout)
+        except BaseException:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            raise
+        if task.done():
+            # A component's own TimeoutError (the builtin, on 3.11+) propagates untouched.
+            task.result()
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        self._timed_out = True
+        exc = TimeoutError(f"{label} stage exceeded its {timeout}s timeout")
+        if self.config.on_failure != "skip":
+            raise exc
+        on_timeout(exc)
+
+    async def _measure_and_evaluate_async(self, pool):
+        """Run pilot MEASURE and EVALUATE, chained per initiative when streaming."""
+        measure_inputs, cost_by_id = self._pilot_inputs()
+
+        def eval_input(pilot):
+            return {**pilot, "cost_to_scale": cost_by_id[pilot["initiative_id"]]}
+
+        if not self.config.streaming:
+            pilot_results = await self._run_stage_async("measure", measure_inputs, pool)
+            eval_results = await self._run_stage_async("evaluate", [eval_input(p) for p in pilot_results], pool)
+            return pilot_results, eval_results
+
+        pilot_done = self._journaled("measure")
+        eval_done = self._journaled("evaluate")
+        unique, duplicates = self._deduplicate(
+            "measure", [i for i in measure_inputs if i["initiative_id"] not in pilot_done]
+        )
+        # Initiatives sharing a pilot await the one whose pilot is executed
+        executed_by_id = {iid: executed for executed, iids in duplicates.items() for iid in iids}
+        inputs_by_id = {inp["initiative_id"]: inp for inp in measure_inputs}
+        position = {iid: index for index, iid in enumerate(inputs_by_id)}
+        pilot_results, eval_results = self._collector(), self._collector()
+        pilots = {}
+
+        measured = set(pilot_done)
+        evaluated = set(eval_done)
+        failed = set()
+
+        async def chain(inp):
+            iid = inp["initiative_id"]
+            stage = "measure"
+            try:
+                pilot = pilot_done.get(iid)
+                if pilot is None:
+                    executed = executed_by_id.get(iid, iid)
+                    if executed not in pilots:
+                        pilots[executed] = asyncio.ensure_future(self._call(pool, "measure", inputs_by_id[executed]))
+                    pilot = await pilots[executed]
+                    if executed != iid:
+                        pilot = {**pilot, "initiative_id": iid}
+                    self._record("measure", iid, pilot)
+                    measured.add(iid)
+                pilot_results.add(position[iid], pilot)
+                stage = "evaluate"
+                evaluated_result = eval_done.get(iid)
+                if evaluated_result is None:
+                    evaluated_result = await self._call(pool, "evaluate", eval_input(pilot))
+                    self._record("evaluate", iid, evaluated_result)
+                    evaluated.add(iid)
+                eval_results.add(position[iid], evaluated_result)
+            except Exception as exc:
+                if self.config.on_failure != "skip":
+                    raise
+                self._record_failure(stage, [iid], exc)
+                failed.add(iid)
+
+        def timed_out(exc):
+            for inp in measure_inputs:
+                iid = inp["initiative_id"]
+                if iid not in evaluated and iid not in failed:
+                    self._record_failure("evaluate" if iid in measured else "measure", [iid], exc)
+
+        # Streaming chains share one clock: the pilot phase gets the configured timeouts combined
+        timeouts = [self.config.stage_timeouts[s] for s in ("measure", "evaluate") if s in self.config.stage_timeouts]
+        timeout = sum(timeouts) if timeouts else None
+        # Executed pilots start longest expected first; chains awaiting them or their journal entries follow
+        order = [unique[k] for k in self._order("measure", unique)]
+        started = {inp["initiative_id"] for inp in order}
+        rest = [inp for inp in measure_inputs if inp["initiative_id"] not in started]
+        await self._within("pilot", timeout, [chain(inp) for inp in order + rest], timed_out)
+        return pilot_results.build(), eval_results.build()
@@ -0,0 +1,252 @@
+"""Run many portfolios on one shared, fairly scheduled worker pool."""
+
+import json
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+from impact_engine_orchestrator import registry
+from impact_engine_orchestrator.config import PipelineConfig, StageConfig
+from impact_engine_orchestrator.orchestrator import Orchestrator
+
+
+class FairExecutor:
+    """Fixed set of worker threads serving several clients round-robin.
+
+    Each client (see :meth:`client`) has its own FIFO queue. Whenever a
+    worker frees up it takes the next task from the next client with queued
+    work, so a portfolio that submits 10,000 tasks cannot starve one that
+    submits ten.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of worker threads shared by all clients.
+    """
+
+    def __init__(self, max_workers: int):
+        assert max_workers > 0, f"max_workers must be positive, got {max_workers}"
+        self._condition = threading.Condition()
+        self._queues = {}
+        self._ready = deque()
+        self._shutdown = False
+        self._next_client = 0
+        self._threads = [
+            threading.Thread(target=self._work, name=f"FairExecutor-{k}", daemon=True) for k in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def client(self) -> "FairExecutorClient":
+        """Return a new client with its own queue."""
+        with self._condition:
+            client_id = self._next_client
+            self._next_client += 1
+            self._queues[client_id] = deque()
+        return FairExecutorClient(self, client_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers once all queued tasks have run."""
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _enqueue(self, client_id, item) -> None:
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            queue = self._queues[client_id]
+            queue.append(item)
+            if len(queue) == 1:
+                self._ready.append(client_id)
+            self._condition.notify()
+
+    def _cancel_queued(self, client_id) -> None:
+        with self._condition:
+            queue = self._queues[client_id]
+            while queue:
+                queue.popleft()[0].cancel()
+            if client_id in self._ready:
+                self._ready.remove(client_id)
+
+    def _close(self, client_id) -> None:
+        with self._condition:
+            if not self._queues.get(client_id, True):
+                del self._queues[client_id]
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._ready and not self._shutdown:
+                    self._condition.wait()
+                if not self._ready:
+                    return
+                client_id = self._ready.popleft()
+                queue = self._queues[client_id]
+                future, fn, args, kwargs = queue.popleft()
+                # Round-robin: a client with more work goes to the back of the line
+                if queue:
+                    self._ready.append(client_id)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+
+class FairExecutorClient(Executor):
+    """One portfolio's view of a :class:`FairExecutor`.
+
+    Shutting a client down only affects its own tasks.
+    """
+
+    def __init__(self, executor: FairExecutor, client_id: int):
+        self._executor = executor
+        self._client_id = client_id
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Queue ``fn(*args, **kwargs)`` for the shared workers."""
+        future = Future()
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        self._executor._enqueue(self._client_id, (future, fn, args, kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Optionally cancel this client's queued tasks and wait for its running ones."""
+        if cancel_futures:
+            self._executor._cancel_queued(self._client_id)
+        if wait:
+            with self._lock:
+                futures = list(self._futures)
+            for future in futures:
+                try:
+                    future.exception()
+                except Exception:
+                    pass
+        self._executor._close(self._client_id)
+
+    def _discard(self, future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+
+def _component_key(stage_config: StageConfig) -> str:
+    return json.dumps([stage_config.component, stage_config.kwargs], sort_keys=True, default=str)
+
+
+class _PortfolioOrchestrator(Orchestrator):
+    """Orchestrator for one portfolio of a :class:`BatchRunner`, which flushes the shared components itself."""
+
+    def _flush(self):
+        """Leave the shared components' background work to :meth:`BatchRunner.run`."""
+
+
+class BatchRunner:
+    """Run many independent portfolios on one shared worker pool.
+
+    Every portfolio is driven by its own :class:`Orchestrator` on a
+    lightweight driver thread, while all of their fan-out work is scheduled
+    round-robin on ``max_workers`` shared threads (see
+    :class:`FairExecutor`). Components are built once per distinct stage
+    config and reused across portfolios and calls to :meth:`run`, so they
+    must be safe to call from several threads, as the built-in components
+    are. Their background work (see :meth:`PipelineComponent.flush`) is
+    waited for once all portfolios of a :meth:`run` have finished, rather
+    than by each portfolio. The configs' ``executor`` settings are ignored.
+
+    Parameters
+    ----------
+    max_workers : int
+        Size of the shared pool.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self._executor = FairExecutor(max_workers)
+        self._components = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Return the runner."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Shut down the shared pool."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the shared pool."""
+        self._executor.shutdown()
+
+    def component(self, stage_config: StageConfig):
+        """Return the shared component for ``stage_config``, building it on first use."""
+        key = _component_key(stage_config)
+        with self._lock:
+            if key not in self._components:
+                self._components[key] = registry.build(stage_config)
+            return self._components[key]
+
+    def run(self, configs: list[PipelineConfig], return_exceptions: bool = False) -> list:
+        """Run every config and return their results in order.
+
+        With ``return_exceptions``, a failed portfolio's entry is its
+        exception; otherwise the first failure is raised once all portfolios
+        have finished. The shared components are then flushed once; since
+        their background work cannot be attributed to a portfolio, a flush
+        failure is raised for the batch as a whole.
+        """
+        orchestrators = [self._orchestrator(config) for config in configs]
+        with ThreadPoolExecutor(max_workers=max(1, len(configs)), thread_name_prefix="BatchRunner") as drivers:
+            futures = [drivers.submit(self._drive, orchestrator) for orchestrator in orchestrators]
+        outcomes = [future.exception() or future.result() for future in futures]
+        flush_error = self._flush(orchestrators)
+        if not return_exceptions:
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+        if flush_error is not None:
+            raise flush_error
+        return outcomes
+
+    @staticmethod
+    def _flush(orchestrators) -> Exception | None:
+        """Flush each distinct component of ``orchestrators`` once and return the first failure."""
+        components = {id(c): c for o in orchestrators for c in (o.measure, o.evaluate, o.allocate)}
+        error = None
+        for component in components.values():
+            flush = getattr(component, "flush", None)
+            if callable(flush):
+                try:
+                    flush()
+                except Exception as exc:
+                    error = error or exc
+        return error
+
+    def _orchestrator(self, config: PipelineConfig) -> Orchestrator:
+        assert config.measure_stage is not None, "measure_stage required for BatchRunner"
+        assert config.evaluate_stage is not None, "evaluate_stage required for BatchRunner"
+        assert config.allocate_stage is not None, "allocate_stage required for BatchRunner"
+        return _PortfolioOrchestrator(
+            measure=self.component(config.measure_stage),
+            evaluate=self.component(config.evaluate_stage),
+            allocate=self.component(config.allocate_stage),
+            config=config,
+            pool=self._executor.client(),
+        )
+
+    @staticmethod
+    def _drive(orchestrator: Orchestrator) -> dict:
+        client = orchestrator._shared_pool
+        try:
+            return orchestrator.run()
+        finally:
+            # Drop whatever a failed or timed-out run left queued
+            client.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,119 @@
+"""Persistent, content-addressed cache of MEASURE results."""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from impact_engine_orchestrator import serialization
+
+# Eviction frees space down to this fraction of ``max_bytes``, so the directory is rescanned once per
+# (1 - LOW_WATER_MARK) * max_bytes of writes rather than on every write at the budget
+LOW_WATER_MARK = 0.9
+
+
+class MeasureCache:
+    """Directory of MeasureResult dicts keyed by :func:`~impact_engine_orchestrator.fingerprint.measure_fingerprint`.
+
+    Entries are JSON files sharded by key prefix. A hit refreshes the entry's
+    mtime, so evicting by oldest mtime once the directory grows past
+    ``max_bytes`` yields least-recently-used eviction; it continues down to
+    :data:`LOW_WATER_MARK` of the budget. Writes are atomic
+    (write to a temp file, then rename), so several worker processes can
+    share one cache directory.
+    """
+
+    def __init__(self, root: str, max_bytes: int = 1 << 30):
+        assert max_bytes > 0, f"max_bytes must be positive, got {max_bytes}"
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = None
+
+    def __getstate__(self):
+        """Drop the lock and size estimate so the cache can be sent to worker processes."""
+        return {"root": self.root, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        """Restore from :meth:`__getstate__`."""
+        self.__init__(**state)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached result for ``key``, or ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            text = path.read_text()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return serialization.loads(text)
+
+    def put(self, key: str, result: dict) -> None:
+        """Store ``result`` under ``key``, evicting old entries if over budget."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = serialization.dumps(result).encode()
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_usage()
+            else:
+                self._size += len(data) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def invalidate(self, key: str) -> bool:
+        """Remove the entry for ``key``. Returns whether an entry existed."""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            self._size = None
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for entry in self._entries():
+            Path(entry.path).unlink(missing_ok=True)
+        with self._lock:
+            self._size = 0
+
+    def _entries(self) -> list[os.DirEntry]:
+        if not self.root.exists():
+            return []
+        entries = []
+        for shard in os.scandir(self.root):
+            if shard.is_dir():
+                entries.extend(e for e in os.scandir(shard.path) if e.name.endswith(".json"))
+        return entries
+
+    def _disk_usage(self) -> int:
+        return sum(e.stat().st_size for e in self._entries())
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until usage drops to :data:`LOW_WATER_MARK` of ``max_bytes``."""
+        entries = [(e.stat().st_mtime_ns, e.stat().st_size, e.path) for e in self._entries()]
+        entries.sort()
+        size = sum(s for _, s, _ in entries)
+        target = self.max_bytes * LOW_WATER_MARK
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            Path(path).unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
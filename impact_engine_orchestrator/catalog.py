@@ -0,0 +1,148 @@
+"""Initiative catalogs stored as CSV or Parquet tables.
+
+Large portfolios are better kept out of the orchestrator YAML: with
+``initiatives_table: initiatives.parquet`` the initiatives are read from a
+table with columns ``initiative_id``, ``cost_to_scale`` and optionally
+``measure_config`` (relative paths resolve against ``base_dir``, the YAML's
+directory). Tables are read column-wise with pyarrow when it is installed,
+falling back to the standard ``csv`` module for CSV files, and validated in
+bulk before any :class:`~impact_engine_orchestrator.config.InitiativeConfig`
+is built. :func:`iter_initiatives` streams a table in chunks.
+"""
+
+import csv
+import importlib.util
+import math
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+from impact_engine_orchestrator.config import InitiativeConfig
+
+REQUIRED_COLUMNS = ("initiative_id", "cost_to_scale")
+MAX_REPORTED_ERRORS = 10
+
+
+def load_initiatives(path: str, base_dir: str | None = None) -> list[InitiativeConfig]:
+    """Read a whole initiative table."""
+    return [initiative for chunk in iter_initiatives(path, chunk_size=None, base_dir=base_dir) for initiative in chunk]
+
+
+def iter_initiatives(
+    path: str, chunk_size: int | None = 65536, base_dir: str | None = None
+) -> Iterator[list[InitiativeConfig]]:
+    """Yield an initiative table in chunks of at most ``chunk_size`` rows (``None`` for one chunk).
+
+    Raises
+    ------
+    ValueError
+        If a required column is missing, or any row has a missing or
+        duplicate ``initiative_id`` or a missing, non-numeric or negative
+        ``cost_to_scale``. Ids are checked for duplicates across chunks.
+    """
+    assert chunk_size is None or chunk_size > 0, f"chunk_size must be positive, got {chunk_size}"
+    path = str(path)
+    seen = set()
+    offset = 0
+    for columns in _read_columns(path, chunk_size):
+        yield _build(columns, offset, seen, path, base_dir)
+        offset += len(columns["initiative_id"])
+
+
+def _read_columns(path: str, chunk_size: int | None) -> Iterator[dict]:
+    """Yield ``{column: list}`` chunks of a CSV or Parquet file."""
+    suffix = Path(path).suffix.lower()
+    if suffix not in (".csv", ".parquet", ".pq"):
+        raise ValueError(f"Initiative table must be .csv or .parquet, got {path}")
+    if importlib.util.find_spec("pyarrow") is not None:
+        yield from _read_arrow(path, suffix, chunk_size)
+    elif suffix == ".csv":
+        yield from _read_csv_stdlib(path, chunk_size)
+    else:
+        raise ImportError("Parquet initiative tables require pyarrow: pip install impact-engine-orchestrator[columnar]")
+
+
+def _read_arrow(path: str, suffix: str, chunk_size: int | None) -> Iterator[dict]:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    import pyarrow.parquet as pq
+
+    # Keep ids and paths as strings whatever they look like
+    options = pv.ConvertOptions(column_types={"initiative_id": pa.string(), "measure_config": pa.string()})
+    if chunk_size is None:
+        table = pv.read_csv(path, convert_options=options) if suffix == ".csv" else pq.read_table(path)
+        batches = table.combine_chunks().to_batches()
+    elif suffix == ".csv":
+        batches = pv.open_csv(path, read_options=pv.ReadOptions(block_size=1 << 22), convert_options=options)
+    else:
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_size)
+
+    for batch in batches:
+        step = chunk_size or batch.num_rows
+        for start in range(0, batch.num_rows, step):
+            yield batch.slice(start, step).to_pydict()
+
+
+def _read_csv_stdlib(path: str, chunk_size: int | None) -> Iterator[dict]:
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = []
+        for row in reader:
+            rows.append(row)
+            if chunk_size is not None and len(rows) == chunk_size:
+                yield _transpose(header, rows)
+                rows = []
+        if rows or chunk_size is None:
+            yield _transpose(header, rows)
+
+
+def _transpose(header: list, rows: list) -> dict:
+    columns = {
+        name: [row[k] if k < len(row) and row[k] != "" else None for row in rows] for k, name in enumerate(header)
+    }
+    if "cost_to_scale" in columns:
+        columns["cost_to_scale"] = [_number(value) for value in columns["cost_to_scale"]]
+    return columns
+
+
+def _number(value):
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return value
+
+
+def _build(columns: dict, offset: int, seen: set, path: str, base_dir: str | None) -> list[InitiativeConfig]:
+    """Validate one chunk of columns as a whole, then build its configs."""
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"Initiative table {path} is missing columns {missing}")
+    ids = columns["initiative_id"]
+    costs = columns["cost_to_scale"]
+    measure_configs = columns.get("measure_config") or [None] * len(ids)
+
+    errors = []
+    for row, (iid, cost) in enumerate(zip(ids, costs), start=offset):
+        if iid is None or iid == "":
+            errors.append(f"row {row}: missing initiative_id")
+        elif iid in seen:
+            errors.append(f"row {row}: duplicate initiative_id {iid!r}")
+        else:
+            seen.add(iid)
+        if not isinstance(cost, (int, float)) or isinstance(cost, bool) or math.isnan(cost) or cost < 0:
+            errors.append(f"row {row}: cost_to_scale must be a non-negative number, got {cost!r}")
+        if len(errors) >= MAX_REPORTED_ERRORS:
+            break
+    if errors:
+        raise ValueError(f"Invalid initiative table {path}:\n  " + "\n  ".join(errors))
+
+    prefix = str(base_dir) + os.sep if base_dir else ""
+    return [
+        InitiativeConfig(
+            initiative_id=str(iid),
+            cost_to_scale=cost,
+            measure_config=(m if os.path.isabs(m) else prefix + m) if m else "",
+        )
+        for iid, cost, m in zip(ids, costs, measure_configs)
+    ]
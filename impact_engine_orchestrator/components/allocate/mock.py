@@ -26,11 +26,12 @@ class MockAllocate(PipelineComponent):
                 selected.append(init["initiative_id"])
                 remaining -= init["cost"]
 
+        selected_set = set(selected)
         result = AllocateResult(
             selected_initiatives=selected,
             predicted_returns={
-                i["initiative_id"]: i["return_median"] for i in initiatives if i["initiative_id"] in selected
+                i["initiative_id"]: i["return_median"] for i in initiatives if i["initiative_id"] in selected_set
             },
-            budget_allocated={i["initiative_id"]: i["cost"] for i in initiatives if i["initiative_id"] in selected},
+            budget_allocated={i["initiative_id"]: i["cost"] for i in initiatives if i["initiative_id"] in selected_set},
         )
         return asdict(result)
@@ -9,3 +9,31 @@ class PipelineComponent(ABC):
     @abstractmethod
     def execute(self, event: dict) -> dict:
         """Process single initiative, return result."""
+
+    def execute_batch(self, events: list[dict]) -> list[dict]:
+        """Process several initiatives, returning results in input order.
+
+        The default calls :meth:`execute` per event. Components that can
+        process a batch more cheaply override it, and the orchestrator then
+        submits a few large batches instead of one task per initiative.
+        """
+        return [self.execute(event) for event in events]
+
+    def flush(self) -> None:
+        """Wait for background work started by :meth:`execute`, raising its first failure.
+
+        Called by the orchestrator at the end of every successful run. The
+        default does nothing.
+        """
+
+
+class AsyncPipelineComponent(ABC):
+    """Single-initiative processor with a coroutine handler, for I/O-bound work.
+
+    Run by :class:`~impact_engine_orchestrator.async_orchestrator.AsyncOrchestrator`
+    on its event loop, so waiting on I/O does not hold a thread.
+    """
+
+    @abstractmethod
+    async def execute(self, event: dict) -> dict:
+        """Process single initiative, return result."""
@@ -1,13 +1,22 @@
 """MEASURE adapter wrapping impact_engine.evaluate_impact."""
 
 import json
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 
 from impact_engine import evaluate_impact
 
+from impact_engine_orchestrator import data_cache
+from impact_engine_orchestrator.cache import MeasureCache
 from impact_engine_orchestrator.components.base import PipelineComponent
 from impact_engine_orchestrator.contracts.measure import MeasureResult
 from impact_engine_orchestrator.contracts.types import ModelType
+from impact_engine_orchestrator.fingerprint import measure_fingerprint
 
 
 def _resolve_param_key(treatment_var: str, params: dict) -> str:
@@ -98,26 +107,173 @@ def _extract_estimates(result: dict) -> dict:
     raise ValueError(f"Unknown model_type: {model_type!r}")
 
 
+def _default_scratch_root() -> str:
+    """Prefer a RAM-backed filesystem for in-memory handoff when one is available."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
 class Measure(PipelineComponent):
-    """Adapter that delegates to impact_engine.evaluate_impact."""
+    """Adapter that delegates to impact_engine.evaluate_impact.
 
-    def __init__(self, storage_url: str):
+    Parameters
+    ----------
+    storage_url : str
+        Where evaluate_impact writes its artifacts.
+    cache_url : str, optional
+        Directory of a persistent :class:`~impact_engine_orchestrator.cache.MeasureCache`.
+        When set, runs whose measure config contents, referenced data files
+        and sample size are unchanged return the stored result instead of
+        calling evaluate_impact.
+    cache_max_bytes : int
+        Size bound of the cache directory; least-recently-used entries are
+        evicted beyond it.
+    in_memory : bool
+        Hand the result envelope over without a round-trip through
+        ``storage_url``. impact_engine only reports results via a file, so
+        evaluate_impact writes to a private node-local scratch directory
+        (``/dev/shm`` when available) that is read back and discarded.
+    persist : bool
+        With ``in_memory``, copy the scratch artifacts to ``storage_url`` in a
+        background thread; the orchestrator waits for them at the end of the
+        run (see :meth:`flush`). Without it, artifacts are not kept.
+    scratch_url : str, optional
+        Override the scratch root used by ``in_memory``.
+    data_cache_bytes : int, optional
+        Install the :mod:`~impact_engine_orchestrator.data_cache` for
+        impact_engine's reads with this bound, so source data shared by
+        several initiatives is parsed once per process. The install lasts
+        until :meth:`close`, or until the adapter is garbage collected.
+    """
+
+    def __init__(
+        self,
+        storage_url: str,
+        cache_url: str | None = None,
+        cache_max_bytes: int = 1 << 30,
+        in_memory: bool = False,
+        persist: bool = True,
+        scratch_url: str | None = None,
+        data_cache_bytes: int | None = None,
+    ):
         self._storage_url = storage_url
+        self._cache = MeasureCache(cache_url, max_bytes=cache_max_bytes) if cache_url else None
+        self._in_memory = in_memory
+        self._persist = persist
+        self._scratch_url = scratch_url
+        self._persist_pool = None
+        self._persist_futures = []
+        self._persist_error = None
+        self._persist_lock = threading.Lock()
+        self._data_cache_bytes = data_cache_bytes
+        self._data_cache_release = None
+        if data_cache_bytes is not None:
+            self._install_data_cache()
+
+    def __getstate__(self):
+        """Drop the background persistence state so the adapter can be sent to worker processes."""
+        state = self.__dict__.copy()
+        state.update(
+            _persist_pool=None, _persist_futures=[], _persist_error=None, _persist_lock=None, _data_cache_release=None
+        )
+        return state
+
+    def __setstate__(self, state):
+        """Restore from :meth:`__getstate__`."""
+        self.__dict__.update(state)
+        self._persist_lock = threading.Lock()
+        if self._data_cache_bytes is not None:
+            self._install_data_cache()
+
+    def _install_data_cache(self) -> None:
+        """Install the data cache for this adapter's lifetime; :meth:`close` or garbage collection undoes it."""
+        data_cache.install(self._data_cache_bytes)
+        self._data_cache_release = weakref.finalize(self, data_cache.uninstall)
+
+    def close(self) -> None:
+        """Wait for background persistence (see :meth:`flush`) and undo this adapter's data cache install."""
+        try:
+            self.flush()
+        finally:
+            if self._data_cache_release is not None:
+                self._data_cache_release()
+
+    def flush(self) -> None:
+        """Wait for background persistence to finish, re-raising the first failure since the last flush."""
+        with self._persist_lock:
+            futures, self._persist_futures = self._persist_futures, []
+        for future in futures:
+            self._settle(future)
+        with self._persist_lock:
+            error, self._persist_error = self._persist_error, None
+        if error is not None:
+            raise error
+
+    def _settle(self, future) -> None:
+        """Keep the first failure of a finished persistence future (lock not held)."""
+        exc = future.exception()
+        if exc is not None:
+            with self._persist_lock:
+                self._persist_error = self._persist_error or exc
+
+    def _evaluate(self, initiative_id: str, config_path: str) -> dict:
+        """Run evaluate_impact and return its result envelope."""
+        if self._data_cache_bytes is not None:
+            # impact_engine may import reader modules lazily
+            data_cache.refresh()
+        if not self._in_memory:
+            result_path = evaluate_impact(
+                config_path=config_path,
+                storage_url=self._storage_url,
+                job_id=initiative_id,
+            )
+            with open(result_path) as f:
+                return json.load(f)
+
+        scratch = tempfile.mkdtemp(prefix="measure-", dir=self._scratch_url or _default_scratch_root())
+        try:
+            result_path = evaluate_impact(config_path=config_path, storage_url=scratch, job_id=initiative_id)
+            with open(result_path) as f:
+                result = json.load(f)
+        except BaseException:
+            shutil.rmtree(scratch, ignore_errors=True)
+            raise
+
+        if self._persist:
+            with self._persist_lock:
+                if self._persist_pool is None:
+                    self._persist_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="measure-persist")
+                # Keep only pending copies; of finished ones, only the first failure is kept
+                for future in self._persist_futures:
+                    if future.done() and future.exception() is not None and self._persist_error is None:
+                        self._persist_error = future.exception()
+                self._persist_futures = [f for f in self._persist_futures if not f.done()]
+                self._persist_futures.append(self._persist_pool.submit(self._move_to_storage, scratch))
+        else:
+            shutil.rmtree(scratch, ignore_errors=True)
+        return result
+
+    def _move_to_storage(self, scratch: str) -> None:
+        """Copy a scratch directory's artifacts into ``storage_url`` and remove it."""
+        try:
+            shutil.copytree(scratch, self._storage_url, dirs_exist_ok=True)
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
 
     def execute(self, event: dict) -> dict:
         """Run evaluate_impact for one initiative and return a MeasureResult dict."""
         initiative_id = event["initiative_id"]
         config_path = event["measure_config"]
 
-        result_path = evaluate_impact(
-            config_path=config_path,
-            storage_url=self._storage_url,
-            job_id=initiative_id,
-        )
-
-        with open(result_path) as f:
-            result = json.load(f)
+        cache_key = None
+        if self._cache is not None:
+            cache_key = measure_fingerprint(config_path, event.get("sample_size"), {"storage_url": self._storage_url})
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return {**cached, "initiative_id": initiative_id}
 
+        result = self._evaluate(initiative_id, config_path)
         extracted = _extract_estimates(result)
 
         measure_result = MeasureResult(
@@ -130,4 +286,7 @@ class Measure(PipelineComponent):
             model_type=ModelType(result["model_type"]),
             diagnostics=result["data"]["model_summary"],
         )
-        return asdict(measure_result)
+        output = asdict(measure_result)
+        if cache_key is not None:
+            self._cache.put(cache_key, output)
+        return output
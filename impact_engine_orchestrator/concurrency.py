@@ -0,0 +1,113 @@
+"""Adaptive per-stage concurrency limits (``adaptive_concurrency: true``).
+
+Each fan-out stage keeps at most ``limit`` tasks in flight, and an
+:class:`AIMDController` retunes that limit from what the stage's tasks
+experience: after every round of ``limit`` completions it compares the
+round's throughput with the previous round's, its mean latency (submission
+to completion, so time spent queued counts) with the lowest latency seen,
+and CPU utilization with a target. While throughput holds up and tasks are
+not queueing, the limit grows by one (additive increase); when the CPU is
+saturated, or latency grows without a throughput gain (thrashing), it is cut
+by a constant factor (multiplicative decrease).
+"""
+
+import os
+import time
+
+
+class CpuMonitor:
+    """Sample CPU utilization (0 to 1) between successive calls.
+
+    Uses system-wide utilization from psutil when it is installed, which
+    covers process workers; otherwise this process's CPU time, which covers
+    the thread and inline backends.
+    """
+
+    def __init__(self):
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+        self._psutil = psutil
+        self._cpus = os.cpu_count() or 1
+        self.sample()
+
+    def sample(self) -> float:
+        """Return utilization since the previous sample."""
+        if self._psutil is not None:
+            return self._psutil.cpu_percent(interval=None) / 100
+        wall, cpu = time.monotonic(), time.process_time()
+        previous = getattr(self, "_previous", None)
+        self._previous = (wall, cpu)
+        if previous is None or wall <= previous[0]:
+            return 0.0
+        return min(1.0, (cpu - previous[1]) / ((wall - previous[0]) * self._cpus))
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease limit on a stage's in-flight tasks.
+
+    Parameters
+    ----------
+    initial : int
+        Starting limit.
+    maximum : int
+        Upper bound (the stage's worker ceiling).
+    minimum : int
+        Lower bound.
+    increase : int
+        Added to the limit after a healthy round.
+    decrease : float
+        Factor applied to the limit after an overloaded round.
+    cpu_target : float
+        CPU utilization above which the stage is considered overloaded.
+    latency_tolerance : float
+        Mean latency, as a multiple of the lowest observed, above which tasks
+        are considered to be queueing.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        maximum: int,
+        minimum: int = 1,
+        increase: int = 1,
+        decrease: float = 0.75,
+        cpu_target: float = 0.9,
+        latency_tolerance: float = 2.0,
+    ):
+        assert 1 <= minimum <= maximum, f"need 1 <= minimum <= maximum, got {minimum}, {maximum}"
+        assert 0 < decrease < 1, f"decrease must be in (0, 1), got {decrease}"
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.cpu_target = cpu_target
+        self.latency_tolerance = latency_tolerance
+        self.limit = min(max(initial, minimum), maximum)
+        self.history = [self.limit]
+        self._cpu = CpuMonitor()
+        self._latencies = []
+        self._min_latency = float("inf")
+        self._throughput = 0.0
+        self._round_start = time.monotonic()
+
+    def observe(self, latency: float) -> None:
+        """Record one completed task's latency, retuning the limit at the end of a round."""
+        self._latencies.append(latency)
+        self._min_latency = min(self._min_latency, latency)
+        if len(self._latencies) < self.limit:
+            return
+        now = time.monotonic()
+        throughput = len(self._latencies) / max(now - self._round_start, 1e-9)
+        mean_latency = sum(self._latencies) / len(self._latencies)
+        queueing = mean_latency > self.latency_tolerance * self._min_latency
+        overloaded = self._cpu.sample() > self.cpu_target
+        if overloaded or (queueing and throughput <= self._throughput * 1.05) or throughput < self._throughput * 0.9:
+            self.limit = max(self.minimum, int(self.limit * self.decrease))
+        else:
+            self.limit = min(self.maximum, self.limit + self.increase)
+        self.history.append(self.limit)
+        self._throughput = throughput
+        self._latencies = []
+        self._round_start = now
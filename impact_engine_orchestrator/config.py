@@ -5,6 +5,11 @@ from pathlib import Path
 
 import yaml
 
+EXECUTOR_BACKENDS = ("thread", "process", "inline", "queue")
+RESULT_FORMATS = ("records", "columnar")
+FAILURE_MODES = ("raise", "skip")
+TIMED_STAGES = ("measure", "evaluate", "scale")
+
 
 @dataclass
 class InitiativeConfig:
@@ -31,6 +36,20 @@ class PipelineConfig:
     scale_sample_size: int
     initiatives: list[InitiativeConfig]
     max_workers: int = 4
+    streaming: bool = False
+    executor: str = "thread"
+    instrument: bool = False
+    journal_dir: str | None = None
+    max_concurrency: int = 64
+    result_format: str = "records"
+    deduplicate: bool = False
+    stage_timeouts: dict[str, float] = field(default_factory=dict)
+    on_failure: str = "raise"
+    run_store: str | None = None
+    stage_workers: dict[str, int] = field(default_factory=dict)
+    adaptive_concurrency: bool = False
+    queue_url: str | None = None
+    runtime_history: str | None = None
     measure_stage: StageConfig | None = None
     evaluate_stage: StageConfig | None = None
     allocate_stage: StageConfig | None = None
@@ -41,6 +60,25 @@ class PipelineConfig:
         assert self.scale_sample_size > 0, f"scale_sample_size must be positive, got {self.scale_sample_size}"
         assert len(self.initiatives) > 0, "initiatives must not be empty"
         assert self.max_workers > 0, f"max_workers must be positive, got {self.max_workers}"
+        assert self.max_concurrency > 0, f"max_concurrency must be positive, got {self.max_concurrency}"
+        assert self.executor in EXECUTOR_BACKENDS, f"executor must be one of {EXECUTOR_BACKENDS}, got {self.executor!r}"
+        assert self.result_format in RESULT_FORMATS, (
+            f"result_format must be one of {RESULT_FORMATS}, got {self.result_format!r}"
+        )
+        assert set(self.stage_timeouts) <= set(TIMED_STAGES), (
+            f"stage_timeouts keys must be among {TIMED_STAGES}, got {sorted(self.stage_timeouts)}"
+        )
+        assert all(t > 0 for t in self.stage_timeouts.values()), (
+            f"stage_timeouts must be positive, got {self.stage_timeouts}"
+        )
+        assert set(self.stage_workers) <= set(TIMED_STAGES), (
+            f"stage_workers keys must be among {TIMED_STAGES}, got {sorted(self.stage_workers)}"
+        )
+        assert all(n > 0 for n in self.stage_workers.values()), (
+            f"stage_workers must be positive, got {self.stage_workers}"
+        )
+        assert self.executor != "queue" or self.queue_url, "executor 'queue' requires queue_url"
+        assert self.on_failure in FAILURE_MODES, f"on_failure must be one of {FAILURE_MODES}, got {self.on_failure!r}"
 
 
 def _load_stage_config(config_path: str) -> StageConfig:
@@ -54,6 +92,15 @@ def _load_stage_config(config_path: str) -> StageConfig:
     return StageConfig(component=component, kwargs=raw)
 
 
+def _queue_path(config_dir: Path, url: str) -> str:
+    """Resolve a ``queue_url`` (plain path or ``sqlite:///path``) relative to the YAML's directory."""
+    if url.startswith("sqlite:///"):
+        url = url[len("sqlite:///") :]
+    elif "://" in url:
+        return url
+    return str(config_dir / url)
+
+
 def load_config(path: str) -> PipelineConfig:
     """Load a PipelineConfig from a YAML file."""
     config_dir = Path(path).parent
@@ -73,18 +120,37 @@ def load_config(path: str) -> PipelineConfig:
     if "allocate" in raw and "config" in raw["allocate"]:
         allocate_stage = _load_stage_config(config_dir / raw["allocate"]["config"])
 
-    # Resolve initiative measure_config paths relative to orchestrator YAML
+    # Resolve initiative measure_config paths relative to orchestrator YAML; large
+    # portfolios can list them in an initiatives_table (CSV/Parquet) instead
     initiatives = []
-    for i in raw["initiatives"]:
+    for i in raw.get("initiatives") or []:
         ic = InitiativeConfig(**i)
         if ic.measure_config:
             ic.measure_config = str(config_dir / ic.measure_config)
         initiatives.append(ic)
+    if raw.get("initiatives_table"):
+        from impact_engine_orchestrator.catalog import load_initiatives
+
+        initiatives.extend(load_initiatives(config_dir / raw["initiatives_table"], base_dir=str(config_dir)))
 
     return PipelineConfig(
         budget=raw["budget"],
         scale_sample_size=raw.get("scale_sample_size", 5000),
         max_workers=raw.get("max_workers", 4),
+        streaming=raw.get("streaming", False),
+        executor=raw.get("executor", "thread"),
+        instrument=raw.get("instrument", False),
+        journal_dir=str(config_dir / raw["journal_dir"]) if raw.get("journal_dir") else None,
+        max_concurrency=raw.get("max_concurrency", 64),
+        result_format=raw.get("result_format", "records"),
+        deduplicate=raw.get("deduplicate", False),
+        stage_timeouts=raw.get("stage_timeouts", {}),
+        on_failure=raw.get("on_failure", "raise"),
+        run_store=str(config_dir / raw["run_store"]) if raw.get("run_store") else None,
+        stage_workers=raw.get("stage_workers", {}),
+        adaptive_concurrency=raw.get("adaptive_concurrency", False),
+        queue_url=_queue_path(config_dir, raw["queue_url"]) if raw.get("queue_url") else None,
+        runtime_history=str(config_dir / raw["runtime_history"]) if raw.get("runtime_history") else None,
         initiatives=initiatives,
         measure_stage=measure_stage,
         evaluate_stage=evaluate_stage,
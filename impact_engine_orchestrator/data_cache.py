@@ -0,0 +1,230 @@
+"""Process-wide cache of source data files loaded through pandas.
+
+impact_engine reads each initiative's source data (e.g. the products
+catalog at ``DATA.SOURCE.CONFIG.path``) itself, with no hook for sharing
+loads. :func:`install` routes the ``pandas.read_csv`` and
+``pandas.read_parquet`` calls of impact_engine's modules through a
+memory-bounded LRU, so that repeated reads of an unchanged file within a
+process are not parsed again. Every call returns a fresh copy, so callers
+can modify the frame freely.
+
+Only modules of the ``impact_engine`` package are patched: their
+``pandas`` module (``import pandas as pd``) is replaced by a stand-in whose
+readers are cached, and readers they imported by name are replaced
+directly. pandas itself and every other caller are left alone. Installs
+are counted, and the readers are restored when the last one is undone.
+
+Entries are keyed on the absolute path, size and mtime of the file plus the
+reader's keyword arguments; reads from buffers or URLs, chunked reads and
+reads with positional arguments bypass the cache.
+
+A plain ``read_csv(path)`` (no reader arguments) of a CSV generated by
+:mod:`impact_engine_orchestrator.setup_data` reads its Parquet copy (same
+stem, ``.parquet``) instead, which is much faster to parse. Only copies that
+setup_data marked with a hash of the CSV they were made from are used, and
+only while that hash still matches, so other CSV files are always read as
+CSV.
+"""
+
+import os
+import sys
+import threading
+import types
+from collections import OrderedDict
+
+import pandas as pd
+
+from impact_engine_orchestrator.fingerprint import CSV, SIMULATOR, file_hash, read_sidecar, write_sidecar
+
+_READERS = ("read_csv", "read_parquet")
+
+_lock = threading.Lock()
+_entries = OrderedDict()
+# Cached readers by name while installed, and the stand-in for pandas in impact_engine modules
+_readers = {}
+_proxy = {}
+# (module, attribute, original, replacement) for every impact_engine module attribute patched
+_patched = []
+_state = {"max_bytes": 0, "bytes": 0, "hits": 0, "misses": 0, "installs": 0, "modules": 0}
+
+
+class _CachedPandas(types.ModuleType):
+    """pandas as seen by impact_engine modules: every attribute of pandas, with cached readers."""
+
+    def __getattr__(self, name):
+        return getattr(pd, name)
+
+
+# CSV hashes by (path, size, mtime), so each version of a file is hashed once
+_csv_hashes = {}
+
+
+def mark_columnar_copy(csv_path) -> None:
+    """Record that the ``.parquet`` copy beside ``csv_path`` holds the same data (see setup_data)."""
+    stem, _ = os.path.splitext(os.fspath(csv_path))
+    write_sidecar(stem + ".parquet", CSV, file_hash(csv_path))
+
+
+def install(max_bytes: int = 1 << 30) -> None:
+    """Serve impact_engine's pandas file reads from the cache, holding at most ``max_bytes`` of frames.
+
+    Installing again only updates the bound and patches impact_engine
+    modules imported since; each install needs a matching :func:`uninstall`.
+    """
+    assert max_bytes > 0, f"max_bytes must be positive, got {max_bytes}"
+    with _lock:
+        _state["max_bytes"] = max_bytes
+        _evict()
+        _state["installs"] += 1
+        if not _readers:
+            proxy = _CachedPandas(pd.__name__, pd.__doc__)
+            for name in _READERS:
+                _readers[name] = _cached_reader(name, getattr(pd, name))
+                setattr(proxy, name, _readers[name])
+            _proxy["pandas"] = proxy
+        _patch()
+
+
+def refresh() -> None:
+    """Route the reads of impact_engine modules imported since :func:`install` through the cache."""
+    with _lock:
+        if _readers:
+            _patch()
+
+
+def uninstall() -> None:
+    """Undo one :func:`install`; undoing the last restores the readers and drops all entries."""
+    with _lock:
+        if _state["installs"] == 0:
+            return
+        _state["installs"] -= 1
+        if _state["installs"]:
+            return
+        for module, attribute, original, replacement in _patched:
+            if getattr(module, attribute, None) is replacement:
+                setattr(module, attribute, original)
+        _patched.clear()
+        _readers.clear()
+        _proxy.clear()
+        _state["modules"] = 0
+        _clear()
+
+
+def installed() -> bool:
+    """Return whether the cache is installed in this process."""
+    return bool(_readers)
+
+
+def _patch() -> None:
+    """Replace pandas and its readers in impact_engine modules not patched yet (lock held)."""
+    if len(sys.modules) == _state["modules"]:
+        return
+    _state["modules"] = len(sys.modules)
+    replacements = {id(pd): _proxy["pandas"]}
+    for name, reader in _readers.items():
+        replacements[id(reader.__wrapped__)] = reader
+    for module_name, module in list(sys.modules.items()):
+        if module_name.split(".")[0] != "impact_engine" or module is None:
+            continue
+        for attribute, value in list(vars(module).items()):
+            replacement = replacements.get(id(value))
+            if replacement is not None:
+                setattr(module, attribute, replacement)
+                _patched.append((module, attribute, value, replacement))
+
+
+def clear() -> None:
+    """Drop all cached frames."""
+    with _lock:
+        _clear()
+
+
+def stats() -> dict:
+    """Return ``entries``, ``bytes``, ``max_bytes``, ``hits`` and ``misses``."""
+    with _lock:
+        return {"entries": len(_entries), **{key: _state[key] for key in ("bytes", "max_bytes", "hits", "misses")}}
+
+
+def _clear() -> None:
+    _entries.clear()
+    _state.update(bytes=0, hits=0, misses=0)
+
+
+def _evict() -> None:
+    """Drop least-recently-used frames until within ``max_bytes`` (lock held)."""
+    while _state["bytes"] > _state["max_bytes"] and _entries:
+        _, (_, size) = _entries.popitem(last=False)
+        _state["bytes"] -= size
+
+
+def _key(name: str, path, args: tuple, kwargs: dict):
+    """Return the cache key for a read, or ``None`` if it cannot be cached."""
+    if args or not isinstance(path, (str, os.PathLike)) or kwargs.get("chunksize") or kwargs.get("iterator"):
+        return None
+    path = os.fspath(path)
+    if "://" in path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (name, os.path.abspath(path), stat.st_size, stat.st_mtime_ns, repr(sorted(kwargs.items())))
+
+
+def _columnar_copy(path):
+    """Return the Parquet copy setup_data made of a CSV file, if it still matches the CSV."""
+    if not isinstance(path, (str, os.PathLike)):
+        return None
+    path = os.fspath(path)
+    stem, ext = os.path.splitext(path)
+    if ext.lower() != ".csv" or "://" in path:
+        return None
+    copy = stem + ".parquet"
+    try:
+        if read_sidecar(path, SIMULATOR) is None or not os.path.exists(copy):
+            return None
+        recorded = read_sidecar(copy, CSV)
+        if recorded is None:
+            return None
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with _lock:
+            digest = _csv_hashes.get(key)
+        if digest is None:
+            digest = file_hash(path)
+            with _lock:
+                _csv_hashes[key] = digest
+    except OSError:
+        return None
+    return copy if digest == recorded else None
+
+
+def _cached_reader(name: str, original):
+    def read(path, *args, **kwargs):
+        if name == "read_csv" and not args and not kwargs:
+            copy = _columnar_copy(path)
+            if copy is not None:
+                return _readers.get("read_parquet", pd.read_parquet)(copy)
+        key = _key(name, path, args, kwargs)
+        if key is None:
+            return original(path, *args, **kwargs)
+        with _lock:
+            entry = _entries.get(key)
+            if entry is not None:
+                _entries.move_to_end(key)
+                _state["hits"] += 1
+                return entry[0].copy()
+            _state["misses"] += 1
+
+        frame = original(path, **kwargs)
+        size = int(frame.memory_usage(deep=True).sum())
+        with _lock:
+            if size <= _state["max_bytes"] and key not in _entries:
+                _entries[key] = (frame, size)
+                _state["bytes"] += size
+                _evict()
+        return frame.copy()
+
+    read.__wrapped__ = original
+    read.__doc__ = original.__doc__
+    return read
@@ -0,0 +1,450 @@
+"""Work-queue backend distributing fan-out tasks to worker processes on any machine.
+
+With ``executor: queue`` and ``queue_url: <path>`` in the orchestrator YAML,
+fan-out tasks are written to a SQLite task queue instead of a local pool,
+and any number of workers started with ``impact-engine-worker --queue
+<path>`` (on this machine, or on others sharing the file over a filesystem
+with working locks) claim and execute them. Like the ``process`` backend,
+workers build the stage components once from the orchestrator's stage
+specs, so only the stage name and event travel per task.
+
+Each claimed task carries a lease that the worker's heartbeat thread keeps
+extending. When a worker dies, its leases lapse and the task is queued
+again for another worker, up to ``max_attempts`` claims in all. Results are
+accepted only from the worker currently holding the lease.
+
+Tasks and results are pickled, so a queue must only be shared with trusted
+parties, as with ``ProcessPoolExecutor``.
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+import traceback
+from concurrent.futures import Executor, Future
+
+from impact_engine_orchestrator import executors
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS specs (key TEXT PRIMARY KEY, payload BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    spec_key TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result BLOB
+);
+CREATE INDEX IF NOT EXISTS ix_tasks_status ON tasks (status, id);
+CREATE TABLE IF NOT EXISTS workers (worker_id TEXT PRIMARY KEY, heartbeat REAL NOT NULL);
+"""
+FINISHED = ("done", "failed")
+# Consecutive failed polls (e.g. "database is locked") tolerated before pending futures are failed
+MAX_POLL_ERRORS = 20
+
+
+def _path(url: str) -> str:
+    """Accept a plain path or a ``sqlite:///path`` URL."""
+    return url[len("sqlite:///") :] if url.startswith("sqlite:///") else url
+
+
+class TaskQueue:
+    """SQLite-backed task queue shared by one or more submitters and workers.
+
+    Parameters
+    ----------
+    url : str
+        Database path (or ``sqlite:///path``), created if missing.
+    """
+
+    def __init__(self, url: str):
+        self.path = _path(url)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._conn.close()
+
+    def _transaction(self, sql_params: list) -> list:
+        """Run statements in one immediate (write-locked) transaction and return their rows."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = [self._conn.execute(sql, params).fetchall() for sql, params in sql_params]
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return rows
+
+    def publish_specs(self, specs: dict) -> str:
+        """Store the stage specs workers build components from and return their key."""
+        payload = pickle.dumps(specs)
+        key = hashlib.sha256(payload).hexdigest()
+        self._transaction([("INSERT OR IGNORE INTO specs (key, payload) VALUES (?, ?)", (key, payload))])
+        return key
+
+    def specs(self, key: str) -> dict:
+        """Return the stage specs stored under ``key``."""
+        with self._lock:
+            (payload,) = self._conn.execute("SELECT payload FROM specs WHERE key = ?", (key,)).fetchone()
+        return pickle.loads(payload)
+
+    def put_many(self, spec_key: str, calls: list) -> list[int]:
+        """Queue ``(fn, args, kwargs)`` calls and return their task ids."""
+        statements = [
+            ("INSERT INTO tasks (spec_key, payload) VALUES (?, ?) RETURNING id", (spec_key, pickle.dumps(call)))
+            for call in calls
+        ]
+        return [rows[0][0] for rows in self._transaction(statements)]
+
+    def claim(self, worker_id: str, lease: float):
+        """Claim the oldest queued task for ``worker_id``; return ``(id, spec_key, pickled call)`` or ``None``.
+
+        The call is returned pickled so that a worker unable to load it can
+        still fail the task it claimed.
+        """
+        (rows,) = self._transaction(
+            [
+                (
+                    "UPDATE tasks SET status = 'running', worker = ?, lease_expires = ?, attempts = attempts + 1 "
+                    "WHERE id = (SELECT id FROM tasks WHERE status = 'queued' ORDER BY id LIMIT 1) "
+                    "RETURNING id, spec_key, payload",
+                    (worker_id, time.time() + lease),
+                )
+            ]
+        )
+        if not rows:
+            return None
+        return rows[0]
+
+    def finish(self, task_id: int, worker_id: str, status: str, value) -> bool:
+        """Record a task's result (``done``) or exception and traceback (``failed``) if ``worker_id`` holds it."""
+        (rows,) = self._transaction(
+            [
+                (
+                    "UPDATE tasks SET status = ?, result = ?, lease_expires = NULL "
+                    "WHERE id = ? AND worker = ? AND status = 'running' RETURNING id",
+                    (status, _dumps(value), task_id, worker_id),
+                )
+            ]
+        )
+        return bool(rows)
+
+    def heartbeat(self, worker_id: str, lease: float) -> None:
+        """Mark ``worker_id`` alive and extend the leases of its running tasks."""
+        now = time.time()
+        self._transaction(
+            [
+                ("INSERT OR REPLACE INTO workers (worker_id, heartbeat) VALUES (?, ?)", (worker_id, now)),
+                (
+                    "UPDATE tasks SET lease_expires = ? WHERE worker = ? AND status = 'running'",
+                    (now + lease, worker_id),
+                ),
+            ]
+        )
+
+    def requeue_expired(self, max_attempts: int) -> int:
+        """Queue again running tasks whose lease lapsed; fail those out of attempts. Return how many."""
+        now = time.time()
+        lost = RuntimeError(f"task lost by its worker after {max_attempts} attempts")
+        requeued, failed = self._transaction(
+            [
+                (
+                    "UPDATE tasks SET status = 'queued', worker = NULL, lease_expires = NULL "
+                    "WHERE status = 'running' AND lease_expires < ? AND attempts < ? RETURNING id",
+                    (now, max_attempts),
+                ),
+                (
+                    "UPDATE tasks SET status = 'failed', result = ?, lease_expires = NULL "
+                    "WHERE status = 'running' AND lease_expires < ? RETURNING id",
+                    (_dumps((lost, None)), now),
+                ),
+            ]
+        )
+        return len(requeued) + len(failed)
+
+    def results(self, task_ids: list[int]) -> list:
+        """Return ``(id, status, value)`` for the finished tasks among ``task_ids``."""
+        finished = []
+        with self._lock:
+            for start in range(0, len(task_ids), 500):
+                chunk = task_ids[start : start + 500]
+                finished += self._conn.execute(
+                    f"SELECT id, status, result FROM tasks WHERE status IN {FINISHED} "
+                    f"AND id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+        return [(task_id, *_load_result(task_id, status, result)) for task_id, status, result in finished]
+
+    def cancel(self, task_ids: list[int]) -> None:
+        """Drop queued tasks among ``task_ids``; running ones finish and are ignored."""
+        self._transaction(
+            [("DELETE FROM tasks WHERE id = ? AND status = 'queued'", (task_id,)) for task_id in task_ids]
+        )
+
+    def purge(self, task_ids: list[int]) -> None:
+        """Delete tasks whose results have been collected."""
+        self._transaction([("DELETE FROM tasks WHERE id = ?", (task_id,)) for task_id in task_ids])
+
+    def workers(self, within: float) -> list[str]:
+        """Return the workers that sent a heartbeat in the last ``within`` seconds."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT worker_id FROM workers WHERE heartbeat >= ? ORDER BY worker_id", (time.time() - within,)
+            ).fetchall()
+        return [worker_id for (worker_id,) in rows]
+
+
+def _load_result(task_id: int, status: str, payload: bytes) -> tuple:
+    """Unpickle a finished task's value; a payload that cannot be loaded fails the task."""
+    try:
+        return status, pickle.loads(payload)
+    except Exception as exc:
+        error = RuntimeError(f"could not load the result of task {task_id}: {type(exc).__name__}: {exc}")
+        error.__cause__ = exc
+        return "failed", (error, None)
+
+
+class _RemoteTraceback(Exception):
+    """Traceback text of an exception raised in a queue worker."""
+
+    def __str__(self):
+        return self.args[0]
+
+
+def _dumps(value) -> bytes:
+    """Pickle a result or ``(exception, traceback text)``, replacing an unpicklable exception."""
+    try:
+        return pickle.dumps(value)
+    except Exception:
+        if not (isinstance(value, tuple) and isinstance(value[0], BaseException)):
+            raise
+        exc, remote_traceback = value
+        return pickle.dumps((RuntimeError(f"{type(exc).__name__}: {exc}"), remote_traceback))
+
+
+class QueueExecutor(Executor):
+    """Executor whose calls are run by queue workers (see :func:`run_worker`).
+
+    Submitted calls must be picklable and importable by the workers. A
+    background thread collects finished tasks into their futures and
+    re-queues tasks whose worker stopped sending heartbeats.
+
+    Parameters
+    ----------
+    url : str
+        Task queue path.
+    specs : dict
+        Stage name to :class:`~impact_engine_orchestrator.config.StageConfig`
+        or component instance, built by each worker once.
+    poll_interval : float
+        Seconds between checks for finished tasks.
+    max_attempts : int
+        Claims per task before it fails as lost.
+    """
+
+    def __init__(self, url: str, specs: dict, poll_interval: float = 0.05, max_attempts: int = 3):
+        self._queue = TaskQueue(url)
+        self._spec_key = self._queue.publish_specs(specs)
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._poller = threading.Thread(target=self._poll, name="QueueExecutor", daemon=True)
+        self._poller.start()
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Queue ``fn(*args, **kwargs)`` for a worker."""
+        return self.submit_many([(fn, args, kwargs)])[0]
+
+    def submit_many(self, calls: list) -> list[Future]:
+        """Queue ``(fn, args, kwargs)`` calls in one transaction and return their futures."""
+        if self._stop.is_set():
+            raise RuntimeError("cannot submit after shutdown")
+        task_ids = self._queue.put_many(self._spec_key, calls)
+        futures = [Future() for _ in task_ids]
+        with self._lock:
+            self._futures.update(zip(task_ids, futures))
+        return futures
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop collecting results, optionally cancelling queued tasks and waiting for the rest."""
+        if cancel_futures:
+            with self._lock:
+                pending = {task_id: f for task_id, f in self._futures.items() if not f.done()}
+            self._queue.cancel(list(pending))
+            for future in pending.values():
+                future.cancel()
+        if wait:
+            with self._lock:
+                futures = list(self._futures.values())
+            for future in futures:
+                try:
+                    future.exception()
+                except BaseException:
+                    pass
+        self._stop.set()
+        self._poller.join()
+        self._queue.close()
+
+    def _poll(self) -> None:
+        """Resolve futures until shutdown, retrying failed polls and failing pending futures after too many."""
+        errors = 0
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self._poll_once()
+                errors = 0
+            except Exception as exc:
+                errors += 1
+                if isinstance(exc, sqlite3.OperationalError) and errors < MAX_POLL_ERRORS:
+                    continue
+                self._fail_pending(exc)
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Set ``exc`` on every future still waiting for a result."""
+        with self._lock:
+            waiting, self._futures = self._futures, {}
+        for future in waiting.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(exc)
+
+    def _poll_once(self) -> None:
+        """Re-queue lost tasks, drop cancelled ones and collect finished results into their futures."""
+        self._queue.requeue_expired(self.max_attempts)
+        with self._lock:
+            waiting = dict(self._futures)
+        cancelled = [task_id for task_id, future in waiting.items() if future.cancelled()]
+        if cancelled:
+            self._queue.cancel(cancelled)
+        finished = self._queue.results([task_id for task_id in waiting if task_id not in cancelled])
+        for task_id, status, value in finished:
+            future = waiting[task_id]
+            if future.set_running_or_notify_cancel():
+                if status == "done":
+                    future.set_result(value)
+                else:
+                    exc, remote_traceback = value
+                    if remote_traceback:
+                        exc.__cause__ = _RemoteTraceback(remote_traceback)
+                    future.set_exception(exc)
+        collected = cancelled + [task_id for task_id, _, _ in finished]
+        if collected:
+            # Forget resolved futures first, so a failed purge cannot resolve them twice
+            with self._lock:
+                for task_id in collected:
+                    self._futures.pop(task_id, None)
+            self._queue.purge([task_id for task_id, _, _ in finished])
+
+
+def run_worker(
+    url: str,
+    worker_id: str | None = None,
+    lease: float = 30.0,
+    poll_interval: float = 0.1,
+    idle_timeout: float | None = None,
+) -> int:
+    """Claim and execute tasks from the queue at ``url`` until idle for ``idle_timeout`` seconds.
+
+    A heartbeat thread renews the worker's leases every third of ``lease``.
+    The stage components are flushed whenever the queue runs dry after
+    some work, before switching to other specs, and on exit; failures are
+    logged, since the tasks have already been reported. A task whose call
+    or stage specs cannot be loaded on this worker fails like one that
+    raised. Returns the number of tasks finished.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    queue = TaskQueue(url)
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(lease / 3):
+            try:
+                queue.heartbeat(worker_id, lease)
+            except Exception:
+                # Keep beating: the leases still have up to two thirds of their time left
+                logger.exception("worker %s: heartbeat failed, retrying", worker_id)
+
+    queue.heartbeat(worker_id, lease)
+    heart = threading.Thread(target=beat, name="heartbeat", daemon=True)
+    heart.start()
+
+    loaded_specs = None
+    executed = 0
+    unflushed = False
+    idle_since = time.monotonic()
+    try:
+        while True:
+            claimed = queue.claim(worker_id, lease)
+            if claimed is None:
+                if unflushed:
+                    _flush_components(worker_id)
+                    unflushed = False
+                if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                    return executed
+                time.sleep(poll_interval)
+                continue
+            task_id, spec_key, payload = claimed
+            try:
+                # A call or specs this worker cannot import fail the task rather than the worker
+                fn, args, kwargs = pickle.loads(payload)
+                if spec_key != loaded_specs:
+                    if unflushed:
+                        _flush_components(worker_id)
+                        unflushed = False
+                    executors._worker_components.clear()
+                    loaded_specs = None
+                    executors._init_worker(queue.specs(spec_key))
+                    loaded_specs = spec_key
+                status, value = "done", fn(*args, **kwargs)
+            except Exception as exc:
+                # Tracebacks do not pickle; send the worker-side one as text
+                status, value = "failed", (exc, "".join(traceback.format_exception(exc)))
+            queue.finish(task_id, worker_id, status, value)
+            executed += 1
+            unflushed = True
+            idle_since = time.monotonic()
+    finally:
+        if unflushed:
+            _flush_components(worker_id)
+        stop.set()
+        heart.join()
+        queue.close()
+
+
+def _flush_components(worker_id: str) -> None:
+    """Flush the worker's stage components, logging a failure."""
+    try:
+        executors.flush_worker_components()
+    except Exception:
+        logger.exception("worker %s: flushing stage components failed", worker_id)
+
+
+def main(argv=None) -> None:
+    """Command-line entry point for a queue worker."""
+    parser = argparse.ArgumentParser(description="Execute orchestrator tasks from a work queue")
+    parser.add_argument("--queue", required=True, help="task queue path (queue_url)")
+    parser.add_argument("--worker-id", default=None)
+    parser.add_argument("--lease", type=float, default=30.0, help="seconds before a silent worker's task is re-queued")
+    parser.add_argument("--idle-timeout", type=float, default=None, help="exit after this many idle seconds")
+    args = parser.parse_args(argv)
+    run_worker(args.queue, args.worker_id, lease=args.lease, idle_timeout=args.idle_timeout)
+
+
+if __name__ == "__main__":
+    main()
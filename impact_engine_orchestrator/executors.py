@@ -0,0 +1,165 @@
+"""Executor backends for fan-out stages."""
+
+import multiprocessing
+import pickle
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import util
+
+from impact_engine_orchestrator.config import StageConfig
+
+# Stage components living in a worker process, keyed by stage name.
+_worker_components = {}
+
+
+class InlineExecutor(Executor):
+    """Run each submitted call synchronously in the calling thread.
+
+    Useful for debugging and profiling: tracebacks and profilers see the
+    component call directly, with no pool in between.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Call ``fn`` immediately and return a completed future."""
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _init_worker(specs: dict, flush_errors=None) -> None:
+    """Construct stage components once per worker process.
+
+    ``specs`` maps stage names to either a :class:`StageConfig`, which is
+    built in the worker via the registry, or a picklable component instance.
+    With ``flush_errors``, a queue, the components are flushed when the
+    worker exits and the first failure is sent back on it.
+    """
+    from impact_engine_orchestrator import registry
+
+    for stage, spec in specs.items():
+        _worker_components[stage] = registry.build(spec) if isinstance(spec, StageConfig) else spec
+    if flush_errors is not None:
+        # Runs on a clean worker exit, i.e. at pool shutdown
+        util.Finalize(None, _report_flush, args=(flush_errors,), exitpriority=100)
+
+
+def run_in_worker(stage: str, event: dict) -> dict:
+    """Execute ``event`` with the worker-local component for ``stage``."""
+    return _worker_components[stage].execute(event)
+
+
+def run_batch_in_worker(stage: str, events: list[dict]) -> list[dict]:
+    """Execute ``events`` as one batch with the worker-local component for ``stage``."""
+    return _worker_components[stage].execute_batch(events)
+
+
+def flush_worker_components() -> None:
+    """Flush every worker-local component, then raise the first failure.
+
+    Workers call this once, when they are done with their components,
+    rather than after every task: flushing waits for background work such
+    as :class:`~impact_engine_orchestrator.components.measure.measure.Measure`
+    persistence.
+    """
+    error = None
+    for component in _worker_components.values():
+        flush = getattr(component, "flush", None)
+        if not callable(flush):
+            continue
+        try:
+            flush()
+        except Exception as exc:
+            error = error or exc
+    if error is not None:
+        raise error
+
+
+def _report_flush(flush_errors) -> None:
+    """Flush the worker-local components and send a failure to the pool."""
+    try:
+        flush_worker_components()
+    except Exception as exc:
+        try:
+            pickle.dumps(exc)
+        except Exception:
+            exc = RuntimeError(f"{type(exc).__name__}: {exc}")
+        flush_errors.put(exc)
+
+
+class _FlushingProcessPool(ProcessPoolExecutor):
+    """Process pool whose workers flush their stage components when they exit.
+
+    A failure of that background work is raised by :meth:`shutdown` once
+    the workers have exited.
+    """
+
+    def __init__(self, max_workers: int, specs: dict):
+        self._flush_errors = multiprocessing.SimpleQueue()
+        super().__init__(max_workers=max_workers, initializer=_init_worker, initargs=(specs, self._flush_errors))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Shut down the pool; after waiting for the workers, raise the first failure of their flush."""
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+        if not wait:
+            return
+        errors = []
+        while not self._flush_errors.empty():
+            errors.append(self._flush_errors.get())
+        if errors:
+            raise errors[0]
+
+
+def create_executor(backend: str, max_workers: int, specs: dict, queue_url: str | None = None) -> Executor:
+    """Create the executor for a pipeline run.
+
+    Parameters
+    ----------
+    backend : str
+        One of ``"thread"``, ``"process"``, ``"inline"`` or ``"queue"``.
+    max_workers : int
+        Pool size for the thread and process backends.
+    specs : dict
+        Stage name to :class:`StageConfig` or component instance, used to
+        initialize process and queue workers.
+    queue_url : str, optional
+        Task queue of the queue backend (see
+        :mod:`impact_engine_orchestrator.distributed`).
+    """
+    if backend == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if backend == "process":
+        return _FlushingProcessPool(max_workers, specs)
+    if backend == "inline":
+        return InlineExecutor()
+    if backend == "queue":
+        from impact_engine_orchestrator.distributed import QueueExecutor
+
+        return QueueExecutor(queue_url, specs)
+    raise ValueError(f"Unknown executor backend {backend!r}")
+
+
+def shutdown_executor(pool: Executor, abandon: bool = False) -> None:
+    """Shut down a run's executor.
+
+    With ``abandon`` (after a failure or timeout), queued tasks are cancelled
+    and running ones are not waited for. Process workers are terminated;
+    threads cannot be interrupted and finish their current call in the
+    background. Otherwise process workers flush their components on exit,
+    and a failure of that is raised here.
+    """
+    if not abandon:
+        pool.shutdown(wait=True)
+        return
+    if isinstance(pool, ProcessPoolExecutor):
+        terminate_workers = getattr(pool, "terminate_workers", None)  # Python 3.14+
+        if terminate_workers is not None:
+            terminate_workers()
+            return
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+        return
+    pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,93 @@
+"""Content fingerprints for MEASURE work and generated data files.
+
+A file derived from another (a simulated CSV from its simulator config, a
+Parquet copy from its CSV) is recorded with a hash sidecar beside it,
+``<file>.<kind>hash``, holding the hex SHA-256 of the file it was made from.
+"""
+
+import hashlib
+import json
+import os
+
+import yaml
+
+# Sidecar kinds: beside a generated CSV, the simulator config it came from
+SIMULATOR = "sim"
+# beside a Parquet copy, the CSV it was made from
+CSV = "csv"
+
+
+def file_hash(path) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sidecar_path(path, kind: str) -> str:
+    """Return the path of the ``kind`` hash sidecar of ``path``."""
+    return f"{os.fspath(path)}.{kind}hash"
+
+
+def read_sidecar(path, kind: str) -> str | None:
+    """Return the digest recorded in the ``kind`` sidecar of ``path``, or ``None`` if there is none."""
+    try:
+        with open(sidecar_path(path, kind)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def write_sidecar(path, kind: str, digest: str) -> None:
+    """Record ``digest`` in the ``kind`` sidecar of ``path``."""
+    with open(sidecar_path(path, kind), "w") as f:
+        f.write(digest)
+
+
+def _referenced_paths(measure_config: dict) -> list[str]:
+    """Return the data files a measure config reads from."""
+    source = (measure_config.get("DATA") or {}).get("SOURCE") or {}
+    path = (source.get("CONFIG") or {}).get("path")
+    return [path] if path else []
+
+
+def _file_fingerprint(path: str) -> list:
+    """Cheap fingerprint of a data file: absolute path, size and mtime."""
+    abspath = os.path.abspath(path)
+    try:
+        stat = os.stat(abspath)
+    except FileNotFoundError:
+        return [abspath, None, None]
+    return [abspath, stat.st_size, stat.st_mtime_ns]
+
+
+def measure_fingerprint(measure_config: str, sample_size: int | None = None, params: dict | None = None) -> str:
+    """Hash everything that determines a MEASURE result.
+
+    Parameters
+    ----------
+    measure_config : str
+        Path to the per-initiative measure config YAML. Its contents, not its
+        path, enter the hash.
+    sample_size : int, optional
+        Requested sample size (``None`` for pilot runs).
+    params : dict, optional
+        Component-level parameters that affect the result.
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest.
+    """
+    with open(measure_config, "rb") as f:
+        contents = f.read()
+    parsed = yaml.safe_load(contents) or {}
+    payload = {
+        "config": hashlib.sha256(contents).hexdigest(),
+        "data": [_file_fingerprint(p) for p in _referenced_paths(parsed)],
+        "sample_size": sample_size,
+        "params": params or {},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
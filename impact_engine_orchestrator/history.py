@@ -0,0 +1,129 @@
+"""Runtime history for longest-expected-first scheduling (``runtime_history``).
+
+Fan-out stages finish when their slowest worker does, so one expensive
+initiative submitted last becomes a straggler. With ``runtime_history:
+runtimes.json`` in the orchestrator YAML, the orchestrator records how long
+each MEASURE, EVALUATE and scale MEASURE call took, as an exponentially
+weighted moving average per initiative and per ``model_type``, and submits
+each stage's tasks longest expected first (LPT). An initiative without
+history of its own is expected to take as long as others of its model type,
+or the stage's average if its model type is new too.
+
+The history is a small JSON file, saved after every run, so estimates carry
+over between runs and improve as the portfolio is re-run.
+"""
+
+import functools
+import heapq
+import json
+import os
+from pathlib import Path
+
+import yaml
+
+STAGES = ("measure", "evaluate", "scale")
+
+
+@functools.lru_cache(maxsize=4096)
+def _configured_model_type(measure_config: str) -> str | None:
+    """Read ``MEASUREMENT.MODEL`` from a measure config, or ``None`` if it has none."""
+    try:
+        with open(measure_config) as f:
+            return (yaml.safe_load(f).get("MEASUREMENT") or {}).get("MODEL")
+    except (OSError, AttributeError, yaml.YAMLError):
+        return None
+
+
+def model_type_of(event: dict) -> str | None:
+    """Return the model type of a stage input or result.
+
+    Results and EVALUATE inputs carry ``model_type``; MEASURE inputs name it
+    in their measure config.
+    """
+    model_type = event.get("model_type")
+    if model_type is not None:
+        return getattr(model_type, "value", model_type)
+    measure_config = event.get("measure_config")
+    return _configured_model_type(str(measure_config)) if measure_config else None
+
+
+def estimate_makespan(durations: list[float], workers: int) -> float:
+    """Simulate LPT scheduling of ``durations`` on ``workers`` and return the time the last one finishes."""
+    assert workers > 0, f"workers must be positive, got {workers}"
+    finish = [0.0] * min(workers, len(durations))
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(finish, finish[0] + duration)
+    return max(finish, default=0.0)
+
+
+class RuntimeHistory:
+    """Moving averages of task runtimes by stage, initiative and model type.
+
+    Parameters
+    ----------
+    path : str, optional
+        JSON file to load from (if it exists) and :meth:`save` to; without
+        one the history lives in memory only.
+    alpha : float
+        Weight of the newest runtime in each moving average.
+    """
+
+    def __init__(self, path: str | None = None, alpha: float = 0.3):
+        assert 0 < alpha <= 1, f"alpha must be in (0, 1], got {alpha}"
+        self.path = path
+        self.alpha = alpha
+        self._stages = {stage: {"initiatives": {}, "model_types": {}} for stage in STAGES}
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                for stage, averages in json.load(f)["stages"].items():
+                    self._stages[stage] = averages
+
+    def record(self, stage: str, initiative_id: str, seconds: float, model_type: str | None = None) -> None:
+        """Fold one task's runtime into the initiative's and model type's averages."""
+        averages = self._stages.setdefault(stage, {"initiatives": {}, "model_types": {}})
+        self._update(averages["initiatives"], initiative_id, seconds)
+        if model_type is not None:
+            self._update(averages["model_types"], getattr(model_type, "value", model_type), seconds)
+
+    def _update(self, table: dict, key: str, seconds: float) -> None:
+        mean, count = table.get(key, (seconds, 0))
+        table[key] = [mean + self.alpha * (seconds - mean), count + 1]
+
+    def expected(self, stage: str, event: dict) -> float | None:
+        """Return the expected runtime of ``event`` in ``stage``, or ``None`` without any history."""
+        return self.durations(stage, [event])[0]
+
+    def durations(self, stage: str, events: list[dict]) -> list[float | None]:
+        """Return the expected runtime of each of ``events``, ``None`` when the stage has no history."""
+        averages = self._stages.get(stage, {"initiatives": {}, "model_types": {}})
+        initiatives, model_types = averages["initiatives"], averages["model_types"]
+        if not initiatives:
+            return [None] * len(events)
+        default = sum(mean for mean, _ in initiatives.values()) / len(initiatives)
+        expected = []
+        for event in events:
+            known = initiatives.get(event["initiative_id"]) or model_types.get(model_type_of(event))
+            expected.append(known[0] if known else default)
+        return expected
+
+    def order(self, stage: str, events: list[dict]) -> list[int]:
+        """Return the indices of ``events`` longest expected first; ties keep their input order."""
+        durations = self.durations(stage, events)
+        return sorted(range(len(events)), key=lambda k: -(durations[k] or 0.0))
+
+    def estimate_makespan(self, stage: str, events: list[dict], workers: int) -> float | None:
+        """Estimate how long ``stage`` takes to run ``events`` on ``workers`` (``None`` without history)."""
+        durations = self.durations(stage, events)
+        if events and durations[0] is None:
+            return None
+        return estimate_makespan(durations, workers)
+
+    def save(self) -> None:
+        """Write the history to its file, atomically."""
+        if self.path is None:
+            return
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as f:
+            json.dump({"alpha": self.alpha, "stages": self._stages}, f)
+        os.replace(temporary, self.path)
@@ -0,0 +1,214 @@
+"""Per-stage and per-initiative timing of pipeline runs.
+
+Enabled with ``instrument: true`` in the orchestrator YAML. Each component
+call is wrapped by :func:`timed_call` in the worker that runs it, and the
+resulting records are collected by a :class:`Timings` recorder in the
+orchestrator. When disabled, nothing is wrapped.
+"""
+
+import math
+import os
+import pickle
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+
+
+def _record(stage, initiative_id, submitted, started, finished, cpu_seconds, payload, payload_size=True) -> dict:
+    return {
+        "stage": stage,
+        "initiative_id": initiative_id,
+        "submitted": submitted,
+        "started": started,
+        "finished": finished,
+        "wall_seconds": finished - started,
+        "cpu_seconds": cpu_seconds,
+        "queue_seconds": started - submitted,
+        "payload_bytes": len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)) if payload_size else None,
+        "pid": os.getpid(),
+        "thread": threading.get_ident(),
+    }
+
+
+def timed_call(
+    fn, event: dict | list[dict], stage: str, submitted: float, payload_size: bool = True
+) -> tuple[dict, dict]:
+    """Call ``fn(event)`` and return ``(result, timing record)``.
+
+    Module-level so it can be submitted to process pools. Wall-clock
+    timestamps are epoch seconds so that queue wait can be computed across
+    processes; CPU time is that of the executing thread. A batch of events
+    yields a single record without an initiative id. Without
+    ``payload_size``, the result is not pickled to size it and
+    ``payload_bytes`` is ``None``.
+    """
+    started = time.time()
+    cpu_start = time.thread_time()
+    result = fn(event)
+    cpu_seconds = time.thread_time() - cpu_start
+    finished = time.time()
+    initiative_id = event.get("initiative_id") if isinstance(event, dict) else None
+    return result, _record(stage, initiative_id, submitted, started, finished, cpu_seconds, result, payload_size)
+
+
+async def timed_call_async(fn, event: dict, stage: str, submitted: float) -> tuple[dict, dict]:
+    """Await ``fn(event)`` and return ``(result, timing record)``.
+
+    Coroutines interleave on one thread, so CPU time cannot be attributed to
+    a single call and is recorded as zero.
+    """
+    started = time.time()
+    result = await fn(event)
+    finished = time.time()
+    return result, _record(stage, event.get("initiative_id"), submitted, started, finished, 0.0, result)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Timings:
+    """Collects timing records for one run."""
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, record: dict) -> None:
+        """Add one record produced by :func:`timed_call`."""
+        self.records.append(record)
+
+    @contextmanager
+    def span(self, stage: str):
+        """Time a block running in the orchestrator itself (e.g. ALLOCATE).
+
+        The block may assign ``span["payload"]`` to have its output size recorded.
+        """
+        span = {"payload": None}
+        started = time.time()
+        cpu_start = time.thread_time()
+        try:
+            yield span
+        finally:
+            cpu_seconds = time.thread_time() - cpu_start
+            self.records.append(_record(stage, None, started, started, time.time(), cpu_seconds, span["payload"]))
+
+    def to_dict(self) -> dict:
+        """Return the run's ``timings`` section: raw records plus per-stage summaries."""
+        stages = {}
+        for record in self.records:
+            stages.setdefault(record["stage"], []).append(record)
+
+        summary = {}
+        for stage, records in stages.items():
+            walls = sorted(r["wall_seconds"] for r in records)
+            summary[stage] = {
+                "count": len(records),
+                "started": min(r["started"] for r in records),
+                "finished": max(r["finished"] for r in records),
+                "wall_seconds_total": sum(walls),
+                "wall_seconds_p50": _percentile(walls, 50),
+                "wall_seconds_p99": _percentile(walls, 99),
+                "cpu_seconds_total": sum(r["cpu_seconds"] for r in records),
+                "queue_seconds_total": sum(r["queue_seconds"] for r in records),
+                "queue_seconds_max": max(r["queue_seconds"] for r in records),
+                "payload_bytes_total": sum(r["payload_bytes"] for r in records),
+            }
+        return {"stages": summary, "records": list(self.records)}
+
+
+def to_chrome_trace(timings: dict) -> dict:
+    """Convert a ``timings`` section to Chrome trace event format.
+
+    Load the JSON-serialized result in ``chrome://tracing`` or Perfetto.
+    """
+    origin = min((r["submitted"] for r in timings["records"]), default=0.0)
+    events = []
+    for record in timings["records"]:
+        name = record["stage"] if record["initiative_id"] is None else f"{record['stage']}:{record['initiative_id']}"
+        events.append(
+            {
+                "name": name,
+                "cat": record["stage"],
+                "ph": "X",
+                "ts": (record["started"] - origin) * 1e6,
+                "dur": record["wall_seconds"] * 1e6,
+                "pid": record["pid"],
+                "tid": record["thread"],
+                "args": {
+                    "initiative_id": record["initiative_id"],
+                    "cpu_seconds": record["cpu_seconds"],
+                    "queue_seconds": record["queue_seconds"],
+                    "payload_bytes": record["payload_bytes"],
+                },
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def to_otlp_json(timings: dict, service_name: str = "impact-engine-orchestrator") -> dict:
+    """Convert a ``timings`` section to OpenTelemetry OTLP/JSON spans.
+
+    All records become children of a single root span covering the run.
+    """
+    records = timings["records"]
+    trace_id = secrets.token_hex(16)
+    root_id = secrets.token_hex(8)
+    start = min((r["submitted"] for r in records), default=0.0)
+    end = max((r["finished"] for r in records), default=0.0)
+
+    def attributes(values: dict) -> list[dict]:
+        encoded = []
+        for key, value in values.items():
+            if value is None:
+                continue
+            if isinstance(value, int):
+                encoded.append({"key": key, "value": {"intValue": str(value)}})
+            elif isinstance(value, float):
+                encoded.append({"key": key, "value": {"doubleValue": value}})
+            else:
+                encoded.append({"key": key, "value": {"stringValue": str(value)}})
+        return encoded
+
+    spans = [
+        {
+            "traceId": trace_id,
+            "spanId": root_id,
+            "name": "pipeline.run",
+            "kind": 1,
+            "startTimeUnixNano": str(int(start * 1e9)),
+            "endTimeUnixNano": str(int(end * 1e9)),
+        }
+    ]
+    for record in records:
+        spans.append(
+            {
+                "traceId": trace_id,
+                "spanId": secrets.token_hex(8),
+                "parentSpanId": root_id,
+                "name": f"pipeline.{record['stage']}",
+                "kind": 1,
+                "startTimeUnixNano": str(int(record["started"] * 1e9)),
+                "endTimeUnixNano": str(int(record["finished"] * 1e9)),
+                "attributes": attributes(
+                    {
+                        "initiative_id": record["initiative_id"],
+                        "cpu_seconds": record["cpu_seconds"],
+                        "queue_seconds": record["queue_seconds"],
+                        "payload_bytes": record["payload_bytes"],
+                        "process.pid": record["pid"],
+                        "thread.id": record["thread"],
+                    }
+                ),
+            }
+        )
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": attributes({"service.name": service_name})},
+                "scopeSpans": [{"scope": {"name": "impact_engine_orchestrator"}, "spans": spans}],
+            }
+        ]
+    }
@@ -0,0 +1,136 @@
+"""Run journal: per-initiative stage outputs persisted as they complete."""
+
+import secrets
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from impact_engine_orchestrator import serialization
+from impact_engine_orchestrator.config import PipelineConfig
+from impact_engine_orchestrator.fingerprint import measure_fingerprint
+
+
+def new_run_id() -> str:
+    """Return a sortable, unique run id (UTC timestamp plus random suffix)."""
+    return f"{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}-{secrets.token_hex(3)}"
+
+
+def _initiative_inputs(initiative) -> dict:
+    """Return an initiative's config plus a fingerprint of its measure config contents and data."""
+    fingerprint = None
+    if initiative.measure_config:
+        try:
+            fingerprint = measure_fingerprint(initiative.measure_config)
+        except OSError:
+            pass
+    return {**asdict(initiative), "fingerprint": fingerprint}
+
+
+def config_inputs(config: PipelineConfig) -> dict:
+    """Return the parts of a config that determine a run's results.
+
+    Execution settings (workers, backend, instrumentation, ...) are left
+    out: changing them does not invalidate completed work.
+    """
+    return {
+        "budget": config.budget,
+        "scale_sample_size": config.scale_sample_size,
+        "initiatives": [_initiative_inputs(i) for i in config.initiatives],
+        "measure_stage": asdict(config.measure_stage) if config.measure_stage else None,
+        "evaluate_stage": asdict(config.evaluate_stage) if config.evaluate_stage else None,
+        "allocate_stage": asdict(config.allocate_stage) if config.allocate_stage else None,
+    }
+
+
+def plan_reuse(previous: dict, current: dict) -> dict[str, set[str]]:
+    """Return, per journal stage, the keys whose results carry over between two runs' inputs.
+
+    ``previous`` and ``current`` are :func:`config_inputs` of two runs. A
+    pilot (and scale) measurement carries over when the initiative's measure
+    config path and fingerprint and the measure stage are unchanged (scale
+    also needs the same sample size); an evaluation when its pilot carries
+    over and its ``cost_to_scale`` and the evaluate stage are unchanged;
+    ALLOCATE only when every evaluation carries over and the initiative
+    set, budget and allocate stage are unchanged.
+    """
+    before = {i["initiative_id"]: i for i in previous["initiatives"]}
+    after = {i["initiative_id"]: i for i in current["initiatives"]}
+
+    def same(key, iid):
+        return before[iid][key] == after[iid][key]
+
+    pilots = set()
+    if previous["measure_stage"] == current["measure_stage"]:
+        pilots = {iid for iid in after if iid in before and same("measure_config", iid) and same("fingerprint", iid)}
+    evaluations = set()
+    if previous["evaluate_stage"] == current["evaluate_stage"]:
+        evaluations = {iid for iid in pilots if same("cost_to_scale", iid)}
+    allocation = set()
+    if (
+        evaluations == set(after) == set(before)
+        and previous["budget"] == current["budget"]
+        and previous["allocate_stage"] == current["allocate_stage"]
+    ):
+        allocation = {"allocate"}
+    scale = pilots if previous["scale_sample_size"] == current["scale_sample_size"] else set()
+    return {"measure": pilots, "evaluate": evaluations, "allocate": allocation, "scale": scale}
+
+
+class RunJournal:
+    """Append-only journal of one run under ``<root>/<run_id>/``.
+
+    Each stage has a JSON-lines file with one ``{"key", "result"}`` record per
+    completed unit of work (keyed by initiative id; ALLOCATE uses a single
+    key). Records are flushed as they are written, so a crash loses at most
+    the record being written; a truncated last line is ignored on load.
+    """
+
+    def __init__(self, root: str, run_id: str):
+        self.run_id = run_id
+        self.path = Path(root) / run_id
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Return whether this run has been started."""
+        return (self.path / "inputs.json").exists()
+
+    def start(self, config: PipelineConfig) -> None:
+        """Create the journal and record the run's inputs."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / "inputs.json").write_text(serialization.dumps(config_inputs(config)))
+
+    def inputs(self) -> dict:
+        """Return the inputs recorded by :meth:`start`."""
+        return serialization.loads((self.path / "inputs.json").read_text())
+
+    def record(self, stage: str, key: str, result) -> None:
+        """Append one completed result for ``stage``."""
+        line = serialization.dumps({"key": key, "result": result}) + "\n"
+        with self._lock, open(self.path / f"{stage}.jsonl", "a") as f:
+            f.write(line)
+            f.flush()
+
+    def load(self, stage: str) -> dict:
+        """Return ``{key: result}`` for everything recorded for ``stage``.
+
+        A partial record left by an interrupted write is truncated away so
+        that later appends start on a clean line.
+        """
+        path = self.path / f"{stage}.jsonl"
+        if not path.exists():
+            return {}
+        completed = {}
+        valid_bytes = 0
+        with self._lock, open(path, "rb+") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated record")
+                    entry = serialization.loads(line)
+                except ValueError:
+                    f.truncate(valid_bytes)
+                    break
+                completed[entry["key"]] = entry["result"]
+                valid_bytes += len(line)
+        return completed
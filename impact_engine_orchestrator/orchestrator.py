@@ -2,16 +2,61 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from contextlib import contextmanager, nullcontext
 from dataclasses import asdict
+from functools import partial
+from itertools import islice
 
+from impact_engine_orchestrator import serialization
 from impact_engine_orchestrator.components.base import PipelineComponent
+from impact_engine_orchestrator.concurrency import AIMDController
 from impact_engine_orchestrator.config import PipelineConfig
 from impact_engine_orchestrator.contracts.report import OutcomeReport
+from impact_engine_orchestrator.executors import (
+    create_executor,
+    run_batch_in_worker,
+    run_in_worker,
+    shutdown_executor,
+)
+from impact_engine_orchestrator.fingerprint import measure_fingerprint
+from impact_engine_orchestrator.history import RuntimeHistory, model_type_of
+from impact_engine_orchestrator.instrumentation import Timings, timed_call
+from impact_engine_orchestrator.journal import RunJournal, config_inputs, new_run_id, plan_reuse
+from impact_engine_orchestrator.results import RecordCollector, ResultTableBuilder
+from impact_engine_orchestrator.sinks import ReportSink
+from impact_engine_orchestrator.store import RunStore
+
+
+class _EvaluateInputs(Sequence):
+    """EVALUATE events built from pilot results on access, so they are never all held at once."""
+
+    def __init__(self, pilot_results, cost_by_id):
+        self._pilot_results = pilot_results
+        self._cost_by_id = cost_by_id
+
+    def __len__(self):
+        return len(self._pilot_results)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[k] for k in range(len(self))[index]]
+        result = self._pilot_results[index]
+        return {**result, "cost_to_scale": self._cost_by_id[result["initiative_id"]]}
 
 
 class Orchestrator:
-    """Run the full MEASURE-EVALUATE-ALLOCATE-SCALE pipeline."""
+    """Run the full MEASURE-EVALUATE-ALLOCATE-SCALE pipeline.
+
+    By default every run creates and shuts down its own executor per the
+    config's ``executor`` and ``max_workers``. Passing ``pool`` runs fan-out
+    stages on that executor instead; it must execute calls in this process
+    (e.g. a thread pool), is shared across runs and is never shut down by
+    the orchestrator.
+    """
 
     def __init__(
         self,
@@ -19,14 +64,32 @@ class Orchestrator:
         evaluate: PipelineComponent,
         allocate: PipelineComponent,
         config: PipelineConfig,
+        pool: Executor | None = None,
     ):
         self.measure = measure
         self.evaluate = evaluate
         self.allocate = allocate
         self.config = config
+        self._shared_pool = pool
+        # What each process worker builds its components from
+        self._stage_specs = {"measure": measure, "evaluate": evaluate, "allocate": allocate}
+        # Timing recorder and journal of the current run; None when disabled
+        self._timings = None
+        self._journal = None
+        self._run_id = None
+        # Failures skipped in the current run (``on_failure: skip``)
+        self._errors = []
+        # Whether the current run abandoned running tasks after a timeout
+        self._timed_out = False
+        # Concurrency controllers by stage label (``adaptive_concurrency``), kept across runs
+        self._controllers = {}
+        # Task runtimes for longest-expected-first scheduling (``runtime_history``), and the
+        # current run's makespan estimates by stage label
+        self._history = RuntimeHistory(config.runtime_history) if config.runtime_history else None
+        self._schedule = {}
 
     @classmethod
-    def from_config(cls, config: PipelineConfig) -> Orchestrator:
+    def from_config(cls, config: PipelineConfig, pool: Executor | None = None) -> Orchestrator:
         """Build an Orchestrator from a PipelineConfig with stage configs."""
         from impact_engine_orchestrator import registry
 
@@ -37,65 +100,716 @@ class Orchestrator:
         measure = registry.build(config.measure_stage)
         evaluate = registry.build(config.evaluate_stage)
         allocate = registry.build(config.allocate_stage)
-        return cls(measure=measure, evaluate=evaluate, allocate=allocate, config=config)
+        orchestrator = cls(measure=measure, evaluate=evaluate, allocate=allocate, config=config, pool=pool)
+        orchestrator._stage_specs = {
+            "measure": config.measure_stage,
+            "evaluate": config.evaluate_stage,
+            "allocate": config.allocate_stage,
+        }
+        return orchestrator
 
-    def run(self) -> dict:
-        """Execute all pipeline stages and return combined results."""
-        initiatives = self.config.initiatives
-        cost_by_id = {i.initiative_id: i.cost_to_scale for i in initiatives}
-        config_by_id = {i.initiative_id: i.measure_config for i in initiatives}
+    def run(self, sink: ReportSink | None = None) -> dict:
+        """Execute all pipeline stages and return combined results.
 
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
-            # 1. MEASURE (pilot) - parallel (enrich with measure_config)
-            measure_inputs = [
-                {"initiative_id": i.initiative_id, "measure_config": i.measure_config} for i in initiatives
-            ]
-            pilot_results = self._fan_out(self.measure, measure_inputs, pool)
+        With ``instrument`` enabled in the config, the result also carries a
+        ``timings`` section (see :mod:`impact_engine_orchestrator.instrumentation`).
+        With ``journal_dir`` set, every completed unit of work is journaled
+        under a new run id (returned as ``run_id``) so that a failed run can
+        be continued with :meth:`resume`.
+
+        With a ``sink`` (see :mod:`impact_engine_orchestrator.sinks`), each
+        outcome report is written to it as soon as its scale measurement
+        completes, in completion order. The result then carries
+        ``reports_written`` instead of ``outcome_reports``; the sink is
+        flushed but left open.
+        """
+        journal = None
+        if self.config.journal_dir is not None:
+            journal = RunJournal(self.config.journal_dir, new_run_id())
+            journal.start(self.config)
+        return self._run(journal, sink)
+
+    def resume(self, run_id: str, sink: ReportSink | None = None) -> dict:
+        """Continue a journaled run, executing only the work it did not complete.
+
+        The config's result-determining inputs (budget, sample size,
+        initiatives and stage configs) must match those of the original run.
+        """
+        assert self.config.journal_dir is not None, "journal_dir required for resume"
+        journal = RunJournal(self.config.journal_dir, run_id)
+        if not journal.exists():
+            raise FileNotFoundError(f"No journal for run {run_id!r} in {self.config.journal_dir}")
+        if journal.inputs() != serialization.loads(serialization.dumps(config_inputs(self.config))):
+            raise ValueError(f"Config inputs differ from those of run {run_id!r}; start a new run instead")
+        return self._run(journal, sink)
+
+    def rerun(self, previous_run_id: str, sink: ReportSink | None = None) -> dict:
+        """Run the current config as a new journaled run, reusing a previous run's still-valid work.
+
+        The config is diffed against the inputs recorded by ``previous_run_id``
+        (see :func:`~impact_engine_orchestrator.journal.plan_reuse`), and only
+        the affected work is recomputed: a changed ``cost_to_scale`` re-runs
+        that initiative's EVALUATE and ALLOCATE, a changed measure config
+        re-runs its measurements, and a changed budget re-runs ALLOCATE and
+        scale-measures newly selected initiatives only.
+        """
+        assert self.config.journal_dir is not None, "journal_dir required for rerun"
+        previous = RunJournal(self.config.journal_dir, previous_run_id)
+        if not previous.exists():
+            raise FileNotFoundError(f"No journal for run {previous_run_id!r} in {self.config.journal_dir}")
+        journal = RunJournal(self.config.journal_dir, new_run_id())
+        journal.start(self.config)
+        for stage, keys in plan_reuse(previous.inputs(), journal.inputs()).items():
+            for key, result in previous.load(stage).items():
+                if key in keys:
+                    journal.record(stage, key, result)
+        return self._run(journal, sink)
 
-            # 2. EVALUATE - parallel (enrich with cost_to_scale from config)
-            eval_inputs = [{**result, "cost_to_scale": cost_by_id[result["initiative_id"]]} for result in pilot_results]
-            eval_results = self._fan_out(self.evaluate, eval_inputs, pool)
+    def _run(self, journal, sink=None):
+        """Run the pipeline, reusing and recording work in ``journal`` and streaming reports to ``sink`` if given."""
+        self._begin(journal)
+        with self._pool() as pool:
+            # 1+2. MEASURE (pilot) and EVALUATE - parallel
+            pilot_results, eval_results = self._measure_and_evaluate(pool)
 
             # 3. ALLOCATE - single (budget from config)
-            alloc_result = self.allocate.execute(
-                {
-                    "initiatives": eval_results,
-                    "budget": self.config.budget,
-                }
-            )
+            alloc_result = self._journaled("allocate").get("allocate")
+            if alloc_result is None:
+                with self._span("allocate") as span:
+                    alloc_result = self.allocate.execute(
+                        {
+                            "initiatives": eval_results,
+                            "budget": self.config.budget,
+                        }
+                    )
+                    span["payload"] = alloc_result
+                self._record("allocate", "allocate", alloc_result)
 
-            # 4. MEASURE (scale) - parallel on selected only (enrich with measure_config)
-            selected_ids = alloc_result["selected_initiatives"]
-            scale_inputs = [
-                {
-                    "initiative_id": iid,
-                    "sample_size": self.config.scale_sample_size,
-                    "measure_config": config_by_id[iid],
-                }
-                for iid in selected_ids
-            ]
-            scale_results = self._fan_out(self.measure, scale_inputs, pool)
+            # 4. MEASURE (scale) - parallel on selected only, reporting as each completes
+            scale_inputs = self._scale_inputs(alloc_result["selected_initiatives"])
+            write = self._report_writer(pilot_results, eval_results, alloc_result, sink)
+            scale_results = self._run_stage("measure", scale_inputs, pool, label="scale", on_result=write)
 
         # 5. Generate outcome reports
-        reports = self._generate_reports(pilot_results, eval_results, alloc_result, scale_results)
+        return self._finish(pilot_results, eval_results, alloc_result, scale_results, sink)
+
+    def _begin(self, journal):
+        """Reset per-run state for a run recorded in ``journal`` (``None`` when not journaled)."""
+        self._timings = Timings() if self.config.instrument else None
+        self._journal = journal
+        self._run_id = journal.run_id if journal is not None else None
+        self._errors = []
+        self._schedule = {}
+
+    def _finish(self, pilot_results, eval_results, alloc_result, scale_results, sink=None):
+        """Generate outcome reports (unless streamed to ``sink``) and assemble the run result."""
+        reports = None
+        if sink is None or self.config.run_store is not None:
+            with self._span("report") as span:
+                reports = self._generate_reports(pilot_results, eval_results, alloc_result, scale_results)
+                span["payload"] = reports
+        if self.config.run_store is not None:
+            self._store(reports)
 
-        return {
+        result = {
             "pilot_results": pilot_results,
             "evaluate_results": eval_results,
             "allocate_result": alloc_result,
             "scale_results": scale_results,
-            "outcome_reports": reports,
         }
+        if sink is None:
+            result["outcome_reports"] = reports
+        else:
+            sink.flush()
+            result["reports_written"] = sink.count
+        return self._annotate(result)
+
+    def _store(self, reports):
+        """Append the run's outcome reports to the configured run store."""
+        if self._journal is None:
+            self._run_id = new_run_id()
+        with self._span("store"), RunStore(self.config.run_store) as store:
+            store.write(self._run_id, reports)
+
+    def _annotate(self, result):
+        """Add the optional ``run_id``, ``errors``, ``timings`` and ``schedule`` sections to a result.
+
+        With ``runtime_history``, the history including this run is saved here.
+        """
+        if self._run_id is not None:
+            result["run_id"] = self._run_id
+        if self.config.on_failure == "skip":
+            result["errors"] = list(self._errors)
+        if self._timings is not None:
+            result["timings"] = self._timings.to_dict()
+        if self.config.adaptive_concurrency:
+            result["concurrency"] = {label: list(c.history) for label, c in self._controllers.items()}
+        if self._history is not None:
+            result["schedule"] = dict(self._schedule)
+            self._history.save()
+        return result
+
+    def sweep(self, budgets: list[float]) -> dict:
+        """Run the pipeline at several budgets, measuring and evaluating once.
+
+        Only ALLOCATE depends on the budget, so pilot MEASURE and EVALUATE run
+        once, ALLOCATE runs for every budget in parallel, and scale MEASURE
+        runs once per initiative selected under any budget.
+
+        Returns
+        -------
+        dict
+            ``pilot_results``, ``evaluate_results`` and ``scale_results``
+            shared by all budgets, plus ``runs``: one
+            ``{"budget", "allocate_result", "outcome_reports"}`` dict per
+            budget, in input order.
+        """
+        assert len(budgets) > 0, "budgets must not be empty"
+        assert all(b > 0 for b in budgets), f"budgets must be positive, got {budgets}"
+
+        self._begin(None)
+        with self._pool() as pool:
+            pilot_results, eval_results = self._measure_and_evaluate(pool)
+
+            alloc_inputs = [{"initiatives": eval_results, "budget": budget} for budget in budgets]
+            alloc_results = self._fan_out("allocate", alloc_inputs, pool)
+
+            # Scale each selected initiative once, however many budgets select it
+            selected_ids = list(dict.fromkeys(iid for a in alloc_results for iid in a["selected_initiatives"]))
+            scale_results = self._run_stage("measure", self._scale_inputs(selected_ids), pool, label="scale")
+
+        return self._sweep_result(budgets, pilot_results, eval_results, alloc_results, scale_results)
+
+    def _sweep_result(self, budgets, pilot_results, eval_results, alloc_results, scale_results):
+        """Generate each budget's outcome reports and assemble the :meth:`sweep` result."""
+        with self._span("report") as span:
+            runs = [
+                {
+                    "budget": budget,
+                    "allocate_result": alloc_result,
+                    "outcome_reports": self._generate_reports(pilot_results, eval_results, alloc_result, scale_results),
+                }
+                for budget, alloc_result in zip(budgets, alloc_results)
+            ]
+            span["payload"] = runs
+
+        result = {
+            "pilot_results": pilot_results,
+            "evaluate_results": eval_results,
+            "scale_results": scale_results,
+            "runs": runs,
+        }
+        return self._annotate(result)
+
+    @contextmanager
+    def _pool(self):
+        """Create the run's executor; abandon running work on failure or after a timeout.
+
+        A shared ``pool`` is used as-is and left running. After a successful
+        run the components are flushed.
+        """
+        self._timed_out = False
+        if self._shared_pool is not None:
+            yield self._shared_pool
+            self._flush()
+            return
+        pool = create_executor(self.config.executor, self._workers(), self._stage_specs, self.config.queue_url)
+        try:
+            yield pool
+        except BaseException:
+            shutdown_executor(pool, abandon=True)
+            raise
+        shutdown_executor(pool, abandon=self._timed_out)
+        self._flush()
+
+    def _flush(self):
+        """Wait for the components' background work (see :meth:`PipelineComponent.flush`)."""
+        for component in (self.measure, self.evaluate, self.allocate):
+            flush = getattr(component, "flush", None)
+            if callable(flush):
+                flush()
+
+    def _workers(self):
+        """Return the pool size: ``max_workers``, or a larger per-stage limit."""
+        return max([self.config.max_workers, *self.config.stage_workers.values()])
+
+    def _limit(self, label):
+        """Return the most tasks stage ``label`` may have in flight, or ``None`` for no limit.
+
+        Stages without their own ``stage_workers`` entry keep to ``max_workers``.
+        """
+        if self.config.adaptive_concurrency:
+            return self._controller(label).limit
+        if label in self.config.stage_workers:
+            return self.config.stage_workers[label]
+        return self.config.max_workers if self._workers() > self.config.max_workers else None
+
+    def _controller(self, label):
+        """Return the adaptive concurrency controller for ``label``, starting halfway to its ceiling."""
+        if label not in self._controllers:
+            ceiling = self.config.stage_workers.get(label, self._workers())
+            self._controllers[label] = AIMDController(initial=max(1, ceiling // 2), maximum=ceiling)
+        return self._controllers[label]
+
+    def _observe(self, label, submitted):
+        """Feed the latency of a task submitted at ``submitted`` to the stage's controller."""
+        if self.config.adaptive_concurrency:
+            self._controller(label).observe(time.monotonic() - submitted)
+
+    def _order(self, label, inputs):
+        """Return the submission order of ``inputs`` for stage ``label`` and note its estimated makespan.
+
+        Without ``runtime_history``, inputs keep their config order.
+        """
+        if self._history is None:
+            return range(len(inputs))
+        workers = self._limit(label) or self._workers()
+        self._schedule[label] = {
+            "tasks": len(inputs),
+            "estimated_makespan": self._history.estimate_makespan(label, inputs, workers),
+        }
+        return self._history.order(label, inputs)
+
+    def estimate_makespan(self, label: str) -> float | None:
+        """Estimate the seconds stage ``label`` takes over all configured initiatives.
+
+        Uses the ``runtime_history`` and the stage's worker limit. For
+        ``scale``, which runs on the selected initiatives only, this is an
+        upper bound. Returns ``None`` when the stage has no history yet.
+        """
+        assert self._history is not None, "runtime_history required for estimate_makespan"
+        inputs, _ = self._pilot_inputs()
+        return self._history.estimate_makespan(label, inputs, self._limit(label) or self._workers())
+
+    def _collector(self):
+        """Return a collector building a result section in the configured ``result_format``.
+
+        Results are added as they arrive, so with ``columnar`` they are only
+        ever held as columns.
+        """
+        if self.config.result_format == "columnar":
+            return ResultTableBuilder()
+        return RecordCollector()
+
+    def _pilot_inputs(self):
+        """Return pilot MEASURE inputs (enriched with measure_config) and ``{initiative_id: cost_to_scale}``."""
+        initiatives = self.config.initiatives
+        cost_by_id = {i.initiative_id: i.cost_to_scale for i in initiatives}
+        measure_inputs = [{"initiative_id": i.initiative_id, "measure_config": i.measure_config} for i in initiatives]
+        return measure_inputs, cost_by_id
+
+    def _measure_and_evaluate(self, pool):
+        """Run pilot MEASURE and EVALUATE for every initiative in config order."""
+        measure_inputs, cost_by_id = self._pilot_inputs()
+        if self.config.streaming:
+            # MEASURE -> EVALUATE chained per initiative, no barrier in between
+            return self._stream(measure_inputs, cost_by_id, pool)
+
+        pilot_results = self._run_stage("measure", measure_inputs, pool)
+
+        # Enrich EVALUATE inputs with cost_to_scale from config
+        eval_inputs = _EvaluateInputs(pilot_results, cost_by_id)
+        eval_results = self._run_stage("evaluate", eval_inputs, pool)
+        return pilot_results, eval_results
+
+    def _scale_inputs(self, selected_ids):
+        """Build scale MEASURE inputs (enriched with measure_config) for the selected initiatives."""
+        config_by_id = {i.initiative_id: i.measure_config for i in self.config.initiatives}
+        return [
+            {
+                "initiative_id": iid,
+                "sample_size": self.config.scale_sample_size,
+                "measure_config": config_by_id[iid],
+            }
+            for iid in selected_ids
+        ]
+
+    def _task(self, stage, batch=False):
+        """Return the callable that executes one event (or batch of events) for ``stage``.
+
+        With the process and queue backends, components live in the workers
+        (see :mod:`impact_engine_orchestrator.executors`), so only the stage
+        name and event cross the process boundary.
+        """
+        if self.config.executor in ("process", "queue") and self._shared_pool is None:
+            return partial(run_batch_in_worker if batch else run_in_worker, stage)
+        component = getattr(self, stage)
+        return component.execute_batch if batch else component.execute
+
+    def _batched(self, stage):
+        """Return whether the ``stage`` component overrides :meth:`PipelineComponent.execute_batch`."""
+        execute_batch = getattr(type(getattr(self, stage)), "execute_batch", None)
+        return execute_batch is not None and execute_batch is not PipelineComponent.execute_batch
+
+    def _submit(self, pool, stage, event, label=None, batch=False):
+        """Submit one event for ``stage``, wrapped in :func:`timed_call` when instrumented.
+
+        ``label`` names the stage in timings (e.g. ``"scale"`` for MEASURE).
+        With ``batch``, ``event`` is a list executed by one ``execute_batch`` call.
+        """
+        return self._submit_many(pool, stage, [event], label, batch)[0]
+
+    def _submit_many(self, pool, stage, events, label=None, batch=False):
+        """Submit several events for ``stage`` (see :meth:`_submit`) and return their futures.
+
+        Executors with a ``submit_many`` method, such as the queue backend,
+        receive them in one call.
+        """
+        task = self._task(stage, batch)
+        if self._timings is None and self._history is None:
+            calls = [(task, (event,), {}) for event in events]
+        else:
+            # Payload sizes are only reported with ``instrument``; the runtime history needs none
+            sized = self._timings is not None
+            calls = [(timed_call, (task, event, label or stage, time.time(), sized), {}) for event in events]
+        submit_many = getattr(pool, "submit_many", None)
+        if submit_many is not None:
+            return submit_many(calls)
+        return [pool.submit(fn, *args, **kwargs) for fn, args, kwargs in calls]
+
+    def _collect(self, future):
+        """Return a future's result, recording its timing when instrumented and its runtime in the history."""
+        result = future.result()
+        if self._timings is None and self._history is None:
+            return result
+        result, record = result
+        self._note(result, record)
+        return result
+
+    def _note(self, result, record):
+        """Record a task's timing when instrumented and its runtime in the history."""
+        if self._timings is not None:
+            self._timings.record(record)
+        if self._history is not None and record["initiative_id"] is not None:
+            self._history.record(
+                record["stage"], record["initiative_id"], record["wall_seconds"], model_type_of(result)
+            )
+
+    def _span(self, stage):
+        """Time an in-orchestrator block when instrumented; no-op otherwise."""
+        if self._timings is None:
+            return nullcontext({})
+        return self._timings.span(stage)
+
+    def _journaled(self, label):
+        """Return ``{key: result}`` already journaled for ``label`` (empty without a journal)."""
+        return {} if self._journal is None else self._journal.load(label)
+
+    def _record(self, label, key, result):
+        """Journal one completed result, if the run is journaled."""
+        if self._journal is not None:
+            self._journal.record(label, key, result)
+
+    def _run_stage(self, stage, inputs, pool, label=None, on_result=None):
+        """Fan out per-initiative ``inputs``, skipping and journaling work per the run journal.
+
+        With ``deduplicate``, identical MEASURE work is executed once and its
+        result copied to the other initiatives. ``on_result`` is called on
+        every result, journaled ones first and then others as they complete.
+        """
+        label = label or stage
+        done = self._journaled(label)
+        position = {inp["initiative_id"]: index for index, inp in enumerate(inputs)}
+        results = self._collector()
+        missing = [inp for inp in inputs if inp["initiative_id"] not in done] if done else inputs
+        unique, duplicates = self._deduplicate(stage, missing)
+        for iid, index in position.items():
+            if iid in done:
+                results.add(index, done[iid])
+                if on_result is not None:
+                    on_result(done[iid])
+
+        def record(result):
+            for copy in self._copies(result, duplicates):
+                self._record(label, copy["initiative_id"], copy)
+                results.add(position[copy["initiative_id"]], copy)
+                if on_result is not None:
+                    on_result(copy)
+
+        def fail(inp, exc):
+            self._record_failure(label, [inp["initiative_id"], *duplicates.get(inp["initiative_id"], [])], exc)
+
+        self._fan_out(stage, unique, pool, label, on_result=record, on_error=fail)
+        # Failed initiatives (``on_failure: skip``) have no result and drop out here
+        return results.build()
+
+    def _record_failure(self, label, initiative_ids, exc):
+        """Record a skipped failure for each of ``initiative_ids``."""
+        error = f"{type(exc).__name__}: {exc}"
+        self._errors.extend({"stage": label, "initiative_id": iid, "error": error} for iid in initiative_ids)
+
+    def _deduplicate(self, stage, inputs):
+        """Split MEASURE ``inputs`` into distinct work and ``{executed id: [ids sharing its result]}``.
+
+        Inputs are identical when their measure config contents, referenced
+        data and sample size match (see :func:`measure_fingerprint`). Without
+        ``deduplicate``, or for other stages, every input is distinct.
+        """
+        if not (self.config.deduplicate and stage == "measure"):
+            return inputs, {}
+        unique, duplicates, executed_by_key = [], {}, {}
+        for inp in inputs:
+            key = measure_fingerprint(inp["measure_config"], inp.get("sample_size")) if inp["measure_config"] else None
+            if key is not None and key in executed_by_key:
+                duplicates.setdefault(executed_by_key[key], []).append(inp["initiative_id"])
+                continue
+            if key is not None:
+                executed_by_key[key] = inp["initiative_id"]
+            unique.append(inp)
+        return unique, duplicates
+
+    @staticmethod
+    def _copies(result, duplicates):
+        """Yield ``result`` followed by a copy for each initiative in ``duplicates`` sharing it."""
+        yield result
+        for iid in duplicates.get(result["initiative_id"], []):
+            yield {**result, "initiative_id": iid}
+
+    def _fan_out(self, stage, inputs, pool, label=None, on_result=None, on_error=None):
+        """Submit inputs to the pool and return results in submission order.
+
+        Results are collected as they complete. With ``on_result``, each one
+        is passed to it at that point instead of being kept, and the returned
+        slots stay ``None``. Failures and the stage timeout are handled by
+        :meth:`_drain`; with ``on_failure: skip`` and an ``on_error(input,
+        exception)`` handler, failed inputs are reported there and their
+        slots are left ``None``. With a stage limit (``stage_workers`` or
+        ``adaptive_concurrency``), at most that many inputs are in flight and
+        the rest are submitted as earlier ones complete. With
+        ``runtime_history``, inputs are submitted longest expected first.
+        """
+        if self._batched(stage):
+            return self._fan_out_batches(stage, inputs, pool, label, on_result, on_error)
+        label = label or stage
+        futures, submitted = {}, {}
+        queue = ((index, inputs[index]) for index in self._order(label, inputs))
+        results = [None] * len(inputs)
+
+        def refill(in_flight):
+            limit = self._limit(label)
+            count = len(inputs) if limit is None else max(0, limit - in_flight)
+            batch = list(islice(queue, count))
+            if not batch:
+                return []
+            new = self._submit_many(pool, stage, [inp for _, inp in batch], label)
+            now = time.monotonic()
+            for future, (index, _) in zip(new, batch):
+                futures[future] = index
+                submitted[future] = now
+            return new
+
+        def done(future, result):
+            self._observe(label, submitted.pop(future))
+            index = futures.pop(future)
+            if on_result is None:
+                results[index] = result
+            else:
+                on_result(result)
+
+        def fail(future, exc):
+            on_error(inputs[futures.pop(future)], exc)
+
+        timeout = self._drain(refill(0), label, done, fail if on_error is not None else None, refill)
+        if timeout is not None:
+            # Inputs never submitted miss the deadline too
+            for _, inp in queue:
+                on_error(inp, timeout)
+        return results
+
+    def _fan_out_batches(self, stage, inputs, pool, label=None, on_result=None, on_error=None):
+        """Like :meth:`_fan_out`, but split inputs into one ``execute_batch`` call per worker."""
+        workers = self._limit(label or stage) or self.config.max_workers
+        size = max(1, -(-len(inputs) // workers))
+        chunks = [inputs[k : k + size] for k in range(0, len(inputs), size)]
+        futures = {
+            future: index for index, future in enumerate(self._submit_many(pool, stage, chunks, label, batch=True))
+        }
+        results = [None] * len(chunks)
 
-    def _fan_out(self, component, inputs, pool):
-        """Submit inputs to the pool and collect results in submission order.
+        def done(future, batch):
+            index = futures.pop(future)
+            chunk = chunks[index]
+            assert len(batch) == len(chunk), f"{stage} execute_batch returned {len(batch)} results for {len(chunk)}"
+            if on_result is None:
+                results[index] = batch
+            else:
+                for result in batch:
+                    on_result(result)
 
-        If any component raises, the exception propagates immediately but
-        already-submitted futures continue running until the pool's context
-        manager shuts them down.
+        def fail(future, exc):
+            for inp in chunks[futures.pop(future)]:
+                on_error(inp, exc)
+
+        self._drain(list(futures), label or stage, done, fail if on_error is not None else None)
+        return [result for index, batch in enumerate(results) for result in (batch or [None] * len(chunks[index]))]
+
+    def _drain(self, futures, label, on_done, on_fail=None, refill=None):
+        """Collect ``futures`` as they complete, enforcing the ``label`` stage timeout.
+
+        ``on_done(future, result)`` receives each result. A failed or timed-out
+        future is passed to ``on_fail(future, exception)`` with ``on_failure:
+        skip``; otherwise queued futures are cancelled and the exception
+        propagates immediately. After each batch of completions,
+        ``refill(in_flight)`` may submit more futures to wait for. Returns the
+        timeout error if the stage timed out (with ``on_failure: skip``).
+        """
+        timeout = self.config.stage_timeouts.get(label)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        skip = self.config.on_failure == "skip" and on_fail is not None
+        pending = set(futures)
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = self._collect(future)
+                except Exception as exc:
+                    if not skip:
+                        for other in pending:
+                            other.cancel()
+                        raise
+                    on_fail(future, exc)
+                    continue
+                on_done(future, result)
+            if refill is not None:
+                pending.update(refill(len(pending)))
+            if pending and deadline is not None and time.monotonic() >= deadline:
+                self._timed_out = True
+                for future in pending:
+                    future.cancel()
+                exc = TimeoutError(f"{label} stage exceeded its {timeout}s timeout")
+                if not skip:
+                    raise exc
+                for future in pending:
+                    on_fail(future, exc)
+                return exc
+        return None
+
+    def _stream(self, measure_inputs, cost_by_id, pool):
+        """Run pilot MEASURE and EVALUATE as per-initiative chains.
+
+        Each initiative's EVALUATE is queued as soon as its own pilot
+        completes (as-completed scheduling) and submitted ahead of further
+        pilots. Pilots are fed to the pool at most ``max_workers`` (or the
+        ``measure`` stage limit) at a time so that queued EVALUATE work runs
+        ahead of pilots that have not started yet; EVALUATE is bounded by its
+        own stage limit, if any. Results are returned in input order, matching
+        :meth:`_fan_out`. Journaled results are reused and new ones journaled
+        as they complete.
+
+        Both stage timeouts are counted from the start of the phase, so
+        EVALUATE's deadline is the sum of the MEASURE and EVALUATE timeouts.
         """
-        futures = [pool.submit(component.execute, inp) for inp in inputs]
-        return [f.result() for f in futures]
+        pilot_done = self._journaled("measure")
+        eval_done = self._journaled("evaluate")
+        pilot_results, eval_results = self._collector(), self._collector()
+        in_flight = {}
+        submitted = {}
+        active = {"measure": 0, "evaluate": 0}
+        eval_queue = deque()
+        skip = self.config.on_failure == "skip"
+
+        timeouts = self.config.stage_timeouts
+        start = time.monotonic()
+        deadlines = {}
+        if "measure" in timeouts:
+            deadlines["measure"] = start + timeouts["measure"]
+        if "evaluate" in timeouts:
+            deadlines["evaluate"] = start + timeouts.get("measure", 0) + timeouts["evaluate"]
+
+        # Initiatives whose pilot is journaled but EVALUATE is not go straight to EVALUATE
+        for index, inp in enumerate(measure_inputs):
+            iid = inp["initiative_id"]
+            if iid in eval_done:
+                eval_results.add(index, eval_done[iid])
+            if iid in pilot_done:
+                pilot_results.add(index, pilot_done[iid])
+                if iid not in eval_done:
+                    eval_queue.append((index, pilot_done[iid]))
+
+        index_by_id = {inp["initiative_id"]: index for index, inp in enumerate(measure_inputs)}
+        unique, duplicates = self._deduplicate(
+            "measure", [inp for inp in measure_inputs if inp["initiative_id"] not in pilot_done]
+        )
+        pending_inputs = ((index_by_id[unique[k]["initiative_id"]], unique[k]) for k in self._order("measure", unique))
+
+        def launch(stage, index, event):
+            future = self._submit(pool, stage, event)
+            in_flight[future] = (stage, index)
+            submitted[future] = time.monotonic()
+            active[stage] += 1
+
+        def settle(future):
+            stage, index = in_flight.pop(future)
+            active[stage] -= 1
+            return stage, index, submitted.pop(future)
+
+        def pump():
+            """Submit queued EVALUATE work, then pilots, up to each stage's limit."""
+            eval_limit = self._limit("evaluate")
+            while eval_queue and (eval_limit is None or active["evaluate"] < eval_limit):
+                index, result = eval_queue.popleft()
+                launch("evaluate", index, {**result, "cost_to_scale": cost_by_id[result["initiative_id"]]})
+            pilot_limit = self._limit("measure") or self.config.max_workers
+            while active["measure"] < pilot_limit:
+                item = next(pending_inputs, None)
+                if item is None:
+                    break
+                launch("measure", *item)
+
+        def fail(stage, index, exc):
+            if not skip:
+                for future in in_flight:
+                    future.cancel()
+                raise exc
+            iid = measure_inputs[index]["initiative_id"]
+            self._record_failure(stage, [iid, *duplicates.get(iid, [])] if stage == "measure" else [iid], exc)
+
+        pump()
+        while in_flight:
+            waiting = [deadlines[stage] for stage, _ in in_flight.values() if stage in deadlines]
+            timeout = max(0.0, min(waiting) - time.monotonic()) if waiting else None
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, index, sent = settle(future)
+                try:
+                    result = self._collect(future)
+                except Exception as exc:
+                    fail(stage, index, exc)
+                    continue
+                self._observe(stage, sent)
+                if stage == "measure":
+                    for copy in self._copies(result, duplicates):
+                        self._record("measure", copy["initiative_id"], copy)
+                        pilot_results.add(index_by_id[copy["initiative_id"]], copy)
+                        eval_queue.append((index_by_id[copy["initiative_id"]], copy))
+                else:
+                    self._record("evaluate", result["initiative_id"], result)
+                    eval_results.add(index, result)
+
+            now = time.monotonic()
+            for stage, deadline in deadlines.items():
+                if now < deadline:
+                    continue
+                expired = [f for f, (s, _) in in_flight.items() if s == stage]
+                # Work not yet submitted misses the deadline too
+                if stage == "measure":
+                    expired_inputs = [index for index, _ in pending_inputs]
+                else:
+                    expired_inputs = [index for index, _ in eval_queue]
+                    eval_queue.clear()
+                if not expired and not expired_inputs:
+                    continue
+                self._timed_out = True
+                exc = TimeoutError(f"{stage} stage exceeded its {timeouts[stage]}s timeout")
+                for future in expired:
+                    future.cancel()
+                    fail(stage, settle(future)[1], exc)
+                for index in expired_inputs:
+                    fail(stage, index, exc)
+            pump()
+
+        return pilot_results.build(), eval_results.build()
 
     def _generate_reports(self, pilot_results, eval_results, alloc_result, scale_results):
         """Build outcome reports comparing pilot predictions to scale actuals."""
@@ -103,24 +817,42 @@ class Orchestrator:
         eval_by_id = {e["initiative_id"]: e for e in eval_results}
         scale_by_id = {s["initiative_id"]: s for s in scale_results}
 
-        reports = []
+        reports = self._collector()
         for iid in alloc_result["selected_initiatives"]:
-            pilot = pilot_by_id[iid]
-            evalu = eval_by_id[iid]
-            scale = scale_by_id[iid]
-            predicted = alloc_result["predicted_returns"][iid]
-            actual = scale["effect_estimate"]
-
-            report = OutcomeReport(
-                initiative_id=iid,
-                predicted_return=predicted,
-                actual_return=actual,
-                prediction_error=actual - predicted,
-                sample_size_pilot=pilot["sample_size"],
-                sample_size_scale=scale["sample_size"],
-                budget_allocated=alloc_result["budget_allocated"][iid],
-                confidence_score=evalu["confidence"],
-                model_type=evalu["model_type"],
-            )
-            reports.append(asdict(report))
-        return reports
+            if iid not in scale_by_id:
+                # Scale measurement failed and was skipped (``on_failure: skip``)
+                continue
+            reports.add(len(reports), self._report(pilot_by_id[iid], eval_by_id[iid], alloc_result, scale_by_id[iid]))
+        return reports.build()
+
+    def _report_writer(self, pilot_results, eval_results, alloc_result, sink):
+        """Return a callback writing each scale result's outcome report to ``sink`` (``None`` without one)."""
+        if sink is None:
+            return None
+        pilot_by_id = {p["initiative_id"]: p for p in pilot_results}
+        eval_by_id = {e["initiative_id"]: e for e in eval_results}
+
+        def write(scale):
+            iid = scale["initiative_id"]
+            sink.write(self._report(pilot_by_id[iid], eval_by_id[iid], alloc_result, scale))
+
+        return write
+
+    @staticmethod
+    def _report(pilot, evalu, alloc_result, scale):
+        """Build one outcome report comparing a pilot prediction to its scale actual."""
+        iid = scale["initiative_id"]
+        predicted = alloc_result["predicted_returns"][iid]
+        actual = scale["effect_estimate"]
+        report = OutcomeReport(
+            initiative_id=iid,
+            predicted_return=predicted,
+            actual_return=actual,
+            prediction_error=actual - predicted,
+            sample_size_pilot=pilot["sample_size"],
+            sample_size_scale=scale["sample_size"],
+            budget_allocated=alloc_result["budget_allocated"][iid],
+            confidence_score=evalu["confidence"],
+            model_type=evalu["model_type"],
+        )
+        return asdict(report)
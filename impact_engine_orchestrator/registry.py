@@ -1,25 +1,62 @@
-"""Component registry mapping short names to class objects."""
+"""Component registry mapping short names to lazily imported classes.
 
-from impact_engine_evaluate import Evaluate
-from portfolio_allocation import MinimaxRegretAllocate
+Built-in components are listed as ``"module:Class"`` paths and only imported
+when first built, so loading configs or building the orchestrator's other
+stages never pays for importing unrelated component stacks. Third-party
+packages can register components under the ``impact_engine_orchestrator.components``
+entry-point group, and a stage config may also name any class directly by
+dotted path (``"package.module:Class"`` or ``"package.module.Class"``).
+"""
+
+from functools import lru_cache
+from importlib import import_module
+from importlib.metadata import entry_points
 
-from impact_engine_orchestrator.components.allocate.mock import MockAllocate
 from impact_engine_orchestrator.components.base import PipelineComponent
-from impact_engine_orchestrator.components.measure.measure import Measure
 from impact_engine_orchestrator.config import StageConfig
 
-COMPONENT_REGISTRY: dict[str, type[PipelineComponent]] = {
-    "Measure": Measure,
-    "MockAllocate": MockAllocate,
-    "Evaluate": Evaluate,
-    "MinimaxRegretAllocate": MinimaxRegretAllocate,
+ENTRY_POINT_GROUP = "impact_engine_orchestrator.components"
+
+COMPONENT_REGISTRY: dict[str, str] = {
+    "Measure": "impact_engine_orchestrator.components.measure.measure:Measure",
+    "MockAllocate": "impact_engine_orchestrator.components.allocate.mock:MockAllocate",
+    "KnapsackAllocate": "impact_engine_orchestrator.components.allocate.knapsack:KnapsackAllocate",
+    "Evaluate": "impact_engine_evaluate:Evaluate",
+    "BatchEvaluate": "impact_engine_orchestrator.components.evaluate.batch:BatchEvaluate",
+    "MinimaxRegretAllocate": "portfolio_allocation:MinimaxRegretAllocate",
 }
 
 
+@lru_cache(maxsize=1)
+def _entry_points() -> dict:
+    """Return ``{name: EntryPoint}`` for installed third-party components (scanned once)."""
+    return {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def _import_path(path: str) -> type:
+    """Import ``"module:Class"`` or ``"module.Class"``."""
+    module_name, _, attr = path.partition(":") if ":" in path else path.rpartition(".")
+    return getattr(import_module(module_name), attr)
+
+
+def available() -> list[str]:
+    """Return the names of all built-in and entry-point components."""
+    return sorted({*COMPONENT_REGISTRY, *_entry_points()})
+
+
+@lru_cache(maxsize=None)
+def resolve(name: str) -> type[PipelineComponent]:
+    """Return the component class for a registry name, entry-point name or dotted path."""
+    if name in COMPONENT_REGISTRY:
+        return _import_path(COMPONENT_REGISTRY[name])
+    if name in _entry_points():
+        return _entry_points()[name].load()
+    if "." in name or ":" in name:
+        return _import_path(name)
+    raise KeyError(f"Unknown component {name!r}. Available: {available()}")
+
+
 def build(stage_config: StageConfig) -> PipelineComponent:
     """Construct a component from a StageConfig."""
-    name = stage_config.component
-    if name not in COMPONENT_REGISTRY:
-        raise KeyError(f"Unknown component {name!r}. Available: {sorted(COMPONENT_REGISTRY)}")
-    cls = COMPONENT_REGISTRY[name]
+    cls = resolve(stage_config.component)
     return cls(**stage_config.kwargs)
@@ -0,0 +1,415 @@
+"""Column-oriented storage for per-initiative run results.
+
+Enabled with ``result_format: columnar`` in the orchestrator YAML. Each
+result section becomes a :class:`ResultTable`: numeric fields are stored as
+NumPy arrays, dict fields (e.g. ``diagnostics``) as a :class:`StructColumn`
+with one column per key, and the remaining fields as one list per column,
+instead of one dict per initiative. Tables are filled row by row as results
+arrive (see :class:`ResultTableBuilder`), so a run never holds its results
+as dicts. They still behave like the list of dicts they replace (indexing,
+iteration, ``==``), yielding lightweight :class:`RowView` objects.
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from enum import Enum
+
+import numpy as np
+
+# array typecodes of the numeric column kinds
+_TYPECODES = {bool: "b", int: "q", float: "d"}
+_DTYPES = {"b": bool, "q": np.int64, "d": np.float64}
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _python(value):
+    """Return NumPy scalars as the equivalent Python object."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _take(values, indices):
+    """Return the entries of a column at ``indices``."""
+    if isinstance(values, (np.ndarray, StructColumn)):
+        return values[indices]
+    return [values[k] for k in indices]
+
+
+class RowView(Mapping):
+    """Read-only dict-like view of one row of a :class:`ResultTable`."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ResultTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key):
+        """Return the row's value for column ``key`` as a Python object."""
+        return _python(self._table._columns[key][self._index])
+
+    def __iter__(self):
+        """Iterate over column names."""
+        return iter(self._table._columns)
+
+    def __len__(self):
+        """Return the number of columns."""
+        return len(self._table._columns)
+
+    def __repr__(self):
+        """Show the row as a dict."""
+        return repr(dict(self))
+
+
+class StructColumn(Sequence):
+    """Column of dicts stored as one column per key.
+
+    Rows may have different keys; ``present`` marks which rows have a key
+    (``None`` when all do). Indexing returns a new dict per row.
+
+    Parameters
+    ----------
+    fields : dict
+        Key to column (NumPy array, list or :class:`StructColumn`), all of
+        length ``length``.
+    present : dict
+        Key to boolean NumPy array, for the keys some rows lack.
+    length : int
+        Number of rows.
+    """
+
+    def __init__(self, fields: dict, present: dict, length: int):
+        self._fields = fields
+        self._present = present
+        self._length = length
+
+    @property
+    def fields(self) -> list[str]:
+        """Keys found in any row."""
+        return list(self._fields)
+
+    def field(self, name: str):
+        """Return one key's column as stored; rows lacking the key hold a placeholder."""
+        return self._fields[name]
+
+    def present(self, name: str) -> np.ndarray:
+        """Return which rows have key ``name``."""
+        mask = self._present.get(name)
+        return np.ones(self._length, dtype=bool) if mask is None else mask
+
+    def __len__(self):
+        """Return the number of rows."""
+        return self._length
+
+    def __getitem__(self, index):
+        """Return one row as a dict, or a column of the rows at a slice or index array."""
+        if isinstance(index, (slice, np.ndarray, list)):
+            indices = np.arange(self._length)[index]
+            return StructColumn(
+                {name: _take(values, indices) for name, values in self._fields.items()},
+                {name: mask[indices] for name, mask in self._present.items()},
+                len(indices),
+            )
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("StructColumn index out of range")
+        return {
+            name: _python(values[index])
+            for name, values in self._fields.items()
+            if name not in self._present or self._present[name][index]
+        }
+
+    def __eq__(self, other):
+        """Compare row by row with another sequence of dicts."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(other) == len(self) and all(row == other_row for row, other_row in zip(self, other))
+
+    def __repr__(self):
+        """Summarize the column's shape."""
+        return f"StructColumn(rows={self._length}, fields={self.fields})"
+
+    def to_arrow(self, mask=None):
+        """Return a ``pyarrow.StructArray``; rows lacking a key hold null for it.
+
+        ``mask`` marks rows that are null as a whole.
+        """
+        import pyarrow as pa
+
+        if not self._fields:
+            rows = [{}] * self._length if mask is None else [None if null else {} for null in mask]
+            return pa.array(rows, type=pa.struct([]))
+        mask = None if mask is None else pa.array(mask)
+        arrays = []
+        for name, values in self._fields.items():
+            absent = self._present.get(name)
+            absent = None if absent is None else ~absent
+            if isinstance(values, StructColumn):
+                arrays.append(values.to_arrow(absent))
+            else:
+                arrays.append(pa.array(_exportable(values), mask=absent))
+        return pa.StructArray.from_arrays(arrays, names=list(self._fields), mask=mask)
+
+
+class _ColumnBuilder:
+    """Accumulate one column's values, as compactly as the values so far allow.
+
+    All-bool, all-int (within int64) and all-float values go into a typed
+    ``array``; dicts into per-key builders (a :class:`StructColumn`);
+    anything else, or a mix, into a list. A mix of ints and floats is kept
+    as a list too, so that every value reads back exactly as it was added.
+    """
+
+    __slots__ = ("_kind", "_values", "_fields", "_present", "_length")
+
+    def __init__(self):
+        self._kind = None
+        self._values = None
+        self._fields = None
+        self._present = None
+        self._length = 0
+
+    def append(self, value) -> None:
+        kind = self._kind_of(value)
+        if self._kind is None:
+            self._start(kind)
+        elif kind != self._kind and self._kind != "object":
+            self._values = self._materialize()
+            self._kind, self._fields, self._present = "object", None, None
+        if self._kind == "struct":
+            self._append_struct(value)
+        elif self._kind == "object":
+            self._values.append(sys.intern(value) if type(value) is str else value)
+        else:
+            self._values.append(value)
+        self._length += 1
+
+    def pad(self) -> None:
+        """Append a placeholder for a row that has no value here (see :class:`StructColumn`)."""
+        if self._kind == "struct":
+            self._append_struct({})
+        elif self._kind is not None:
+            self._values.append(None if self._kind == "object" else 0)
+        self._length += 1
+
+    @staticmethod
+    def _kind_of(value) -> str:
+        kind = _TYPECODES.get(type(value))
+        if kind is None:
+            if type(value) is dict:
+                return "struct"
+            if isinstance(value, np.bool_):
+                return "b"
+            if isinstance(value, np.integer):
+                kind = "q"
+            elif isinstance(value, np.floating):
+                return "d"
+            else:
+                return "object"
+        if kind == "q" and not _INT64_MIN <= value <= _INT64_MAX:
+            return "object"
+        return kind
+
+    def _start(self, kind: str) -> None:
+        """Set the column's kind, with placeholders for the rows padded so far."""
+        self._kind = kind
+        if kind == "struct":
+            self._fields, self._present = {}, {}
+        elif kind == "object":
+            self._values = [None] * self._length
+        else:
+            self._values = array(kind, bytes(self._length * array(kind).itemsize))
+
+    def _materialize(self) -> list:
+        """Return the values so far as Python objects."""
+        if self._kind == "struct":
+            return list(self._build())
+        if self._kind == "b":
+            return [bool(v) for v in self._values]
+        return self._values.tolist()
+
+    def _append_struct(self, value: dict) -> None:
+        for name in value:
+            if name not in self._fields:
+                # A key first seen now is absent from every earlier row
+                builder = self._fields[name] = _ColumnBuilder()
+                for _ in range(self._length):
+                    builder.pad()
+                self._present[name] = array("b", bytes(self._length))
+        for name, builder in self._fields.items():
+            if name in value:
+                builder.append(value[name])
+                self._present[name].append(True)
+            else:
+                builder.pad()
+                self._present[name].append(False)
+
+    def _build(self):
+        if self._kind == "struct":
+            present = {}
+            for name, mask in self._present.items():
+                mask = np.array(mask, dtype=bool)
+                if not mask.all():
+                    present[name] = mask
+            return StructColumn({name: b._build() for name, b in self._fields.items()}, present, self._length)
+        if self._kind in _DTYPES:
+            return np.array(self._values, dtype=_DTYPES[self._kind])
+        return self._values if self._values is not None else []
+
+
+class ResultTableBuilder:
+    """Fill a :class:`ResultTable` one result at a time.
+
+    Each result is split into its columns when it is added, so only the
+    columns are kept. Results may arrive in any order; ``position`` gives
+    a result's place in the built table. All results must have the same
+    keys.
+    """
+
+    def __init__(self):
+        self._columns = {}
+        self._positions = array("q")
+
+    def __len__(self):
+        """Return the number of results added."""
+        return len(self._positions)
+
+    def add(self, position: int, record: Mapping) -> None:
+        """Add ``record`` as the row at ``position`` (relative to the other rows' positions)."""
+        if not self._columns and not self._positions:
+            self._columns = {name: _ColumnBuilder() for name in record}
+        assert record.keys() == self._columns.keys(), (
+            f"result fields {sorted(record)} differ from {sorted(self._columns)}"
+        )
+        for name, builder in self._columns.items():
+            builder.append(record[name])
+        self._positions.append(position)
+
+    def build(self) -> "ResultTable":
+        """Return the rows added so far as a table ordered by position."""
+        columns = {name: builder._build() for name, builder in self._columns.items()}
+        positions = np.frombuffer(self._positions, dtype=np.int64) if self._positions else np.array([], np.int64)
+        if np.any(positions[1:] < positions[:-1]):
+            order = np.argsort(positions, kind="stable")
+            columns = {name: _take(values, order) for name, values in columns.items()}
+        return ResultTable(columns)
+
+
+class RecordCollector:
+    """Collect results as plain dicts; the records-format counterpart of :class:`ResultTableBuilder`."""
+
+    def __init__(self):
+        self._records = {}
+
+    def __len__(self):
+        """Return the number of results added."""
+        return len(self._records)
+
+    def add(self, position: int, record: dict) -> None:
+        """Add ``record`` as the result at ``position``."""
+        self._records[position] = record
+
+    def build(self) -> list[dict]:
+        """Return the results ordered by position."""
+        return [self._records[position] for position in sorted(self._records)]
+
+
+class ResultTable(Sequence):
+    """Immutable table of result rows sharing one set of fields.
+
+    Parameters
+    ----------
+    columns : dict
+        Column name to NumPy array, :class:`StructColumn` or list, all of
+        the same length.
+    """
+
+    def __init__(self, columns: dict):
+        lengths = {len(values) for values in columns.values()}
+        assert len(lengths) <= 1, f"columns must have equal lengths, got {sorted(lengths)}"
+        self._columns = columns
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(cls, records) -> "ResultTable":
+        """Build a table from result dicts with identical keys."""
+        builder = ResultTableBuilder()
+        for position, record in enumerate(records):
+            builder.add(position, record)
+        return builder.build()
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names."""
+        return list(self._columns)
+
+    def column(self, name: str):
+        """Return one column as stored (NumPy array, :class:`StructColumn` or list)."""
+        return self._columns[name]
+
+    def __len__(self):
+        """Return the number of rows."""
+        return self._length
+
+    def __getitem__(self, index):
+        """Return a :class:`RowView` for an integer index, or a table for a slice."""
+        if isinstance(index, slice):
+            return ResultTable({name: values[index] for name, values in self._columns.items()})
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ResultTable index out of range")
+        return RowView(self, index)
+
+    def __eq__(self, other):
+        """Compare row by row with another table or sequence of dicts."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(other) == len(self) and all(dict(row) == dict(other_row) for row, other_row in zip(self, other))
+
+    def __repr__(self):
+        """Summarize the table's shape."""
+        return f"ResultTable(rows={self._length}, columns={self.columns})"
+
+    def to_records(self) -> list[dict]:
+        """Return the rows as a list of plain dicts."""
+        return [dict(row) for row in self]
+
+    def to_arrow(self):
+        """Return a ``pyarrow.Table``; numeric columns are passed without copying."""
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError("to_arrow requires pyarrow: pip install impact-engine-orchestrator[columnar]") from exc
+        return pa.table(
+            {
+                name: values.to_arrow() if isinstance(values, StructColumn) else pa.array(_exportable(values))
+                for name, values in self._columns.items()
+            }
+        )
+
+    def to_pandas(self):
+        """Return a ``pandas.DataFrame`` with one row per result; dict fields hold dicts."""
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                name: list(values) if isinstance(values, StructColumn) else _exportable(values)
+                for name, values in self._columns.items()
+            }
+        )
+
+    def to_parquet(self, path: str) -> None:
+        """Write the table to a Parquet file."""
+        table = self.to_arrow()
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, path)
+
+
+def _exportable(values):
+    """Encode enums (e.g. ModelType) by value for Arrow and pandas."""
+    if isinstance(values, list) and values and isinstance(values[0], Enum):
+        return [v.value if isinstance(v, Enum) else v for v in values]
+    return values
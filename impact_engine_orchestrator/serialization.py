@@ -0,0 +1,39 @@
+"""JSON encoding of stage results for on-disk persistence."""
+
+import json
+from collections.abc import Mapping, Sequence
+from enum import Enum
+
+from impact_engine_orchestrator.contracts.types import ModelType
+
+
+def _default(obj):
+    """Encode enums (e.g. ModelType) by value, and columnar results as lists of dicts."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, Sequence):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _object_hook(obj: dict) -> dict:
+    """Restore ``model_type`` fields to ModelType, as the contracts expect."""
+    value = obj.get("model_type")
+    if isinstance(value, str):
+        try:
+            obj["model_type"] = ModelType(value)
+        except ValueError:
+            pass
+    return obj
+
+
+def dumps(obj) -> str:
+    """Serialize a stage result (or a structure of them) to JSON."""
+    return json.dumps(obj, default=_default)
+
+
+def loads(text: str):
+    """Deserialize JSON written by :func:`dumps`."""
+    return json.loads(text, object_hook=_object_hook)
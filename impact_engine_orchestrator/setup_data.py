@@ -0,0 +1,144 @@
+"""Generate simulated product catalogs for each initiative (``impact-engine-setup-data``).
+
+This is a setup step that runs BEFORE the orchestrator: each initiative with
+a simulator config ``<simulator_dir>/<initiative_id>.yaml`` gets the products
+file its measure config reads (``DATA.SOURCE.CONFIG.path``). Initiatives are
+simulated in parallel worker processes, and an initiative is skipped when a
+hash of its simulator config matches the one recorded next to its output by
+the previous generation.
+
+Alongside the CSV, a Parquet copy (``products.parquet``) is written when
+pyarrow is installed; with the Measure adapter's data cache enabled,
+impact_engine's plain ``read_csv`` calls of the CSV are served from that
+copy instead (see
+:mod:`impact_engine_orchestrator.data_cache`).
+
+Usage::
+
+    impact-engine-setup-data --config docs/source/impact-loop/config.yaml
+"""
+
+import argparse
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import yaml
+
+from impact_engine_orchestrator.config import load_config
+from impact_engine_orchestrator.fingerprint import SIMULATOR, file_hash, read_sidecar, write_sidecar
+
+
+def _products_path(measure_config_path: str) -> Path:
+    """Read the products output path from a measure config."""
+    with open(measure_config_path) as f:
+        measure_config = yaml.safe_load(f)
+    return Path(measure_config["DATA"]["SOURCE"]["CONFIG"]["path"])
+
+
+def simulator_hash(sim_config: Path) -> str:
+    """Hash a simulator config's contents."""
+    return file_hash(sim_config)
+
+
+def _is_current(output_path: Path, digest: str) -> bool:
+    """Return whether ``output_path`` was generated from a simulator config with hash ``digest``."""
+    return output_path.exists() and read_sidecar(output_path, SIMULATOR) == digest
+
+
+def generate_initiative(sim_config: str, output_path: str, digest: str) -> int:
+    """Simulate one initiative's products, write them and return the number of rows.
+
+    Runs in a worker process. The CSV is written first and the Parquet copy
+    is made from the CSV as read back, so both give identical frames, then
+    marked as a copy of that CSV for the data cache; the hash sidecar is
+    written last, so an interrupted generation is redone.
+    """
+    try:
+        from online_retail_simulator.simulate import simulate_products
+    except ImportError as exc:
+        raise ImportError("setup_data requires online_retail_simulator") from exc
+    import pandas as pd
+
+    from impact_engine_orchestrator import data_cache
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    products = simulate_products(sim_config).load_df("products")
+    products.to_csv(output_path, index=False)
+    if importlib.util.find_spec("pyarrow") is not None:
+        pd.read_csv(output_path).to_parquet(output_path.with_suffix(".parquet"), index=False)
+        data_cache.mark_columnar_copy(output_path)
+    write_sidecar(output_path, SIMULATOR, digest)
+    return len(products)
+
+
+def generate(config_path: str, simulator_dir: str | None = None, max_workers: int | None = None, force=False) -> dict:
+    """Generate data for every initiative in an orchestrator config.
+
+    Parameters
+    ----------
+    config_path : str
+        Orchestrator YAML listing the initiatives.
+    simulator_dir : str, optional
+        Directory of per-initiative simulator configs (default:
+        ``configs/simulator`` next to ``config_path``).
+    max_workers : int, optional
+        Worker processes (default: one per CPU); ``1`` generates in the
+        calling process.
+    force : bool
+        Regenerate even when the simulator config is unchanged.
+
+    Returns
+    -------
+    dict
+        ``{initiative_id: status}`` with status ``"generated"``,
+        ``"unchanged"`` or ``"no simulator config"``.
+    """
+    config = load_config(config_path)
+    simulator_dir = Path(simulator_dir) if simulator_dir else Path(config_path).parent / "configs" / "simulator"
+
+    status, jobs = {}, {}
+    for initiative in config.initiatives:
+        iid = initiative.initiative_id
+        sim_config = simulator_dir / f"{iid}.yaml"
+        if not sim_config.exists():
+            status[iid] = "no simulator config"
+            continue
+        output_path = _products_path(initiative.measure_config)
+        digest = simulator_hash(sim_config)
+        if not force and _is_current(output_path, digest):
+            status[iid] = "unchanged"
+            continue
+        jobs[iid] = (str(sim_config), str(output_path), digest)
+
+    if max_workers == 1 or len(jobs) <= 1:
+        for iid, job in jobs.items():
+            generate_initiative(*job)
+            status[iid] = "generated"
+    elif jobs:
+        with ProcessPoolExecutor(max_workers=min(max_workers or len(jobs), len(jobs))) as pool:
+            futures = {iid: pool.submit(generate_initiative, *job) for iid, job in jobs.items()}
+            for iid, future in futures.items():
+                future.result()
+                status[iid] = "generated"
+    return {initiative.initiative_id: status[initiative.initiative_id] for initiative in config.initiatives}
+
+
+def main(argv=None, default_config: str | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Generate initiative input data")
+    parser.add_argument("--config", type=str, default=default_config, required=default_config is None)
+    parser.add_argument("--simulator-dir", type=str, default=None)
+    parser.add_argument("--max-workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="regenerate unchanged initiatives")
+    args = parser.parse_args(argv)
+
+    status = generate(args.config, args.simulator_dir, args.max_workers, args.force)
+    for iid, outcome in status.items():
+        print(f"  {outcome.upper():<20} {iid}")
+    print("\nSetup complete.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Destinations for outcome reports emitted while a run is in progress.
+
+Passing a sink to :meth:`Orchestrator.run <impact_engine_orchestrator.orchestrator.Orchestrator.run>`
+hands each outcome report to it as soon as the initiative's scale
+measurement completes, instead of collecting every report into the run
+result. Sinks hold at most ``buffer_size`` reports before writing them out,
+so memory stays bounded however large the portfolio.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from enum import Enum
+
+from impact_engine_orchestrator import serialization
+
+
+class ReportSink(ABC):
+    """Buffering base class for outcome report sinks.
+
+    Subclasses implement :meth:`write_batch`; :meth:`write` buffers reports
+    and passes them on in batches of ``buffer_size``. Sinks are context
+    managers, and closing one flushes what is still buffered. The
+    orchestrator flushes, but does not close, the sink at the end of a run.
+
+    Parameters
+    ----------
+    buffer_size : int
+        Reports buffered before :meth:`write_batch` is called.
+    """
+
+    def __init__(self, buffer_size: int = 1000):
+        assert buffer_size > 0, f"buffer_size must be positive, got {buffer_size}"
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._buffer = []
+
+    def __enter__(self):
+        """Return the sink."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Flush and close the sink."""
+        self.close()
+
+    def write(self, report: dict) -> None:
+        """Add one outcome report."""
+        self._buffer.append(report)
+        self.count += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out buffered reports."""
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self.write_batch(batch)
+
+    def close(self) -> None:
+        """Flush buffered reports and release resources."""
+        self.flush()
+
+    @abstractmethod
+    def write_batch(self, reports: list[dict]) -> None:
+        """Write a batch of outcome reports."""
+
+
+class JsonlSink(ReportSink):
+    """Append reports to a JSON-lines file, one report per line.
+
+    Parameters
+    ----------
+    path : str
+        Output file, truncated on open.
+    buffer_size : int
+        Reports buffered between writes.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1000):
+        super().__init__(buffer_size)
+        self.path = path
+        self._file = open(path, "w")
+
+    def write_batch(self, reports: list[dict]) -> None:
+        """Write reports as JSON lines and flush them to disk."""
+        self._file.write("".join(serialization.dumps(report) + "\n" for report in reports))
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if not self._file.closed:
+            super().close()
+            self._file.close()
+
+
+class ParquetSink(ReportSink):
+    """Write reports to a Parquet file, one row group per ``row_group_size`` reports.
+
+    Requires pyarrow (``pip install impact-engine-orchestrator[columnar]``).
+    The file is complete once the sink is closed; no file is written if no
+    report was.
+
+    Parameters
+    ----------
+    path : str
+        Output file.
+    row_group_size : int
+        Reports per row group, and so the number buffered in memory.
+    """
+
+    def __init__(self, path: str, row_group_size: int = 10000):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:
+            raise ImportError("ParquetSink requires pyarrow: pip install impact-engine-orchestrator[columnar]") from exc
+        super().__init__(row_group_size)
+        self.path = path
+        self._writer = None
+
+    def write_batch(self, reports: list[dict]) -> None:
+        """Write reports as one row group."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        rows = [{k: v.value if isinstance(v, Enum) else v for k, v in report.items()} for report in reports]
+        if self._writer is None:
+            table = pa.Table.from_pylist(rows)
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = pa.Table.from_pylist(rows, schema=self._writer.schema)
+        self._writer.write_table(table, row_group_size=len(rows))
+
+    def close(self) -> None:
+        """Flush and finalize the file."""
+        super().close()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class CallbackSink(ReportSink):
+    """Pass every report to ``callback(report)``, in batches of ``buffer_size`` (default: immediately)."""
+
+    def __init__(self, callback: Callable[[dict], None], buffer_size: int = 1):
+        super().__init__(buffer_size)
+        self.callback = callback
+
+    def write_batch(self, reports: list[dict]) -> None:
+        """Call the callback on each report."""
+        for report in reports:
+            self.callback(report)
+
+
+def read_jsonl(path: str) -> list[dict]:
+    """Read back the reports written by a :class:`JsonlSink`."""
+    with open(path) as f:
+        return [serialization.loads(line) for line in f if line.strip()]
@@ -0,0 +1,234 @@
+"""Persistent, indexed store of outcome reports across runs.
+
+Enabled with ``run_store: <path>`` in the orchestrator YAML: every run
+appends its outcome reports to an embedded SQLite database in a single bulk
+transaction, tagged with the run id and a UTC timestamp. :class:`RunStore`
+then answers history and calibration queries (e.g. mean prediction error
+by model type) from indexes, without re-reading any run's output.
+Aggregates not split by initiative are served from per-run, per-model-type
+rollups written alongside the reports, so they scan one row per run and
+model type rather than one per report.
+"""
+
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from enum import Enum
+
+from impact_engine_orchestrator.contracts.types import ModelType
+
+REPORT_COLUMNS = (
+    "initiative_id",
+    "predicted_return",
+    "actual_return",
+    "prediction_error",
+    "sample_size_pilot",
+    "sample_size_scale",
+    "budget_allocated",
+    "confidence_score",
+    "model_type",
+)
+GROUP_COLUMNS = ("model_type", "initiative_id", "run_id", "day")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outcome_reports (
+    run_id TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    initiative_id TEXT NOT NULL,
+    predicted_return REAL,
+    actual_return REAL,
+    prediction_error REAL,
+    sample_size_pilot INTEGER,
+    sample_size_scale INTEGER,
+    budget_allocated REAL,
+    confidence_score REAL,
+    model_type TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_reports_run ON outcome_reports (run_id);
+CREATE INDEX IF NOT EXISTS ix_reports_initiative ON outcome_reports (initiative_id, recorded_at);
+CREATE INDEX IF NOT EXISTS ix_reports_recorded_at ON outcome_reports (recorded_at);
+CREATE INDEX IF NOT EXISTS ix_reports_model_type ON outcome_reports (model_type, recorded_at, prediction_error);
+CREATE TABLE IF NOT EXISTS report_rollups (
+    run_id TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    model_type TEXT,
+    count INTEGER NOT NULL,
+    sum_error REAL,
+    sum_abs_error REAL,
+    min_error REAL,
+    max_error REAL
+);
+CREATE INDEX IF NOT EXISTS ix_rollups_run ON report_rollups (run_id);
+"""
+_ROLLUP = (
+    "INSERT INTO report_rollups SELECT run_id, recorded_at, model_type, COUNT(*), SUM(prediction_error), "
+    "SUM(ABS(prediction_error)), MIN(prediction_error), MAX(prediction_error) FROM outcome_reports "
+    "WHERE run_id = ? GROUP BY model_type"
+)
+_INSERT = (
+    f"INSERT INTO outcome_reports (run_id, recorded_at, {', '.join(REPORT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(REPORT_COLUMNS) + 2))})"
+)
+
+
+def _timestamp(value) -> str:
+    """Return ``value`` (date, datetime or ISO string) as the stored ISO-8601 text; naive datetimes are taken as UTC."""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _model_type(value):
+    """Restore stored model types to ModelType where possible."""
+    try:
+        return ModelType(value)
+    except ValueError:
+        return value
+
+
+class RunStore:
+    """SQLite-backed history of outcome reports.
+
+    Timestamps are stored as ISO-8601 UTC text, so date filters accept
+    ``date``/``datetime`` objects or ISO strings (``"2026-10"`` and
+    ``"2026-10-16"`` both work as lower bounds).
+
+    Parameters
+    ----------
+    path : str
+        Database file, created if missing (``":memory:"`` for a throwaway store).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        """Return the store."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+    def write(self, run_id: str, reports: list, recorded_at=None) -> int:
+        """Store a run's outcome reports in one transaction and return how many were written.
+
+        Writing a run id again replaces that run's reports, so a resumed run
+        is stored once.
+        """
+        recorded_at = _timestamp(recorded_at if recorded_at is not None else datetime.now(timezone.utc))
+        rows = [
+            (run_id, recorded_at, *(_column_value(report[column]) for column in REPORT_COLUMNS)) for report in reports
+        ]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM outcome_reports WHERE run_id = ?", (run_id,))
+            self._conn.execute("DELETE FROM report_rollups WHERE run_id = ?", (run_id,))
+            self._conn.executemany(_INSERT, rows)
+            self._conn.execute(_ROLLUP, (run_id,))
+        return len(rows)
+
+    def query(
+        self,
+        initiative_id: str | None = None,
+        run_id: str | None = None,
+        model_type=None,
+        since=None,
+        until=None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return stored reports matching every given filter, oldest first.
+
+        Each row is an outcome report dict plus ``run_id`` and ``recorded_at``.
+        ``since`` is inclusive and ``until`` exclusive.
+        """
+        where, params = self._where(initiative_id, run_id, model_type, since, until)
+        sql = f"SELECT * FROM outcome_reports{where} ORDER BY recorded_at, rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [{**dict(row), "model_type": _model_type(row["model_type"])} for row in rows]
+
+    def calibration(self, by: str = "model_type", **filters) -> list[dict]:
+        """Aggregate prediction error per group, e.g. per model type.
+
+        Parameters
+        ----------
+        by : str
+            One of ``model_type``, ``initiative_id``, ``run_id`` or ``day``.
+        **filters
+            Any of :meth:`query`'s filters.
+
+        Returns
+        -------
+        list[dict]
+            One ``{by, "count", "mean_error", "mean_abs_error", "min_error",
+            "max_error"}`` dict per group, ordered by group.
+        """
+        assert by in GROUP_COLUMNS, f"by must be one of {GROUP_COLUMNS}, got {by!r}"
+        group = "substr(recorded_at, 1, 10)" if by == "day" else by
+        where, params = self._where(**filters)
+        if by == "initiative_id" or filters.get("initiative_id") is not None:
+            sql = (
+                f"SELECT {group} AS {by}, COUNT(*) AS count, AVG(prediction_error) AS mean_error, "
+                "AVG(ABS(prediction_error)) AS mean_abs_error, MIN(prediction_error) AS min_error, "
+                f"MAX(prediction_error) AS max_error FROM outcome_reports{where} GROUP BY {group} ORDER BY {group}"
+            )
+        else:
+            # Per-run, per-model-type rollups answer everything not split by initiative
+            sql = (
+                f"SELECT {group} AS {by}, SUM(count) AS count, SUM(sum_error) / SUM(count) AS mean_error, "
+                "SUM(sum_abs_error) / SUM(count) AS mean_abs_error, MIN(min_error) AS min_error, "
+                f"MAX(max_error) AS max_error FROM report_rollups{where} GROUP BY {group} ORDER BY {group}"
+            )
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        groups = [dict(row) for row in rows]
+        if by == "model_type":
+            for row in groups:
+                row["model_type"] = _model_type(row["model_type"])
+        return groups
+
+    def runs(self) -> list[dict]:
+        """Return ``{"run_id", "recorded_at", "reports"}`` for every stored run, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT run_id, MIN(recorded_at) AS recorded_at, COUNT(*) AS reports "
+                "FROM outcome_reports GROUP BY run_id ORDER BY recorded_at, run_id"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _where(initiative_id=None, run_id=None, model_type=None, since=None, until=None):
+        clauses, params = [], []
+        for column, value in (("initiative_id", initiative_id), ("run_id", run_id), ("model_type", model_type)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(_column_value(value))
+        if since is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append("recorded_at < ?")
+            params.append(_timestamp(until))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _column_value(value):
+    """Store enums (e.g. ModelType) by value."""
+    return value.value if isinstance(value, Enum) else value
@@ -3,9 +3,15 @@
 import pandas as pd
 import pytest
 import yaml
+from impact_engine_evaluate import Evaluate
 
+from impact_engine_orchestrator.components.allocate.mock import MockAllocate
 from impact_engine_orchestrator.components.measure.measure import Measure
-from impact_engine_orchestrator.config import InitiativeConfig
+from impact_engine_orchestrator.config import InitiativeConfig, PipelineConfig
+from impact_engine_orchestrator.orchestrator import Orchestrator
+
+# (initiative_id, cost_to_scale) of the default portfolio
+INITIATIVE_SPECS = [("init-001", 10000), ("init-002", 15000), ("init-003", 8000)]
 
 
 @pytest.fixture()
@@ -72,3 +78,34 @@ def measure_env(tmp_path):
         return Measure(storage_url=storage_url)
 
     return make_initiative, make_measure
+
+
+@pytest.fixture()
+def make_orchestrator(measure_env):
+    """Provide a factory for orchestrators wired to real Measure, Evaluate and MockAllocate.
+
+    ``make_orchestrator(initiatives=INITIATIVE_SPECS, measure=None, evaluate=None, allocate=None,
+    cls=Orchestrator, **overrides)`` builds ``cls`` over the given components (default: a fresh
+    instance of each). ``initiatives`` holds ``(initiative_id, cost_to_scale)`` specs or
+    InitiativeConfigs, and ``overrides`` are PipelineConfig fields on top of a 100000 budget and
+    a 5000 scale sample size.
+    """
+    make_initiative, make_measure = measure_env
+
+    def make(initiatives=INITIATIVE_SPECS, measure=None, evaluate=None, allocate=None, cls=Orchestrator, **overrides):
+        config = PipelineConfig(
+            **{
+                "budget": 100000,
+                "scale_sample_size": 5000,
+                "initiatives": [make_initiative(*spec) if isinstance(spec, tuple) else spec for spec in initiatives],
+                **overrides,
+            }
+        )
+        return cls(
+            measure=measure or make_measure(),
+            evaluate=evaluate or Evaluate(),
+            allocate=allocate or MockAllocate(),
+            config=config,
+        )
+
+    return make
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from impact_engine_orchestrator.async_orchestrator import AsyncOrchestrator
+from impact_engine_orchestrator.components.base import AsyncPipelineComponent
+from impact_engine_orchestrator.orchestrator import Orchestrator
+
+
+class SlowAsyncMeasure(AsyncPipelineComponent):
+    """Async wrapper around a sync measure that waits on (simulated) I/O first, longer for ``slow`` initiatives."""
+
+    def __init__(self, inner, delay=0.01, slow=()):
+        self.inner = inner
+        self.delay = delay
+        self.slow = set(slow)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = []
+
+    async def execute(self, event):
+        self.calls.append(event["initiative_id"])
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay * (5 if event["initiative_id"] in self.slow else 1))
+            return self.inner.execute(event)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture()
+def make(make_orchestrator):
+    def make(n=3, **overrides):
+        initiatives = [(f"init-{k:03d}", 8000 + 1000 * k) for k in range(n)]
+        return make_orchestrator(initiatives, **{"cls": AsyncOrchestrator, **overrides})
+
+    return make
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("executor", ["thread", "inline"])
+def test_async_matches_sync_with_sync_components(make, streaming, executor):
+    result = asyncio.run(make(streaming=streaming, executor=executor).run())
+    expected = make(cls=Orchestrator, streaming=streaming, executor=executor).run()
+
+    assert result == expected
+
+
+def test_async_component_concurrency_is_bounded(measure_env, make):
+    _, make_measure = measure_env
+    measure = SlowAsyncMeasure(make_measure())
+    orchestrator = make(measure=measure, n=8, max_workers=1, max_concurrency=3)
+
+    result = asyncio.run(orchestrator.run())
+
+    assert measure.peak_in_flight == 3
+    assert [r["initiative_id"] for r in result["pilot_results"]] == [f"init-{k:03d}" for k in range(8)]
+    assert len(result["outcome_reports"]) == len(result["allocate_result"]["selected_initiatives"])
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_async_sweep_with_async_component(measure_env, make, streaming):
+    _, make_measure = measure_env
+    budgets = [9000, 20000]
+
+    result = asyncio.run(make(measure=SlowAsyncMeasure(make_measure()), streaming=streaming).sweep(budgets))
+    expected = make(cls=Orchestrator, streaming=streaming).sweep(budgets)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_async_runtime_history_schedules_longest_expected_first(measure_env, make, tmp_path, streaming):
+    _, make_measure = measure_env
+    history = str(tmp_path / "runtimes.json")
+
+    def run():
+        measure = SlowAsyncMeasure(make_measure(), slow={"init-003"})
+        orchestrator = make(measure=measure, n=4, max_concurrency=1, runtime_history=history, streaming=streaming)
+        return asyncio.run(orchestrator.run()), measure.calls
+
+    first, first_calls = run()
+    second, second_calls = run()
+
+    assert first_calls[:4] == ["init-000", "init-001", "init-002", "init-003"]
+    assert second_calls[0] == "init-003"
+    assert second["schedule"]["measure"]["estimated_makespan"] >= 0.05
+    assert second["outcome_reports"] == first["outcome_reports"]
+
+
+def test_async_adaptive_concurrency(measure_env, make):
+    _, make_measure = measure_env
+    measure = SlowAsyncMeasure(make_measure())
+    orchestrator = make(measure=measure, n=12, adaptive_concurrency=True, stage_workers={"measure": 4, "scale": 4})
+
+    result = asyncio.run(orchestrator.run())
+
+    assert result["concurrency"]["measure"][0] == 2
+    assert max(result["concurrency"]["measure"]) <= 4
+    assert measure.peak_in_flight <= 4
+
+
+def test_async_instrumented_run(measure_env, make):
+    _, make_measure = measure_env
+    orchestrator = make(measure=SlowAsyncMeasure(make_measure()), instrument=True)
+
+    timings = asyncio.run(orchestrator.run())["timings"]
+
+    assert set(timings["stages"]) == {"measure", "evaluate", "allocate", "scale", "report"}
+    assert timings["stages"]["measure"]["wall_seconds_p50"] >= 0.01
+
+
+def test_async_failure_propagates(make):
+    class FailingMeasure(AsyncPipelineComponent):
+        async def execute(self, event):
+            raise RuntimeError(f"measure failed for {event['initiative_id']}")
+
+    orchestrator = make(measure=FailingMeasure())
+    with pytest.raises(RuntimeError, match="measure failed"):
+        asyncio.run(orchestrator.run())
+
+
+def test_async_resume(make, tmp_path):
+    orchestrator = make(journal_dir=str(tmp_path))
+    first = asyncio.run(orchestrator.run())
+
+    resumed = asyncio.run(make(journal_dir=str(tmp_path)).resume(first["run_id"]))
+    assert resumed == first
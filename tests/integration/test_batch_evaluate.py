@@ -0,0 +1,52 @@
+import pytest
+from impact_engine_evaluate import Evaluate
+
+from impact_engine_orchestrator.components.evaluate.batch import BatchEvaluate
+
+INITIATIVES = [("init-001", 10000), ("init-002", 15000), ("init-003", 8000), ("init-004", 12000), ("init-005", 9000)]
+
+
+class CountingBatchEvaluate(BatchEvaluate):
+    def __init__(self):
+        super().__init__()
+        self.single_calls = 0
+        self.batch_sizes = []
+
+    def execute(self, event):
+        self.single_calls += 1
+        return super().execute(event)
+
+    def execute_batch(self, events):
+        self.batch_sizes.append(len(events))
+        return super().execute_batch(events)
+
+
+@pytest.fixture()
+def make(make_orchestrator):
+    def make(evaluate, **overrides):
+        return make_orchestrator(INITIATIVES, evaluate=evaluate, **{"max_workers": 2, **overrides})
+
+    return make
+
+
+@pytest.mark.parametrize("executor", ["thread", "process", "inline"])
+def test_batch_evaluate_matches_evaluate(make, executor):
+    batched = make(BatchEvaluate(), executor=executor).run()
+    expected = make(Evaluate(), executor=executor).run()
+
+    assert batched == expected
+
+
+def test_one_batch_per_worker(make):
+    evaluate = CountingBatchEvaluate()
+    make(evaluate, max_workers=2).run()
+
+    assert evaluate.single_calls == 0
+    assert sorted(evaluate.batch_sizes) == [2, 3]
+
+
+def test_batch_timings_recorded_per_batch(make):
+    timings = make(BatchEvaluate(), max_workers=2, instrument=True).run()["timings"]
+
+    assert timings["stages"]["evaluate"]["count"] == 2
+    assert timings["stages"]["measure"]["count"] == 5
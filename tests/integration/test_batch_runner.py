@@ -0,0 +1,134 @@
+import os
+import threading
+
+import pytest
+
+from impact_engine_orchestrator.batch import BatchRunner, FairExecutor
+from impact_engine_orchestrator.config import PipelineConfig, StageConfig
+from impact_engine_orchestrator.orchestrator import Orchestrator
+
+
+def _make_config(measure_env, tmp_path, prefix, budget=100000):
+    make_initiative, _ = measure_env
+    initiative_specs = [
+        (f"{prefix}-001", 10000),
+        (f"{prefix}-002", 15000),
+        (f"{prefix}-003", 8000),
+    ]
+    return PipelineConfig(
+        budget=budget,
+        scale_sample_size=5000,
+        initiatives=[make_initiative(iid, cost) for iid, cost in initiative_specs],
+        measure_stage=StageConfig(component="Measure", kwargs={"storage_url": str(tmp_path / "storage")}),
+        evaluate_stage=StageConfig(component="Evaluate"),
+        allocate_stage=StageConfig(component="MockAllocate"),
+    )
+
+
+def test_batch_matches_individual_runs(measure_env, tmp_path):
+    configs = [_make_config(measure_env, tmp_path, f"unit{k}", budget=20000 + 20000 * k) for k in range(4)]
+
+    with BatchRunner(max_workers=3) as runner:
+        results = runner.run(configs)
+
+    assert results == [Orchestrator.from_config(config).run() for config in configs]
+
+
+def test_components_are_shared_across_portfolios(measure_env, tmp_path):
+    with BatchRunner(max_workers=2) as runner:
+        first = runner._orchestrator(_make_config(measure_env, tmp_path, "a"))
+        second = runner._orchestrator(_make_config(measure_env, tmp_path, "b"))
+
+    assert first.measure is second.measure
+    assert first.evaluate is second.evaluate
+    assert first._shared_pool is not second._shared_pool
+
+
+def test_failures_are_isolated(measure_env, tmp_path):
+    good = _make_config(measure_env, tmp_path, "good")
+    bad = _make_config(measure_env, tmp_path, "bad")
+    bad.initiatives[0].measure_config = str(tmp_path / "missing.yaml")
+
+    with BatchRunner(max_workers=2) as runner:
+        results = runner.run([good, bad], return_exceptions=True)
+        assert isinstance(results[1], Exception)
+        assert results[0] == Orchestrator.from_config(good).run()
+
+        with pytest.raises(type(results[1])):
+            runner.run([good, bad])
+
+
+def test_shared_components_are_flushed_once_per_batch(measure_env, tmp_path):
+    stage = StageConfig(
+        component="Measure",
+        kwargs={"storage_url": str(tmp_path / "storage"), "in_memory": True, "scratch_url": str(tmp_path)},
+    )
+    good = _make_config(measure_env, tmp_path, "good")
+    bad = _make_config(measure_env, tmp_path, "bad")
+    good.measure_stage = bad.measure_stage = stage
+
+    with BatchRunner(max_workers=2) as runner:
+        measure = runner.component(stage)
+        move, flushes = measure._move_to_storage, []
+        flush = measure.flush
+
+        def move_to_storage(scratch):
+            # Only the "bad" portfolio's artifacts fail to persist
+            if any(name.startswith("bad") for name in os.listdir(scratch)):
+                raise OSError("storage unavailable")
+            move(scratch)
+
+        def counted_flush():
+            flushes.append(1)
+            flush()
+
+        measure._move_to_storage, measure.flush = move_to_storage, counted_flush
+        with pytest.raises(OSError, match="storage unavailable"):
+            runner.run([good, bad], return_exceptions=True)
+        assert len(flushes) == 1
+
+        # Once reported, the failure does not leak into the next batch
+        assert runner.run([good]) == [Orchestrator.from_config(good).run()]
+
+
+def _hold(started, gate):
+    """Occupy a worker: signal ``started``, then wait for ``gate``."""
+    started.set()
+    return gate.wait()
+
+
+def test_fair_executor_round_robins_clients():
+    executor = FairExecutor(max_workers=1)
+    started, gate = threading.Event(), threading.Event()
+    order = []
+    busy, heavy, light = executor.client(), executor.client(), executor.client()
+
+    # Hold the only worker while both clients queue work
+    blocker = busy.submit(_hold, started, gate)
+    assert started.wait(timeout=5)
+    heavy_futures = [heavy.submit(order.append, f"heavy-{k}") for k in range(3)]
+    light_futures = [light.submit(order.append, f"light-{k}") for k in range(2)]
+    gate.set()
+    for future in [blocker, *heavy_futures, *light_futures]:
+        future.result(timeout=5)
+    executor.shutdown()
+
+    assert order == ["heavy-0", "light-0", "heavy-1", "light-1", "heavy-2"]
+
+
+def test_client_shutdown_cancels_only_its_queue():
+    executor = FairExecutor(max_workers=1)
+    started, gate = threading.Event(), threading.Event()
+    first, second = executor.client(), executor.client()
+
+    blocker = first.submit(_hold, started, gate)
+    assert started.wait(timeout=5)
+    dropped = first.submit(lambda: "dropped")
+    kept = second.submit(lambda: "kept")
+    first.shutdown(wait=False, cancel_futures=True)
+    gate.set()
+
+    assert kept.result(timeout=5) == "kept"
+    assert dropped.cancelled()
+    assert blocker.result(timeout=5) is True
+    executor.shutdown()
@@ -0,0 +1,26 @@
+import pytest
+
+
+def test_sweep_matches_individual_runs(make_orchestrator):
+    budgets = [1, 9000, 20000, 100000]
+    sweep = make_orchestrator().sweep(budgets)
+
+    assert [run["budget"] for run in sweep["runs"]] == budgets
+    for run in sweep["runs"]:
+        expected = make_orchestrator(budget=run["budget"]).run()
+        assert run["allocate_result"] == expected["allocate_result"]
+        assert run["outcome_reports"] == expected["outcome_reports"]
+        assert sweep["pilot_results"] == expected["pilot_results"]
+
+
+def test_sweep_scales_each_initiative_once(make_orchestrator):
+    sweep = make_orchestrator().sweep([20000, 30000, 100000])
+
+    selected = {iid for run in sweep["runs"] for iid in run["allocate_result"]["selected_initiatives"]}
+    scaled = [s["initiative_id"] for s in sweep["scale_results"]]
+    assert sorted(scaled) == sorted(selected)
+
+
+def test_sweep_requires_budgets(make_orchestrator):
+    with pytest.raises(AssertionError, match="budgets must not be empty"):
+        make_orchestrator().sweep([])
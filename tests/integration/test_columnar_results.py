@@ -0,0 +1,28 @@
+import pytest
+
+from impact_engine_orchestrator.results import ResultTable
+
+
+def test_columnar_run_matches_records(make_orchestrator):
+    columnar = make_orchestrator(result_format="columnar").run()
+    records = make_orchestrator(result_format="records").run()
+
+    for section in ["pilot_results", "evaluate_results", "scale_results", "outcome_reports"]:
+        assert isinstance(columnar[section], ResultTable)
+        assert columnar[section] == records[section]
+    assert columnar["allocate_result"] == records["allocate_result"]
+
+
+def test_columnar_reports_export_to_parquet(make_orchestrator, tmp_path):
+    pytest.importorskip("pyarrow")
+    columnar = make_orchestrator(result_format="columnar").run()
+
+    columnar["outcome_reports"].to_parquet(str(tmp_path / "reports.parquet"))
+    assert (tmp_path / "reports.parquet").stat().st_size > 0
+
+
+def test_columnar_sweep(make_orchestrator):
+    sweep = make_orchestrator(result_format="columnar").sweep([20000, 100000])
+
+    assert isinstance(sweep["scale_results"], ResultTable)
+    assert all(isinstance(run["outcome_reports"], ResultTable) for run in sweep["runs"])
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+import yaml
+
+from impact_engine_orchestrator.async_orchestrator import AsyncOrchestrator
+from impact_engine_orchestrator.components.base import PipelineComponent
+
+# measure_env writes identical config contents for every initiative
+INITIATIVES = [("a", 10000), ("b", 15000), ("c", 8000)]
+
+
+class CountingMeasure(PipelineComponent):
+    def __init__(self, inner):
+        self.inner = inner
+        self.calls = []
+
+    def execute(self, event):
+        self.calls.append(("scale" if "sample_size" in event else "pilot", event["initiative_id"]))
+        return self.inner.execute(event)
+
+
+@pytest.fixture()
+def make(measure_env, make_orchestrator):
+    _, make_measure = measure_env
+
+    def make(initiatives=INITIATIVES, **overrides):
+        measure = CountingMeasure(make_measure())
+        return make_orchestrator(initiatives, measure=measure, **overrides), measure
+
+    return make
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_identical_measurements_run_once(make, streaming):
+    orchestrator, measure = make(deduplicate=True, streaming=streaming)
+    result = orchestrator.run()
+    expected, baseline_measure = make(deduplicate=False, streaming=streaming)
+
+    assert result == expected.run()
+    assert [phase for phase, _ in measure.calls] == ["pilot", "scale"]
+    assert len(baseline_measure.calls) == 6
+    assert [r["initiative_id"] for r in result["pilot_results"]] == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_async_identical_measurements_run_once(make, streaming):
+    orchestrator, measure = make(deduplicate=True, streaming=streaming, cls=AsyncOrchestrator)
+    result = asyncio.run(orchestrator.run())
+    expected, _ = make(deduplicate=False, streaming=streaming)
+
+    assert result == expected.run()
+    assert [phase for phase, _ in measure.calls] == ["pilot", "scale"]
+
+
+def test_different_configs_are_not_merged(measure_env, make, tmp_path):
+    make_initiative, _ = measure_env
+    first = make_initiative("a", 10000)
+    config = yaml.safe_load(open(first.measure_config))
+    config["DATA"]["SOURCE"]["CONFIG"]["seed"] = 7
+    other_path = tmp_path / "other.yaml"
+    other_path.write_text(yaml.dump(config))
+    second = make_initiative("b", 15000)
+    second.measure_config = str(other_path)
+
+    orchestrator, measure = make(deduplicate=True, initiatives=[first, second])
+    orchestrator.run()
+
+    assert sorted(measure.calls) == [("pilot", "a"), ("pilot", "b"), ("scale", "a"), ("scale", "b")]
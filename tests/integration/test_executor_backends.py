@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.mark.parametrize("executor", ["process", "inline"])
+def test_backend_matches_thread_backend(make_orchestrator, executor):
+    expected = make_orchestrator(max_workers=2, executor="thread").run()
+    result = make_orchestrator(max_workers=2, executor=executor).run()
+
+    assert result == expected
+
+
+def test_unknown_backend_rejected(make_orchestrator):
+    with pytest.raises(AssertionError, match="executor must be one of"):
+        make_orchestrator(executor="gpu")
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from impact_engine_orchestrator.async_orchestrator import AsyncOrchestrator
+from impact_engine_orchestrator.components.base import PipelineComponent
+from impact_engine_orchestrator.config import InitiativeConfig, PipelineConfig
+from impact_engine_orchestrator.orchestrator import Orchestrator
+
+
+class FaultyMeasure(PipelineComponent):
+    """Delegate to a real measure, failing or hanging for chosen (phase, initiative) pairs."""
+
+    def __init__(self, inner, fail=(), hang=()):
+        self.inner = inner
+        self.fail = set(fail)
+        self.hang = set(hang)
+        self.release = threading.Event()
+        self.calls = []
+
+    def execute(self, event):
+        key = ("scale" if "sample_size" in event else "pilot", event["initiative_id"])
+        self.calls.append(key)
+        if key in self.fail:
+            raise RuntimeError(f"{key[0]} failed for {key[1]}")
+        if key in self.hang:
+            self.release.wait(timeout=10)
+        return self.inner.execute(event)
+
+
+@pytest.fixture()
+def make_faulty(measure_env, make_orchestrator):
+    """Build orchestrators over ``n`` initiatives whose measure is a FaultyMeasure; hung calls are released after."""
+    _, make_measure = measure_env
+    measures = []
+
+    def make(fail=(), hang=(), n=3, **overrides):
+        measure = FaultyMeasure(make_measure(), fail=fail, hang=hang)
+        measures.append(measure)
+        initiatives = [(f"init-{k:03d}", 8000 + 1000 * k) for k in range(1, n + 1)]
+        return make_orchestrator(initiatives, measure=measure, **overrides), measure
+
+    yield make
+    for measure in measures:
+        measure.release.set()
+
+
+def _run(orchestrator):
+    result = orchestrator.run()
+    return asyncio.run(result) if asyncio.iscoroutine(result) else result
+
+
+def test_first_failure_cancels_queued_work(make_faulty):
+    orchestrator, measure = make_faulty(fail={("pilot", "init-001")}, n=20, max_workers=1)
+
+    with pytest.raises(RuntimeError, match="pilot failed for init-001"):
+        orchestrator.run()
+    assert len(measure.calls) < 20
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("cls", [Orchestrator, AsyncOrchestrator])
+def test_skip_excludes_failed_pilot(make_faulty, streaming, cls):
+    orchestrator, _ = make_faulty(fail={("pilot", "init-002")}, on_failure="skip", streaming=streaming, cls=cls)
+
+    result = _run(orchestrator)
+
+    assert [e["initiative_id"] for e in result["errors"]] == ["init-002"]
+    assert result["errors"][0]["stage"] == "measure"
+    assert "RuntimeError" in result["errors"][0]["error"]
+    assert [r["initiative_id"] for r in result["evaluate_results"]] == ["init-001", "init-003"]
+    assert "init-002" not in result["allocate_result"]["selected_initiatives"]
+
+
+def test_skip_excludes_failed_scale_from_reports(make_faulty):
+    orchestrator, _ = make_faulty(fail={("scale", "init-001")}, on_failure="skip")
+
+    result = orchestrator.run()
+
+    assert result["errors"] == [
+        {"stage": "scale", "initiative_id": "init-001", "error": "RuntimeError: scale failed for init-001"}
+    ]
+    assert "init-001" in result["allocate_result"]["selected_initiatives"]
+    assert "init-001" not in [r["initiative_id"] for r in result["outcome_reports"]]
+    assert len(result["outcome_reports"]) == len(result["allocate_result"]["selected_initiatives"]) - 1
+
+
+def test_no_errors_section_when_raising(make_faulty):
+    orchestrator, _ = make_faulty()
+
+    assert "errors" not in orchestrator.run()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("cls", [Orchestrator, AsyncOrchestrator])
+def test_timeout_raises_without_waiting_for_hung_work(make_faulty, streaming, cls):
+    orchestrator, _ = make_faulty(
+        hang={("pilot", "init-002")}, stage_timeouts={"measure": 0.5}, streaming=streaming, cls=cls
+    )
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError, match="timeout"):
+        _run(orchestrator)
+    assert time.monotonic() - start < 5
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("cls", [Orchestrator, AsyncOrchestrator])
+def test_timeout_skip_records_hung_initiative(make_faulty, streaming, cls):
+    orchestrator, _ = make_faulty(
+        hang={("pilot", "init-002")},
+        stage_timeouts={"measure": 0.5},
+        on_failure="skip",
+        streaming=streaming,
+        cls=cls,
+    )
+
+    start = time.monotonic()
+    result = _run(orchestrator)
+
+    assert time.monotonic() - start < 5
+    assert [(e["initiative_id"], e["error"].split(":")[0]) for e in result["errors"]] == [("init-002", "TimeoutError")]
+    assert [r["initiative_id"] for r in result["pilot_results"]] == ["init-001", "init-003"]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("cls", [Orchestrator, AsyncOrchestrator])
+def test_component_timeout_error_is_not_reported_as_stage_timeout(make_orchestrator, streaming, cls):
+    class UpstreamTimeoutMeasure(PipelineComponent):
+        def execute(self, event):
+            raise TimeoutError(f"upstream timed out for {event['initiative_id']}")
+
+    orchestrator = make_orchestrator(
+        measure=UpstreamTimeoutMeasure(), stage_timeouts={"measure": 5}, streaming=streaming, cls=cls
+    )
+
+    with pytest.raises(TimeoutError, match="upstream timed out") as info:
+        _run(orchestrator)
+    assert "exceeded" not in str(info.value)
+
+
+def test_timeout_config_validation():
+    initiatives = [InitiativeConfig(initiative_id="init-001", cost_to_scale=1000)]
+    with pytest.raises(AssertionError, match="stage_timeouts keys"):
+        PipelineConfig(budget=1, scale_sample_size=1, initiatives=initiatives, stage_timeouts={"allocate": 1})
+    with pytest.raises(AssertionError, match="on_failure"):
+        PipelineConfig(budget=1, scale_sample_size=1, initiatives=initiatives, on_failure="ignore")
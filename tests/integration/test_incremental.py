@@ -0,0 +1,156 @@
+import pytest
+import yaml
+from impact_engine_evaluate import Evaluate
+
+from impact_engine_orchestrator.components.allocate.mock import MockAllocate
+from impact_engine_orchestrator.components.base import PipelineComponent
+from impact_engine_orchestrator.journal import plan_reuse
+
+
+class Counting(PipelineComponent):
+    """Delegate to a real component, recording (phase, initiative_id) per call."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.calls = []
+
+    def execute(self, event):
+        if "budget" in event:
+            self.calls.append(("allocate", None))
+        else:
+            self.calls.append(("scale" if "sample_size" in event else "pilot", event["initiative_id"]))
+        return self.inner.execute(event)
+
+
+INITIATIVES = [("init-001", 10000), ("init-002", 15000), ("init-003", 8000)]
+
+
+@pytest.fixture()
+def make(measure_env, make_orchestrator):
+    _, make_measure = measure_env
+
+    def make(journal_dir, costs=None, **overrides):
+        costs = {**dict(INITIATIVES), **(costs or {})}
+        return make_orchestrator(
+            list(costs.items()),
+            measure=Counting(make_measure()),
+            evaluate=Counting(Evaluate()),
+            allocate=Counting(MockAllocate()),
+            journal_dir=journal_dir,
+            **overrides,
+        )
+
+    return make
+
+
+def _calls(orchestrator):
+    return {
+        "measure": sorted(orchestrator.measure.calls),
+        "evaluate": sorted(iid for _, iid in orchestrator.evaluate.calls),
+        "allocate": len(orchestrator.allocate.calls),
+    }
+
+
+@pytest.fixture()
+def previous(make, tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    return journal_dir, make(journal_dir).run()
+
+
+def test_rerun_unchanged_config_does_no_work(make, previous):
+    journal_dir, first = previous
+    orchestrator = make(journal_dir)
+    result = orchestrator.rerun(first["run_id"])
+
+    assert result["run_id"] != first["run_id"]
+    assert _calls(orchestrator) == {"measure": [], "evaluate": [], "allocate": 0}
+    assert result["outcome_reports"] == first["outcome_reports"]
+
+
+def test_rerun_cost_change_reevaluates_one_initiative(make, previous):
+    journal_dir, first = previous
+    orchestrator = make(journal_dir, costs={"init-002": 20000})
+    result = orchestrator.rerun(first["run_id"])
+
+    assert _calls(orchestrator)["evaluate"] == ["init-002"]
+    assert _calls(orchestrator)["allocate"] == 1
+    newly_selected = set(result["allocate_result"]["selected_initiatives"]) - set(
+        first["allocate_result"]["selected_initiatives"]
+    )
+    assert _calls(orchestrator)["measure"] == sorted(("scale", iid) for iid in newly_selected)
+
+    expected = make(None, costs={"init-002": 20000}).run()
+    assert result["allocate_result"] == expected["allocate_result"]
+
+
+def test_rerun_budget_change_scales_only_new_selections(make, previous):
+    journal_dir, first = previous
+    orchestrator = make(journal_dir, budget=20000)
+    result = orchestrator.rerun(first["run_id"])
+
+    calls = _calls(orchestrator)
+    assert calls["evaluate"] == []
+    assert calls["allocate"] == 1
+    assert all(phase == "scale" for phase, _ in calls["measure"])
+
+    expected = make(None, budget=20000).run()
+    assert result["allocate_result"] == expected["allocate_result"]
+
+
+def test_rerun_measure_config_change_remeasures_one_initiative(make, previous, tmp_path):
+    journal_dir, first = previous
+    config_path = tmp_path / "init-003.yaml"
+    config = yaml.safe_load(config_path.read_text())
+    config["DATA"]["SOURCE"]["CONFIG"]["seed"] = 7
+    config_path.write_text(yaml.dump(config))
+
+    orchestrator = make(journal_dir)
+    orchestrator.rerun(first["run_id"])
+
+    calls = _calls(orchestrator)
+    assert {iid for _, iid in calls["measure"]} == {"init-003"}
+    assert ("pilot", "init-003") in calls["measure"]
+    assert calls["evaluate"] == ["init-003"]
+    assert calls["allocate"] == 1
+
+
+def test_rerun_unknown_run(make, tmp_path):
+    orchestrator = make(str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        orchestrator.rerun("missing")
+
+
+def _inputs(budget=100, costs=None, fingerprints=None, scale_sample_size=10):
+    costs = costs or {"a": 1, "b": 2}
+    fingerprints = fingerprints or {}
+    return {
+        "budget": budget,
+        "scale_sample_size": scale_sample_size,
+        "initiatives": [
+            {
+                "initiative_id": iid,
+                "cost_to_scale": cost,
+                "measure_config": f"{iid}.yaml",
+                "fingerprint": fingerprints.get(iid),
+            }
+            for iid, cost in costs.items()
+        ],
+        "measure_stage": None,
+        "evaluate_stage": None,
+        "allocate_stage": None,
+    }
+
+
+def test_plan_reuse_new_initiative_invalidates_allocate():
+    reuse = plan_reuse(_inputs(), _inputs(costs={"a": 1, "b": 2, "c": 3}))
+    assert reuse == {"measure": {"a", "b"}, "evaluate": {"a", "b"}, "allocate": set(), "scale": {"a", "b"}}
+
+
+def test_plan_reuse_scale_sample_size_change_drops_scale_only():
+    reuse = plan_reuse(_inputs(), _inputs(scale_sample_size=20))
+    assert reuse == {"measure": {"a", "b"}, "evaluate": {"a", "b"}, "allocate": {"allocate"}, "scale": set()}
+
+
+def test_plan_reuse_fingerprint_change():
+    reuse = plan_reuse(_inputs(fingerprints={"a": "x"}), _inputs(fingerprints={"a": "y"}))
+    assert reuse == {"measure": {"b"}, "evaluate": {"b"}, "allocate": set(), "scale": {"b"}}
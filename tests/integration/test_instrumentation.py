@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from impact_engine_orchestrator.instrumentation import to_chrome_trace, to_otlp_json
+
+
+def test_timings_absent_when_disabled(make_orchestrator):
+    result = make_orchestrator(instrument=False).run()
+
+    assert "timings" not in result
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_timings_cover_every_stage(make_orchestrator, executor):
+    result = make_orchestrator(instrument=True, executor=executor).run()
+    baseline = make_orchestrator(instrument=False).run()
+
+    timings = result.pop("timings")
+    assert result == baseline
+
+    stages = timings["stages"]
+    assert set(stages) == {"measure", "evaluate", "allocate", "scale", "report"}
+    assert stages["measure"]["count"] == 3
+    assert stages["scale"]["count"] == len(result["scale_results"])
+    for record in timings["records"]:
+        assert record["wall_seconds"] >= 0
+        assert record["queue_seconds"] >= 0
+        assert record["payload_bytes"] > 0
+
+
+def test_trace_exports(make_orchestrator):
+    timings = make_orchestrator(instrument=True).run()["timings"]
+
+    trace = to_chrome_trace(timings)
+    assert len(trace["traceEvents"]) == len(timings["records"])
+    assert {e["ph"] for e in trace["traceEvents"]} == {"X"}
+
+    otlp = to_otlp_json(timings)
+    spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(spans) == len(timings["records"]) + 1
+    json.dumps(trace)
+    json.dumps(otlp)
@@ -0,0 +1,255 @@
+import importlib
+import multiprocessing
+import sqlite3
+import sys
+import time
+
+import pytest
+import yaml
+
+from impact_engine_orchestrator.config import load_config
+from impact_engine_orchestrator.distributed import QueueExecutor, TaskQueue, run_worker
+from impact_engine_orchestrator.executors import run_in_worker
+
+
+def _start_workers(url, count):
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=run_worker, args=(url, f"worker-{k}"), kwargs={"idle_timeout": 5.0})
+        for k in range(count)
+    ]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+def test_queue_backend_matches_thread_backend(make_orchestrator, tmp_path):
+    url = str(tmp_path / "queue.db")
+    workers = _start_workers(url, 2)
+    try:
+        expected = make_orchestrator(max_workers=2).run()
+        result = make_orchestrator(max_workers=2, executor="queue", queue_url=url).run()
+    finally:
+        for worker in workers:
+            worker.join(timeout=30)
+
+    assert result == expected
+    assert sorted(TaskQueue(url).workers(within=60)) == ["worker-0", "worker-1"]
+
+
+def test_queue_backend_requires_url(make_orchestrator):
+    with pytest.raises(AssertionError, match="requires queue_url"):
+        make_orchestrator(executor="queue")
+
+
+def test_task_of_lost_worker_is_redispatched(tmp_path):
+    url = str(tmp_path / "queue.db")
+    pool = QueueExecutor(url, specs={}, poll_interval=0.01)
+    future = pool.submit(pow, 2, 10)
+
+    # A worker claims the task and dies without heartbeats
+    queue = TaskQueue(url)
+    task_id, _, _ = queue.claim("lost-worker", lease=0.05)
+    time.sleep(0.2)
+    assert queue.finish(task_id, "lost-worker", "done", -1) is False
+
+    assert run_worker(url, "healthy-worker", idle_timeout=0.2) == 1
+    assert future.result(timeout=5) == 1024
+    pool.shutdown()
+
+
+def test_task_fails_after_max_attempts(tmp_path):
+    url = str(tmp_path / "queue.db")
+    pool = QueueExecutor(url, specs={}, poll_interval=0.01, max_attempts=1)
+    future = pool.submit(pow, 2, 10)
+
+    TaskQueue(url).claim("lost-worker", lease=0.01)
+
+    with pytest.raises(RuntimeError, match="lost by its worker"):
+        future.result(timeout=5)
+    pool.shutdown()
+
+
+def test_worker_exceptions_reach_the_submitter(tmp_path):
+    url = str(tmp_path / "queue.db")
+    pool = QueueExecutor(url, specs={}, poll_interval=0.01)
+    future = pool.submit(int, "not a number")
+
+    run_worker(url, idle_timeout=0.2)
+
+    with pytest.raises(ValueError, match="invalid literal"):
+        future.result(timeout=5)
+    assert "Traceback" in str(future.exception().__cause__)
+    pool.shutdown()
+
+
+@pytest.mark.parametrize(
+    ("queue_url", "expected"),
+    [
+        ("queue.db", "{config_dir}/queue.db"),
+        ("sqlite:///queue.db", "{config_dir}/queue.db"),
+        ("sqlite:////shared/queue.db", "/shared/queue.db"),
+        ("/shared/queue.db", "/shared/queue.db"),
+    ],
+)
+def test_load_config_resolves_queue_url(tmp_path, queue_url, expected):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.dump(
+            {
+                "budget": 1000,
+                "executor": "queue",
+                "queue_url": queue_url,
+                "initiatives": [{"initiative_id": "a", "cost_to_scale": 100}],
+            }
+        )
+    )
+
+    assert load_config(str(config_path)).queue_url == expected.format(config_dir=tmp_path)
+
+
+def test_poller_retries_transient_database_errors(tmp_path, monkeypatch):
+    url = str(tmp_path / "queue.db")
+    pool = QueueExecutor(url, specs={}, poll_interval=0.01)
+    failures = iter([sqlite3.OperationalError("database is locked")] * 3)
+    requeue_expired = pool._queue.requeue_expired
+
+    def flaky(max_attempts):
+        exc = next(failures, None)
+        if exc is not None:
+            raise exc
+        return requeue_expired(max_attempts)
+
+    monkeypatch.setattr(pool._queue, "requeue_expired", flaky)
+    future = pool.submit(pow, 2, 10)
+    run_worker(url, idle_timeout=0.2)
+
+    assert future.result(timeout=5) == 1024
+    pool.shutdown()
+
+
+def test_unloadable_result_fails_only_its_future(tmp_path):
+    url = str(tmp_path / "queue.db")
+    pool = QueueExecutor(url, specs={}, poll_interval=0.01)
+    broken = pool.submit(pow, 2, 10)
+    healthy = pool.submit(pow, 3, 2)
+
+    queue = TaskQueue(url)
+    task_id, _, _ = queue.claim("worker", lease=30)
+    queue._transaction([("UPDATE tasks SET status = 'done', result = ? WHERE id = ?", (b"not a pickle", task_id))])
+    run_worker(url, idle_timeout=0.2)
+
+    with pytest.raises(RuntimeError, match="could not load the result"):
+        broken.result(timeout=5)
+    assert healthy.result(timeout=5) == 9
+    pool.shutdown()
+
+
+def test_persistent_poll_errors_fail_pending_futures(tmp_path, monkeypatch):
+    pool = QueueExecutor(str(tmp_path / "queue.db"), specs={}, poll_interval=0.001)
+
+    def broken(max_attempts):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(pool._queue, "requeue_expired", broken)
+    future = pool.submit(pow, 2, 10)
+
+    with pytest.raises(sqlite3.OperationalError, match="disk I/O error"):
+        future.result(timeout=5)
+    pool.shutdown()
+
+
+@pytest.mark.parametrize("unimportable", ["call", "specs"])
+def test_unimportable_task_fails_without_killing_the_worker(tmp_path, monkeypatch, unimportable):
+    # A module the submitter can import but the worker cannot
+    (tmp_path / "submitter_only.py").write_text(
+        "class Component:\n    def execute(self, event):\n        return event\n\n\ndef double(x):\n    return 2 * x\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("submitter_only")
+    url = str(tmp_path / "queue.db")
+    if unimportable == "call":
+        broken = QueueExecutor(url, specs={}, poll_interval=0.01)
+        future = broken.submit(module.double, 21)
+    else:
+        broken = QueueExecutor(url, specs={"measure": module.Component()}, poll_interval=0.01)
+        future = broken.submit(run_in_worker, "measure", {"k": 1})
+    healthy = QueueExecutor(url, specs={}, poll_interval=0.01)
+    after = healthy.submit(pow, 2, 10)
+    monkeypatch.delitem(sys.modules, "submitter_only")
+    (tmp_path / "submitter_only.py").unlink()
+
+    assert run_worker(url, "worker", idle_timeout=0.2) == 2
+
+    with pytest.raises(ModuleNotFoundError, match="submitter_only"):
+        future.result(timeout=5)
+    assert after.result(timeout=5) == 1024
+    broken.shutdown()
+    healthy.shutdown()
+
+
+class _FailingFlush:
+    flushes = 0
+
+    def execute(self, event):
+        return event
+
+    def flush(self):
+        type(self).flushes += 1
+        raise OSError("storage unavailable")
+
+
+def test_worker_flushes_once_when_idle_and_logs_failures(tmp_path, caplog):
+    url = str(tmp_path / "queue.db")
+    pool = QueueExecutor(url, specs={"measure": _FailingFlush()}, poll_interval=0.01)
+    futures = [pool.submit(run_in_worker, "measure", {"k": k}) for k in range(3)]
+
+    assert run_worker(url, "worker", idle_timeout=0.2) == 3
+    assert [future.result(timeout=5) for future in futures] == [{"k": 0}, {"k": 1}, {"k": 2}]
+    assert _FailingFlush.flushes == 1
+    assert "flushing stage components failed" in caplog.text
+    pool.shutdown()
+
+
+def test_worker_keeps_its_lease_through_failing_heartbeats(tmp_path, monkeypatch, caplog):
+    url = str(tmp_path / "queue.db")
+    pool = QueueExecutor(url, specs={}, poll_interval=0.01)
+    future = pool.submit(time.sleep, 0.6)
+    heartbeat = TaskQueue.heartbeat
+    calls = []
+
+    def flaky(self, worker_id, lease):
+        calls.append(worker_id)
+        if len(calls) == 2:
+            raise sqlite3.OperationalError("database is locked")
+        heartbeat(self, worker_id, lease)
+
+    monkeypatch.setattr(TaskQueue, "heartbeat", flaky)
+
+    # Without renewed heartbeats the 0.3s lease would lapse and the task run twice
+    assert run_worker(url, "worker", lease=0.3, idle_timeout=0.2) == 1
+    assert future.result(timeout=5) is None
+    assert "heartbeat failed" in caplog.text
+    pool.shutdown()
+
+
+def test_orchestrator_submits_each_stage_in_one_transaction(make_orchestrator, tmp_path, monkeypatch):
+    url = str(tmp_path / "queue.db")
+    submitted = []
+    submit_many = QueueExecutor.submit_many
+
+    def record(self, calls):
+        submitted.append(len(calls))
+        return submit_many(self, calls)
+
+    monkeypatch.setattr(QueueExecutor, "submit_many", record)
+    workers = _start_workers(url, 1)
+    try:
+        make_orchestrator(executor="queue", queue_url=url).run()
+    finally:
+        for worker in workers:
+            worker.join(timeout=30)
+
+    # Pilot MEASURE and EVALUATE for three initiatives, then scale MEASURE for the selected ones
+    assert submitted[:2] == [3, 3]
+    assert len(submitted) == 3
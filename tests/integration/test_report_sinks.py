@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from impact_engine_orchestrator.async_orchestrator import AsyncOrchestrator
+from impact_engine_orchestrator.components.base import PipelineComponent
+from impact_engine_orchestrator.sinks import CallbackSink, JsonlSink, ParquetSink, read_jsonl
+
+
+class ObservedMeasure(PipelineComponent):
+    """Delegate to a real measure, logging each scale call."""
+
+    def __init__(self, inner, log):
+        self.inner = inner
+        self.log = log
+
+    def execute(self, event):
+        result = self.inner.execute(event)
+        if "sample_size" in event:
+            self.log.append(("scale", event["initiative_id"]))
+        return result
+
+
+def _by_id(reports):
+    return sorted((dict(r) for r in reports), key=lambda r: r["initiative_id"])
+
+
+def test_reports_emitted_as_scale_results_complete(measure_env, make_orchestrator):
+    _, make_measure = measure_env
+    log = []
+    sink = CallbackSink(lambda report: log.append(("report", report["initiative_id"])))
+    result = make_orchestrator(measure=ObservedMeasure(make_measure(), log), max_workers=1).run(sink=sink)
+
+    assert "outcome_reports" not in result
+    assert result["reports_written"] == 3
+    # Each report follows its own scale measurement, before the next one's report
+    scales = [iid for kind, iid in log if kind == "scale"]
+    assert log == [entry for iid in scales for entry in (("scale", iid), ("report", iid))]
+
+
+def test_jsonl_sink_matches_in_memory_reports(make_orchestrator, tmp_path):
+    expected = make_orchestrator().run()["outcome_reports"]
+
+    path = str(tmp_path / "reports.jsonl")
+    with JsonlSink(path, buffer_size=2) as sink:
+        make_orchestrator().run(sink=sink)
+
+    assert _by_id(read_jsonl(path)) == _by_id(expected)
+
+
+def test_parquet_sink_writes_row_groups(make_orchestrator, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    expected = make_orchestrator().run()["outcome_reports"]
+
+    path = str(tmp_path / "reports.parquet")
+    with ParquetSink(path, row_group_size=2) as sink:
+        make_orchestrator().run(sink=sink)
+
+    parquet = pq.ParquetFile(path)
+    assert [parquet.metadata.row_group(k).num_rows for k in range(parquet.num_row_groups)] == [2, 1]
+    rows = parquet.read().to_pylist()
+    assert _by_id(rows) == _by_id({**r, "model_type": r["model_type"].value} for r in expected)
+
+
+def test_async_orchestrator_streams_reports(make_orchestrator):
+    reports = []
+    result = asyncio.run(make_orchestrator(cls=AsyncOrchestrator).run(sink=CallbackSink(reports.append)))
+
+    assert result["reports_written"] == len(reports) == 3
+
+
+def test_resumed_run_emits_journaled_reports(make_orchestrator, tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    first = make_orchestrator(journal_dir=journal_dir).run()
+
+    reports = []
+    make_orchestrator(journal_dir=journal_dir).resume(first["run_id"], sink=CallbackSink(reports.append))
+    assert _by_id(reports) == _by_id(first["outcome_reports"])
+
+
+def test_sink_buffers_at_most_buffer_size():
+    batches = []
+
+    class Recording(CallbackSink):
+        def write_batch(self, reports):
+            batches.append(len(reports))
+
+    with Recording(None, buffer_size=3) as sink:
+        for k in range(7):
+            sink.write({"k": k})
+            assert len(sink._buffer) < 3
+    assert batches == [3, 3, 1]
+    with pytest.raises(AssertionError):
+        CallbackSink(print, buffer_size=0)
@@ -0,0 +1,88 @@
+import pytest
+
+from impact_engine_orchestrator.components.base import PipelineComponent
+from impact_engine_orchestrator.journal import RunJournal
+
+
+class CountingMeasure(PipelineComponent):
+    """Delegate to a real measure, counting calls and optionally failing scale runs."""
+
+    def __init__(self, inner, fail_scale_for=()):
+        self.inner = inner
+        self.fail_scale_for = set(fail_scale_for)
+        self.calls = []
+
+    def execute(self, event):
+        phase = "scale" if "sample_size" in event else "pilot"
+        self.calls.append((phase, event["initiative_id"]))
+        if phase == "scale" and event["initiative_id"] in self.fail_scale_for:
+            raise RuntimeError(f"scale failed for {event['initiative_id']}")
+        return self.inner.execute(event)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_resume_reruns_only_missing_work(measure_env, make_orchestrator, tmp_path, streaming):
+    _, make_measure = measure_env
+    journal_dir = str(tmp_path / "journal")
+
+    failing = CountingMeasure(make_measure(), fail_scale_for={"init-002"})
+    orchestrator = make_orchestrator(measure=failing, journal_dir=journal_dir, streaming=streaming)
+    with pytest.raises(RuntimeError, match="init-002"):
+        orchestrator.run()
+    (run_id,) = [p.name for p in (tmp_path / "journal").iterdir()]
+
+    already_scaled = set(RunJournal(journal_dir, run_id).load("scale"))
+    assert "init-002" not in already_scaled
+
+    healthy = CountingMeasure(make_measure())
+    resumed = make_orchestrator(measure=healthy, journal_dir=journal_dir, streaming=streaming).resume(run_id)
+
+    assert resumed["run_id"] == run_id
+    selected = set(resumed["allocate_result"]["selected_initiatives"])
+    assert sorted(healthy.calls) == sorted(("scale", iid) for iid in selected - already_scaled)
+
+    expected = make_orchestrator(streaming=streaming).run()
+    assert resumed["allocate_result"] == expected["allocate_result"]
+    assert [r["initiative_id"] for r in resumed["outcome_reports"]] == [
+        r["initiative_id"] for r in expected["outcome_reports"]
+    ]
+
+
+def test_resume_of_completed_run_does_no_work(measure_env, make_orchestrator, tmp_path):
+    _, make_measure = measure_env
+    journal_dir = str(tmp_path / "journal")
+    first = make_orchestrator(journal_dir=journal_dir).run()
+
+    measure = CountingMeasure(make_measure())
+    resumed = make_orchestrator(measure=measure, journal_dir=journal_dir).resume(first["run_id"])
+
+    assert measure.calls == []
+    assert resumed == first
+
+
+def test_resume_rejects_changed_config(make_orchestrator, tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    run_id = make_orchestrator(journal_dir=journal_dir).run()["run_id"]
+
+    orchestrator = make_orchestrator(journal_dir=journal_dir)
+    orchestrator.config.budget = 50000
+    with pytest.raises(ValueError, match="differ"):
+        orchestrator.resume(run_id)
+
+
+def test_resume_unknown_run(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator(journal_dir=str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        orchestrator.resume("missing")
+
+
+def test_journal_drops_partial_record(tmp_path):
+    journal = RunJournal(str(tmp_path), "run")
+    journal.path.mkdir()
+    journal.record("measure", "init-001", {"value": 1})
+    with open(journal.path / "measure.jsonl", "a") as f:
+        f.write('{"key": "init-002", "res')
+
+    assert journal.load("measure") == {"init-001": {"value": 1}}
+    journal.record("measure", "init-002", {"value": 2})
+    assert journal.load("measure") == {"init-001": {"value": 1}, "init-002": {"value": 2}}
@@ -0,0 +1,27 @@
+from impact_engine_orchestrator.store import RunStore
+
+
+def test_runs_append_reports_to_store(make_orchestrator, tmp_path):
+    path = str(tmp_path / "runs.db")
+    orchestrator = make_orchestrator(run_store=path)
+    first = orchestrator.run()
+    second = orchestrator.run()
+
+    assert first["run_id"] != second["run_id"]
+    with RunStore(path) as store:
+        assert [run["run_id"] for run in store.runs()] == sorted([first["run_id"], second["run_id"]])
+        stored = store.query(run_id=second["run_id"])
+        assert [{k: row[k] for k in second["outcome_reports"][0]} for row in stored] == second["outcome_reports"]
+        assert sum(g["count"] for g in store.calibration()) == 2 * len(first["outcome_reports"])
+
+
+def test_resumed_run_is_stored_once(make_orchestrator, tmp_path):
+    path = str(tmp_path / "runs.db")
+    journal_dir = str(tmp_path / "journal")
+    first = make_orchestrator(run_store=path, journal_dir=journal_dir).run()
+    make_orchestrator(run_store=path, journal_dir=journal_dir).resume(first["run_id"])
+
+    with RunStore(path) as store:
+        assert [(run["run_id"], run["reports"]) for run in store.runs()] == [
+            (first["run_id"], len(first["outcome_reports"]))
+        ]
@@ -0,0 +1,85 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from impact_engine_orchestrator import instrumentation
+from impact_engine_orchestrator.components.base import PipelineComponent
+
+
+class OrderRecording(PipelineComponent):
+    """Delegate to a real component, sleeping longer for slow initiatives and recording call order per phase."""
+
+    def __init__(self, inner, slow=()):
+        self.inner = inner
+        self.slow = set(slow)
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def execute(self, event):
+        phase = "scale" if "sample_size" in event else "pilot"
+        with self._lock:
+            self.calls.setdefault(phase, []).append(event["initiative_id"])
+        time.sleep(0.05 if event["initiative_id"] in self.slow else 0.001)
+        return self.inner.execute(event)
+
+
+@pytest.fixture()
+def make(measure_env, make_orchestrator):
+    _, make_measure = measure_env
+
+    def make(history_path, **overrides):
+        return make_orchestrator(
+            [(f"init-{k:03d}", 10000) for k in range(4)],
+            measure=OrderRecording(make_measure(), slow={"init-003"}),
+            **{"budget": 1_000_000, "max_workers": 1, "runtime_history": history_path, **overrides},
+        )
+
+    return make
+
+
+def test_second_run_schedules_longest_expected_first(make, tmp_path):
+    history_path = str(tmp_path / "runtimes.json")
+    first = make(history_path)
+    first_result = first.run()
+
+    assert first.measure.calls["pilot"] == ["init-000", "init-001", "init-002", "init-003"]
+    assert first_result["schedule"]["measure"] == {"tasks": 4, "estimated_makespan": None}
+
+    second = make(history_path)
+    estimate = second.estimate_makespan("measure")
+    second_result = second.run()
+
+    assert second.measure.calls["pilot"][0] == "init-003"
+    assert second.measure.calls["scale"][0] == "init-003"
+    assert estimate >= 0.05
+    assert second_result["schedule"]["measure"]["estimated_makespan"] == estimate
+    assert second_result["outcome_reports"] == first_result["outcome_reports"]
+
+
+def test_streaming_pilots_follow_history(make, tmp_path):
+    history_path = str(tmp_path / "runtimes.json")
+    make(history_path, streaming=True).run()
+
+    second = make(history_path, streaming=True)
+    second.run()
+
+    assert second.measure.calls["pilot"][0] == "init-003"
+
+
+def test_no_schedule_section_without_history(make):
+    result = make(None).run()
+
+    assert "schedule" not in result
+
+
+def test_history_alone_does_not_size_payloads(make, tmp_path, monkeypatch):
+    def refuse(*args, **kwargs):
+        raise AssertionError("payload pickled without instrument")
+
+    monkeypatch.setattr(instrumentation, "pickle", SimpleNamespace(dumps=refuse, HIGHEST_PROTOCOL=5))
+    result = make(str(tmp_path / "history.json")).run()
+
+    assert result["schedule"]["measure"]["tasks"] == 4
+    assert "timings" not in result
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+from impact_engine_evaluate import Evaluate
+
+from impact_engine_orchestrator.components.base import PipelineComponent
+
+
+class PeakTracking(PipelineComponent):
+    """Delegate to a real component after a short sleep, tracking peak concurrent calls per phase."""
+
+    def __init__(self, inner, delay=0.02):
+        self.inner = inner
+        self.delay = delay
+        self.active = {}
+        self.peak = {}
+        self._lock = threading.Lock()
+
+    def execute(self, event):
+        phase = "scale" if "sample_size" in event else "pilot"
+        with self._lock:
+            self.active[phase] = self.active.get(phase, 0) + 1
+            self.peak[phase] = max(self.peak.get(phase, 0), self.active[phase])
+        try:
+            time.sleep(self.delay)
+            return self.inner.execute(event)
+        finally:
+            with self._lock:
+                self.active[phase] -= 1
+
+
+@pytest.fixture()
+def make(measure_env, make_orchestrator):
+    _, make_measure = measure_env
+
+    def make(n_initiatives=12, **overrides):
+        return make_orchestrator(
+            [(f"init-{k:03d}", 10000) for k in range(n_initiatives)],
+            measure=PeakTracking(make_measure()),
+            evaluate=PeakTracking(Evaluate()),
+            **{"budget": 1_000_000, **overrides},
+        )
+
+    return make
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_stage_workers_bound_each_stage(make, streaming):
+    orchestrator = make(max_workers=8, streaming=streaming, stage_workers={"measure": 2, "evaluate": 1, "scale": 3})
+    result = orchestrator.run()
+
+    assert len(result["outcome_reports"]) == 12
+    assert orchestrator.measure.peak == {"pilot": 2, "scale": 3}
+    assert max(orchestrator.evaluate.peak.values()) == 1
+
+
+def test_stage_workers_may_exceed_max_workers(make):
+    orchestrator = make(max_workers=2, stage_workers={"scale": 6})
+    orchestrator.run()
+
+    assert orchestrator.measure.peak["pilot"] == 2
+    assert orchestrator.measure.peak["scale"] == 6
+
+
+def test_adaptive_concurrency_ramps_up_io_bound_stages(make):
+    orchestrator = make(n_initiatives=40, max_workers=8, adaptive_concurrency=True)
+    result = orchestrator.run()
+
+    assert len(result["outcome_reports"]) == 40
+    history = result["concurrency"]
+    assert set(history) == {"measure", "evaluate", "scale"}
+    for limits in history.values():
+        assert limits[0] == 4
+        assert all(1 <= limit <= 8 for limit in limits)
+    # Sleeping tasks scale with concurrency, so pilots gain workers
+    assert max(history["measure"]) > 4
+    assert orchestrator.measure.peak["pilot"] <= 8
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+from impact_engine_evaluate import Evaluate
+
+from impact_engine_orchestrator.components.base import PipelineComponent
+
+INITIATIVES = [("init-001", 10000), ("init-002", 15000), ("init-003", 8000), ("init-004", 12000), ("init-005", 9000)]
+
+
+class Recording(PipelineComponent):
+    """Delegate to a real component, appending ``(name, initiative_id)`` to a shared log after each call.
+
+    The pilot of ``hold`` waits until ``release`` is set (at most ``wait`` seconds) before completing.
+    """
+
+    def __init__(self, inner, name, log, release, hold=None, wait=5.0):
+        self.inner = inner
+        self.name = name
+        self.log = log
+        self.release = release
+        self.hold = hold
+        self.wait = wait
+
+    def execute(self, event):
+        if event["initiative_id"] == self.hold:
+            self.release.wait(timeout=self.wait)
+        result = self.inner.execute(event)
+        self.log.append((self.name, event["initiative_id"]))
+        if self.name == "evaluate":
+            self.release.set()
+        return result
+
+
+@pytest.fixture()
+def make(make_orchestrator):
+    def make(**overrides):
+        return make_orchestrator(INITIATIVES, **{"budget": 40000, "max_workers": 2, **overrides})
+
+    return make
+
+
+def test_streaming_matches_barrier_mode(make):
+    barrier = make(streaming=False).run()
+    streaming = make(streaming=True).run()
+
+    assert streaming == barrier
+
+
+def test_streaming_preserves_initiative_order(make):
+    result = make(streaming=True, max_workers=1).run()
+
+    pilot_ids = [p["initiative_id"] for p in result["pilot_results"]]
+    eval_ids = [e["initiative_id"] for e in result["evaluate_results"]]
+    assert pilot_ids == eval_ids == ["init-001", "init-002", "init-003", "init-004", "init-005"]
+
+
+def test_streaming_evaluates_before_slow_pilot_completes(make, measure_env):
+    _, make_measure = measure_env
+    log, release = [], threading.Event()
+    measure = Recording(make_measure(), "measure", log, release, hold="init-001")
+    evaluate = Recording(Evaluate(), "evaluate", log, release)
+
+    result = make(streaming=True, measure=measure, evaluate=evaluate).run()
+
+    # The slow pilot is only released by an EVALUATE, which barrier mode would not start until it completed
+    first_evaluate = next(k for k, (name, _) in enumerate(log) if name == "evaluate")
+    assert first_evaluate < log.index(("measure", "init-001"))
+    assert [e["initiative_id"] for e in result["evaluate_results"]][0] == "init-001"
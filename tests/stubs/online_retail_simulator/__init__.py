@@ -0,0 +1 @@
+"""Stand-in for online_retail_simulator, importable by setup_data's worker processes."""
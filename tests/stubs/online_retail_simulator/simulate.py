@@ -0,0 +1,18 @@
+"""Simulate ``n_products`` identical products, logging the simulating process to ``$FAKE_SIMULATOR_LOG``."""
+
+import os
+import types
+
+import pandas as pd
+import yaml
+
+
+def simulate_products(sim_config):
+    log = os.environ.get("FAKE_SIMULATOR_LOG")
+    if log:
+        with open(log, "a") as f:
+            f.write(f"{os.getpid()} {sim_config}\n")
+    with open(sim_config) as f:
+        n_products = yaml.safe_load(f)["n_products"]
+    frame = pd.DataFrame({"product_id": [f"p{k}" for k in range(n_products)], "price": [1.5] * n_products})
+    return types.SimpleNamespace(load_df=lambda name: frame)
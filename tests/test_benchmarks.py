@@ -0,0 +1,48 @@
+"""Smoke tests for the benchmark runner."""
+
+import json
+
+from benchmarks import run
+
+
+def test_runner_reports_stage_latencies_and_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["--sizes", "20", "--max-workers", "2", "--baseline", str(baseline)]
+
+    assert run.main([*args, "--save-baseline"]) == 0
+    results = json.loads(baseline.read_text())
+    (metrics,) = results.values()
+    assert metrics["size"] == 20
+    assert set(metrics["stages"]) == {"measure", "evaluate", "allocate", "scale"}
+    assert metrics["stages"]["measure"]["count"] == 20
+
+    assert run.main([*args, "--compare", "--tolerance", "100"]) == 0
+
+
+def test_compare_flags_throughput_regression():
+    baseline = {"s": {"throughput_per_second": 1000.0, "peak_memory_mb": 10.0}}
+    current = {"s": {"throughput_per_second": 500.0, "peak_memory_mb": 10.0}}
+
+    assert run.compare(current, baseline, tolerance=0.2) == ["s: throughput 500/s vs baseline 1000/s"]
+
+
+def test_compare_fails_without_a_baseline(tmp_path):
+    args = ["--sizes", "20", "--max-workers", "2", "--baseline", str(tmp_path / "baseline.json"), "--compare"]
+
+    assert run.main(args) == 1
+    assert run.compare({"s": {"throughput_per_second": 1000.0}}, {}, tolerance=0.2) == [
+        "s: no baseline for this scenario (record one with --save-baseline)"
+    ]
+
+
+def test_committed_baseline_covers_the_default_scenarios():
+    baseline = json.loads(run.DEFAULT_BASELINE.read_text())
+    args = run.parse_args([])
+
+    assert {run.scenario_key(size, args) for size in args.sizes} <= set(baseline)
+
+
+def test_synthetic_failures_are_reported(tmp_path):
+    assert run.main(["--sizes", "20", "--failure-rate", "1.0", "--output", str(tmp_path / "out.json")]) == 0
+    (metrics,) = json.loads((tmp_path / "out.json").read_text()).values()
+    assert metrics["error"].startswith("SyntheticFailure")
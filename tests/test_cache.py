@@ -0,0 +1,127 @@
+"""Tests for the content-addressed MEASURE cache."""
+
+import os
+
+from impact_engine_orchestrator.cache import MeasureCache
+from impact_engine_orchestrator.components.measure import measure as measure_module
+from impact_engine_orchestrator.components.measure.measure import Measure
+from impact_engine_orchestrator.contracts.types import ModelType
+from impact_engine_orchestrator.fingerprint import measure_fingerprint
+
+
+def _result(initiative_id="init-001"):
+    return {
+        "initiative_id": initiative_id,
+        "effect_estimate": 0.1,
+        "ci_lower": 0.05,
+        "ci_upper": 0.15,
+        "p_value": 0.01,
+        "sample_size": 100,
+        "model_type": ModelType("interrupted_time_series"),
+        "diagnostics": {"n_observations": 100},
+    }
+
+
+def test_put_get_round_trip(tmp_path):
+    cache = MeasureCache(str(tmp_path))
+    cache.put("ab" * 32, _result())
+
+    assert cache.get("ab" * 32) == _result()
+    assert cache.get("cd" * 32) is None
+
+
+def test_invalidate_and_clear(tmp_path):
+    cache = MeasureCache(str(tmp_path))
+    cache.put("ab" * 32, _result())
+    cache.put("cd" * 32, _result())
+
+    assert cache.invalidate("ab" * 32)
+    assert not cache.invalidate("ab" * 32)
+    cache.clear()
+    assert cache.get("cd" * 32) is None
+
+
+def test_lru_eviction(tmp_path):
+    cache = MeasureCache(str(tmp_path / "cache"), max_bytes=10_000)
+    cache.put("aa" * 32, _result())
+    entry_size = os.path.getsize(cache._path("aa" * 32))
+    # Room for two entries, even after evicting down to the low-water mark
+    cache.max_bytes = int(2.5 * entry_size)
+
+    cache.put("bb" * 32, _result())
+    os.utime(cache._path("aa" * 32), ns=(1, 1))
+    os.utime(cache._path("bb" * 32), ns=(2, 2))
+    cache.get("aa" * 32)  # refresh: "bb" is now least recently used
+    cache.put("cc" * 32, _result())
+
+    assert cache.get("bb" * 32) is None
+    assert cache.get("aa" * 32) is not None
+    assert cache.get("cc" * 32) is not None
+
+
+def test_overwrites_are_not_counted_twice(tmp_path, monkeypatch):
+    cache = MeasureCache(str(tmp_path / "cache"), max_bytes=10_000)
+    cache.put("aa" * 32, _result())
+    cache.put("bb" * 32, _result())
+    entry_size = os.path.getsize(cache._path("aa" * 32))
+    cache.max_bytes = int(2.5 * entry_size)
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+
+    for _ in range(5):
+        cache.put("aa" * 32, _result())
+
+    assert cache._size == 2 * entry_size
+    assert scans == []
+
+
+def test_eviction_frees_space_below_the_budget(tmp_path, monkeypatch):
+    cache = MeasureCache(str(tmp_path / "cache"), max_bytes=10_000)
+    cache.put("00" * 32, _result())
+    entry_size = os.path.getsize(cache._path("00" * 32))
+    cache.max_bytes = 20 * entry_size
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+
+    for k in range(1, 40):
+        cache.put(f"{k:02d}" * 32, _result())
+
+    # Each eviction makes room for two more entries (10% of the budget) before the next scan
+    assert cache._size <= cache.max_bytes
+    assert len(scans) <= 10
+
+
+def test_fingerprint_tracks_config_and_data(measure_env):
+    make_initiative, _ = measure_env
+    config_path = make_initiative("init-001", 1000).measure_config
+    base = measure_fingerprint(config_path)
+
+    assert measure_fingerprint(config_path) == base
+    assert measure_fingerprint(config_path, sample_size=5000) != base
+
+    data_path = os.path.join(os.path.dirname(config_path), "products.csv")
+    stat = os.stat(data_path)
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert measure_fingerprint(config_path) != base
+
+
+def test_measure_short_circuits_on_hit(measure_env, tmp_path, monkeypatch):
+    make_initiative, _ = measure_env
+    calls = []
+    real_evaluate_impact = measure_module.evaluate_impact
+
+    def counting_evaluate_impact(**kwargs):
+        calls.append(kwargs["job_id"])
+        return real_evaluate_impact(**kwargs)
+
+    monkeypatch.setattr(measure_module, "evaluate_impact", counting_evaluate_impact)
+    measure = Measure(storage_url=str(tmp_path / "storage"), cache_url=str(tmp_path / "cache"))
+    event = {"initiative_id": "init-001", "measure_config": make_initiative("init-001", 1000).measure_config}
+
+    first = measure.execute(event)
+    second = measure.execute(event)
+
+    assert second == first
+    assert calls == ["init-001"]
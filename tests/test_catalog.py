@@ -0,0 +1,121 @@
+import importlib.util
+import time
+
+import pandas as pd
+import pytest
+import yaml
+
+from impact_engine_orchestrator import catalog
+from impact_engine_orchestrator.config import InitiativeConfig, load_config
+
+requires_pyarrow = pytest.mark.skipif(importlib.util.find_spec("pyarrow") is None, reason="requires pyarrow")
+
+
+def _frame(n):
+    return pd.DataFrame(
+        {
+            "initiative_id": [f"init-{k:06d}" for k in range(n)],
+            "cost_to_scale": [1000.0 + k for k in range(n)],
+            "measure_config": [f"configs/init-{k:06d}.yaml" for k in range(n)],
+        }
+    )
+
+
+def _use_stdlib_csv(monkeypatch):
+    monkeypatch.setattr(catalog.importlib.util, "find_spec", lambda name: None)
+
+
+@pytest.fixture(params=[pytest.param("parquet", marks=requires_pyarrow), "csv", "csv-stdlib"])
+def table(request, tmp_path, monkeypatch):
+    if request.param == "parquet":
+        path = tmp_path / "initiatives.parquet"
+        _frame(5).to_parquet(path, index=False)
+        return path
+    path = tmp_path / "initiatives.csv"
+    _frame(5).to_csv(path, index=False)
+    if request.param == "csv-stdlib":
+        _use_stdlib_csv(monkeypatch)
+    return path
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def csv_reader(request, monkeypatch):
+    """Read CSV tables with pyarrow when installed, and with the stdlib fallback."""
+    if request.param == "stdlib":
+        _use_stdlib_csv(monkeypatch)
+
+
+def test_load_initiatives(table, tmp_path):
+    initiatives = catalog.load_initiatives(table, base_dir=str(tmp_path))
+
+    assert len(initiatives) == 5
+    assert initiatives[1] == InitiativeConfig("init-000001", 1001.0, str(tmp_path / "configs/init-000001.yaml"))
+
+
+def test_iter_initiatives_in_chunks(table):
+    chunks = list(catalog.iter_initiatives(table, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [i.initiative_id for chunk in chunks for i in chunk] == [f"init-{k:06d}" for k in range(5)]
+
+
+def test_stdlib_csv_fallback(tmp_path, monkeypatch):
+    path = tmp_path / "initiatives.csv"
+    _frame(3).to_csv(path, index=False)
+    _use_stdlib_csv(monkeypatch)
+
+    assert [len(c) for c in catalog.iter_initiatives(path, chunk_size=2)] == [2, 1]
+    assert catalog.load_initiatives(path)[2].cost_to_scale == 1002.0
+
+
+def test_parquet_requires_pyarrow(tmp_path, monkeypatch):
+    _use_stdlib_csv(monkeypatch)
+
+    with pytest.raises(ImportError, match="require pyarrow"):
+        catalog.load_initiatives(tmp_path / "initiatives.parquet")
+
+
+def test_bulk_validation_reports_every_bad_row(tmp_path, csv_reader):
+    path = tmp_path / "initiatives.csv"
+    path.write_text("initiative_id,cost_to_scale\na,10\na,20\n,30\nb,-1\nc,abc\n")
+
+    with pytest.raises(ValueError) as excinfo:
+        catalog.load_initiatives(path)
+    message = str(excinfo.value)
+    assert "row 1: duplicate initiative_id 'a'" in message
+    assert "row 2: missing initiative_id" in message
+    assert "row 3: cost_to_scale" in message
+    assert "row 4: cost_to_scale" in message
+
+
+def test_duplicates_detected_across_chunks(table):
+    frame = pd.concat([_frame(3), _frame(1)])
+    if table.suffix == ".parquet":
+        frame.to_parquet(table, index=False)
+    else:
+        frame.to_csv(table, index=False)
+
+    with pytest.raises(ValueError, match="row 3: duplicate"):
+        list(catalog.iter_initiatives(table, chunk_size=2))
+
+
+def test_missing_columns(tmp_path, csv_reader):
+    path = tmp_path / "initiatives.csv"
+    path.write_text("initiative_id\na\n")
+    with pytest.raises(ValueError, match="missing columns"):
+        catalog.load_initiatives(path)
+
+
+@requires_pyarrow
+def test_load_config_with_initiatives_table(tmp_path):
+    _frame(100_000).to_parquet(tmp_path / "initiatives.parquet", index=False)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump({"budget": 1e6, "initiatives_table": "initiatives.parquet"}))
+
+    started = time.perf_counter()
+    config = load_config(str(config_path))
+    elapsed = time.perf_counter() - started
+
+    assert len(config.initiatives) == 100_000
+    assert config.initiatives[-1].measure_config == str(tmp_path / "configs/init-099999.yaml")
+    assert elapsed < 5  # well under a second in practice; generous for slow CI
@@ -0,0 +1,66 @@
+import pytest
+
+from impact_engine_orchestrator import concurrency
+from impact_engine_orchestrator.concurrency import AIMDController
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(concurrency.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture()
+def cpu(monkeypatch):
+    load = {"value": 0.1}
+    monkeypatch.setattr(concurrency.CpuMonitor, "sample", lambda self: load["value"])
+    return load
+
+
+def _round(controller, clock, seconds, latency):
+    """Complete one round of ``limit`` tasks over ``seconds``."""
+    for _ in range(controller.limit):
+        clock.now += seconds / controller.limit
+        controller.observe(latency)
+
+
+def test_additive_increase_while_throughput_scales(clock, cpu):
+    controller = AIMDController(initial=2, maximum=5)
+    for _ in range(5):
+        # I/O-bound: every task takes 1s however many run at once
+        _round(controller, clock, seconds=1.0, latency=1.0)
+    assert controller.history == [2, 3, 4, 5, 5, 5]
+
+
+def test_multiplicative_decrease_when_latency_grows_without_throughput(clock, cpu):
+    controller = AIMDController(initial=8, maximum=16)
+    _round(controller, clock, seconds=1.0, latency=1.0)  # 8 tasks/s, limit -> 9
+    # Saturated: throughput stays at 8 tasks/s while latency climbs with the limit
+    _round(controller, clock, seconds=9 / 8, latency=3.0)
+    assert controller.history == [8, 9, 6]
+
+
+def test_decrease_when_cpu_saturated(clock, cpu):
+    controller = AIMDController(initial=4, maximum=8)
+    cpu["value"] = 0.99
+    _round(controller, clock, seconds=1.0, latency=1.0)
+    _round(controller, clock, seconds=1.0, latency=1.0)
+    assert controller.history == [4, 3, 2]
+
+
+def test_limit_stays_within_bounds(clock, cpu):
+    controller = AIMDController(initial=10, maximum=3, minimum=2)
+    assert controller.limit == 3
+    cpu["value"] = 1.0
+    for _ in range(4):
+        _round(controller, clock, seconds=1.0, latency=1.0)
+    assert controller.limit == 2
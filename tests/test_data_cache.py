@@ -0,0 +1,155 @@
+import gc
+import os
+import sys
+import types
+
+import pandas as pd
+import pytest
+
+from impact_engine_orchestrator import data_cache, fingerprint
+from impact_engine_orchestrator.components.measure.measure import Measure
+
+
+def _engine_module(monkeypatch, name):
+    """Register a module of the impact_engine package that reads through ``pd``, as impact_engine does."""
+    module = types.ModuleType(f"impact_engine.{name}")
+    module.pd = pd
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return module
+
+
+@pytest.fixture()
+def engine(monkeypatch):
+    return _engine_module(monkeypatch, "_cache_probe")
+
+
+@pytest.fixture()
+def cache(engine):
+    data_cache.install(1 << 20)
+    yield data_cache
+    data_cache.uninstall()
+
+
+@pytest.fixture()
+def products_csv(tmp_path):
+    path = tmp_path / "products.csv"
+    pd.DataFrame({"product_id": ["a", "b", "c"], "price": [1.0, 2.0, 3.0]}).to_csv(path, index=False)
+    return path
+
+
+def test_repeated_reads_are_served_from_memory(cache, engine, products_csv):
+    first = engine.pd.read_csv(products_csv)
+    second = engine.pd.read_csv(str(products_csv))
+
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+    pd.testing.assert_frame_equal(first, second)
+
+    # Callers get independent copies
+    first.loc[0, "price"] = 100.0
+    assert engine.pd.read_csv(products_csv).loc[0, "price"] == 1.0
+
+
+def test_modified_file_is_reread(cache, engine, products_csv):
+    engine.pd.read_csv(products_csv)
+    pd.DataFrame({"product_id": ["z"], "price": [9.0]}).to_csv(products_csv, index=False)
+    stat = products_csv.stat()
+    os.utime(products_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert engine.pd.read_csv(products_csv)["product_id"].tolist() == ["z"]
+    assert cache.stats()["misses"] == 2
+
+
+def test_reader_kwargs_are_part_of_the_key(cache, engine, products_csv):
+    engine.pd.read_csv(products_csv)
+    subset = engine.pd.read_csv(products_csv, usecols=["price"])
+
+    assert list(subset.columns) == ["price"]
+    assert cache.stats()["misses"] == 2
+
+
+def test_memory_bound_evicts_least_recently_used(cache, engine, tmp_path):
+    paths = []
+    for k in range(3):
+        path = tmp_path / f"data-{k}.csv"
+        pd.DataFrame({"value": range(1000)}).to_csv(path, index=False)
+        paths.append(path)
+    frame_bytes = int(pd.read_csv(paths[0]).memory_usage(deep=True).sum())
+    # Installing again updates the bound; undo it to leave only the fixture's install
+    cache.install(2 * frame_bytes)
+    cache.uninstall()
+
+    engine.pd.read_csv(paths[1])
+    engine.pd.read_csv(paths[0])
+    engine.pd.read_csv(paths[2])
+
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] <= 2 * frame_bytes
+    engine.pd.read_csv(paths[1])
+    assert cache.stats()["misses"] == 4
+
+
+def test_install_patches_only_impact_engine_modules(engine, monkeypatch):
+    original = pd.read_csv
+    data_cache.install()
+    data_cache.install()
+
+    assert pd.read_csv is original
+    assert engine.pd is not pd
+    assert engine.pd.DataFrame is pd.DataFrame
+
+    # Modules imported later, including readers imported by name, are patched on refresh
+    late = _engine_module(monkeypatch, "_late_probe")
+    late.read_csv = pd.read_csv
+    data_cache.refresh()
+    assert late.pd is engine.pd
+    assert late.read_csv is engine.pd.read_csv
+
+    # Installs are counted
+    data_cache.uninstall()
+    assert data_cache.installed()
+    data_cache.uninstall()
+
+    assert not data_cache.installed()
+    assert engine.pd is pd
+    assert late.read_csv is original
+
+
+def test_measure_installs_data_cache_for_its_lifetime(measure_env, tmp_path):
+    make_initiative, _ = measure_env
+    event = {"initiative_id": "init-001", "measure_config": make_initiative("init-001", 1000).measure_config}
+    expected = Measure(storage_url=str(tmp_path / "plain")).execute(event)
+
+    measure = Measure(storage_url=str(tmp_path / "cached"), data_cache_bytes=1 << 24)
+    try:
+        assert data_cache.installed()
+        assert measure.execute(event) == expected
+        assert measure.execute(event) == expected
+    finally:
+        measure.close()
+    assert not data_cache.installed()
+
+    # An adapter that is never closed undoes its install when collected
+    Measure(storage_url=str(tmp_path / "cached"), data_cache_bytes=1 << 24)
+    gc.collect()
+    assert not data_cache.installed()
+
+
+def test_plain_csv_reads_use_marked_parquet_copy(cache, engine, products_csv):
+    pytest.importorskip("pyarrow")
+    copy = products_csv.with_suffix(".parquet")
+    pd.DataFrame({"product_id": ["parquet"], "price": [0.0]}).to_parquet(copy)
+
+    # An unmarked Parquet file beside a CSV is never substituted
+    assert engine.pd.read_csv(products_csv)["product_id"].tolist() == ["a", "b", "c"]
+
+    # A copy marked by setup_data is, while the CSV is unchanged
+    fingerprint.write_sidecar(products_csv, fingerprint.SIMULATOR, "simulator hash")
+    pd.read_csv(products_csv).to_parquet(copy)
+    cache.mark_columnar_copy(products_csv)
+    assert engine.pd.read_csv(products_csv)["product_id"].tolist() == ["a", "b", "c"]
+    assert engine.pd.read_csv(products_csv, usecols=["price"]).columns.tolist() == ["price"]
+    assert cache.stats()["misses"] == 3  # unmarked CSV, Parquet copy, CSV with reader arguments
+
+    pd.DataFrame({"product_id": ["z"], "price": [9.0]}).to_csv(products_csv, index=False)
+    assert engine.pd.read_csv(products_csv)["product_id"].tolist() == ["z"]
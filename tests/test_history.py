@@ -0,0 +1,63 @@
+import json
+
+import pytest
+import yaml
+
+from impact_engine_orchestrator.history import RuntimeHistory, estimate_makespan, model_type_of
+
+
+def test_moving_average_weights_newest_runtime():
+    history = RuntimeHistory(alpha=0.5)
+    history.record("measure", "a", 4.0)
+    history.record("measure", "a", 2.0)
+
+    assert history.expected("measure", {"initiative_id": "a"}) == 3.0
+
+
+def test_unknown_initiatives_fall_back_to_model_type_then_stage_average():
+    history = RuntimeHistory()
+    history.record("measure", "a", 10.0, model_type="synthetic_control")
+    history.record("measure", "b", 2.0, model_type="experiment")
+
+    assert history.expected("measure", {"initiative_id": "c", "model_type": "synthetic_control"}) == 10.0
+    assert history.expected("measure", {"initiative_id": "d"}) == 6.0
+    assert history.expected("evaluate", {"initiative_id": "a"}) is None
+
+
+def test_model_type_read_from_measure_config(tmp_path):
+    path = tmp_path / "measure.yaml"
+    path.write_text(yaml.dump({"MEASUREMENT": {"MODEL": "synthetic_control"}}))
+
+    assert model_type_of({"initiative_id": "a", "measure_config": str(path)}) == "synthetic_control"
+    assert model_type_of({"initiative_id": "a", "measure_config": ""}) is None
+
+
+def test_order_is_longest_expected_first_and_stable():
+    history = RuntimeHistory()
+    for iid, seconds in [("a", 1.0), ("b", 5.0), ("c", 1.0), ("d", 3.0)]:
+        history.record("measure", iid, seconds)
+    events = [{"initiative_id": iid} for iid in "abcd"]
+
+    assert history.order("measure", events) == [1, 3, 0, 2]
+    assert RuntimeHistory().order("measure", events) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    ("durations", "workers", "expected"),
+    [([], 2, 0.0), ([5.0], 4, 5.0), ([3.0, 3.0, 2.0, 2.0, 2.0], 2, 7.0), ([1.0, 1.0, 4.0], 2, 4.0)],
+)
+def test_estimate_makespan_simulates_lpt(durations, workers, expected):
+    assert estimate_makespan(durations, workers) == expected
+
+
+def test_history_round_trips_through_file(tmp_path):
+    path = str(tmp_path / "runtimes.json")
+    history = RuntimeHistory(path)
+    history.record("scale", "a", 2.5, model_type="experiment")
+    history.save()
+
+    reloaded = RuntimeHistory(path)
+    assert reloaded.expected("scale", {"initiative_id": "a"}) == 2.5
+    assert json.loads((tmp_path / "runtimes.json").read_text())["stages"]["scale"]["model_types"] == {
+        "experiment": [2.5, 1]
+    }
@@ -0,0 +1,89 @@
+"""Tests for the knapsack ALLOCATE component."""
+
+import numpy as np
+
+from impact_engine_orchestrator.components.allocate.knapsack import KnapsackAllocate
+from impact_engine_orchestrator.components.allocate.mock import MockAllocate
+
+
+def _initiative(initiative_id, cost, return_median, confidence=1.0):
+    return {
+        "initiative_id": initiative_id,
+        "cost": cost,
+        "return_median": return_median,
+        "confidence": confidence,
+    }
+
+
+def _total_score(initiatives, selected):
+    by_id = {i["initiative_id"]: i for i in initiatives}
+    return sum(by_id[iid]["confidence"] * by_id[iid]["return_median"] for iid in selected)
+
+
+def test_beats_greedy_selection():
+    initiatives = [
+        _initiative("big", 6, 0.5),
+        _initiative("small-a", 5, 0.4),
+        _initiative("small-b", 5, 0.4),
+    ]
+    event = {"initiatives": initiatives, "budget": 10}
+
+    greedy = MockAllocate().execute(event)
+    knapsack = KnapsackAllocate().execute(event)
+
+    assert greedy["selected_initiatives"] == ["big"]
+    assert sorted(knapsack["selected_initiatives"]) == ["small-a", "small-b"]
+
+
+def test_matches_brute_force_optimum():
+    rng = np.random.default_rng(0)
+    initiatives = [
+        _initiative(f"init-{k}", int(rng.integers(1, 20)) * 500, float(rng.normal(0.1, 0.1)), float(rng.uniform()))
+        for k in range(12)
+    ]
+    budget = 30000
+
+    best = 0.0
+    for mask in range(1 << len(initiatives)):
+        chosen = [i for k, i in enumerate(initiatives) if mask >> k & 1]
+        if sum(i["cost"] for i in chosen) <= budget:
+            best = max(best, sum(i["confidence"] * i["return_median"] for i in chosen))
+
+    result = KnapsackAllocate().execute({"initiatives": initiatives, "budget": budget})
+    assert np.isclose(_total_score(initiatives, result["selected_initiatives"]), best)
+
+
+def test_fractional_costs_stay_within_budget():
+    rng = np.random.default_rng(1)
+    initiatives = [
+        _initiative(f"init-{k}", float(rng.uniform(100, 5000)), float(rng.uniform(0, 1))) for k in range(500)
+    ]
+    budget = 25000.0
+
+    result = KnapsackAllocate(resolution=200).execute({"initiatives": initiatives, "budget": budget})
+
+    assert sum(result["budget_allocated"].values()) <= budget
+    assert set(result["selected_initiatives"]) == set(result["predicted_returns"]) == set(result["budget_allocated"])
+
+
+def test_core_reduction_close_to_full_solve():
+    rng = np.random.default_rng(2)
+    initiatives = [
+        _initiative(f"init-{k}", int(rng.integers(1, 100)) * 10, float(rng.uniform(0, 1))) for k in range(400)
+    ]
+    event = {"initiatives": initiatives, "budget": 20000}
+
+    full = KnapsackAllocate(core_size=400).execute(event)
+    core = KnapsackAllocate(core_size=100).execute(event)
+
+    assert sum(core["budget_allocated"].values()) <= event["budget"]
+    full_score = _total_score(initiatives, full["selected_initiatives"])
+    assert _total_score(initiatives, core["selected_initiatives"]) >= 0.99 * full_score
+
+
+def test_nothing_fits_or_nothing_pays():
+    initiatives = [_initiative("expensive", 500, 0.5), _initiative("negative", 5, -0.1)]
+
+    result = KnapsackAllocate().execute({"initiatives": initiatives, "budget": 100})
+
+    assert result == {"selected_initiatives": [], "predicted_returns": {}, "budget_allocated": {}}
@@ -0,0 +1,111 @@
+"""Tests for the Measure adapter's result handoff modes."""
+
+import pickle
+
+import pytest
+from impact_engine_evaluate import Evaluate
+
+from impact_engine_orchestrator.components.allocate.mock import MockAllocate
+from impact_engine_orchestrator.components.measure.measure import Measure
+from impact_engine_orchestrator.config import PipelineConfig
+from impact_engine_orchestrator.orchestrator import Orchestrator
+
+
+def _event(measure_env):
+    make_initiative, _ = measure_env
+    return {"initiative_id": "init-001", "measure_config": make_initiative("init-001", 1000).measure_config}
+
+
+def test_in_memory_matches_storage_handoff(measure_env, tmp_path):
+    event = _event(measure_env)
+    on_disk = Measure(storage_url=str(tmp_path / "disk")).execute(event)
+
+    measure = Measure(storage_url=str(tmp_path / "memory"), in_memory=True, scratch_url=str(tmp_path))
+    in_memory = measure.execute(event)
+    measure.flush()
+
+    assert in_memory == on_disk
+    assert list((tmp_path / "memory").rglob("*.json"))
+    assert not list(tmp_path.glob("measure-*"))
+
+
+def test_in_memory_without_persist_keeps_nothing(measure_env, tmp_path):
+    measure = Measure(storage_url=str(tmp_path / "storage"), in_memory=True, persist=False, scratch_url=str(tmp_path))
+    measure.execute(_event(measure_env))
+
+    assert not (tmp_path / "storage").exists()
+    assert not list(tmp_path.glob("measure-*"))
+
+
+def test_in_memory_measure_is_picklable(measure_env, tmp_path):
+    measure = Measure(storage_url=str(tmp_path / "storage"), in_memory=True, scratch_url=str(tmp_path))
+    measure.execute(_event(measure_env))
+
+    clone = pickle.loads(pickle.dumps(measure))
+    assert clone.execute(_event(measure_env))["initiative_id"] == "init-001"
+    measure.flush()
+    clone.flush()
+
+
+def _failing_copy(scratch):
+    raise OSError("storage unavailable")
+
+
+def test_persist_failures_are_raised_once_and_not_retained(measure_env, tmp_path, monkeypatch):
+    measure = Measure(storage_url=str(tmp_path / "storage"), in_memory=True, scratch_url=str(tmp_path))
+    monkeypatch.setattr(measure, "_move_to_storage", _failing_copy)
+    for _ in range(3):
+        measure.execute(_event(measure_env))
+        measure._persist_futures[-1].exception()
+
+    assert len(measure._persist_futures) == 1
+    with pytest.raises(OSError, match="storage unavailable"):
+        measure.flush()
+    measure.flush()
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_orchestrator_flushes_persisted_artifacts(measure_env, tmp_path, executor):
+    make_initiative, _ = measure_env
+    config = PipelineConfig(
+        budget=100000,
+        scale_sample_size=5000,
+        initiatives=[make_initiative("init-001", 10000), make_initiative("init-002", 15000)],
+        executor=executor,
+    )
+    measure = Measure(storage_url=str(tmp_path / "storage"), in_memory=True, scratch_url=str(tmp_path))
+    Orchestrator(measure=measure, evaluate=Evaluate(), allocate=MockAllocate(), config=config).run()
+
+    assert measure._persist_futures == []
+    assert len(list((tmp_path / "storage").rglob("*.json"))) >= 2
+    assert not list(tmp_path.glob("measure-*"))
+
+
+def test_orchestrator_reports_persist_failures(measure_env, tmp_path, monkeypatch):
+    make_initiative, _ = measure_env
+    config = PipelineConfig(budget=100000, scale_sample_size=5000, initiatives=[make_initiative("init-001", 10000)])
+    measure = Measure(storage_url=str(tmp_path / "storage"), in_memory=True, scratch_url=str(tmp_path))
+    monkeypatch.setattr(measure, "_move_to_storage", _failing_copy)
+
+    with pytest.raises(OSError, match="storage unavailable"):
+        Orchestrator(measure=measure, evaluate=Evaluate(), allocate=MockAllocate(), config=config).run()
+
+
+class _UnstorableMeasure(Measure):
+    def _move_to_storage(self, scratch):
+        raise OSError("storage unavailable")
+
+
+def test_process_workers_report_persist_failures_at_shutdown(measure_env, tmp_path):
+    make_initiative, _ = measure_env
+    config = PipelineConfig(
+        budget=100000,
+        scale_sample_size=5000,
+        initiatives=[make_initiative("init-001", 10000)],
+        executor="process",
+    )
+    measure = _UnstorableMeasure(storage_url=str(tmp_path / "storage"), in_memory=True, scratch_url=str(tmp_path))
+    orchestrator = Orchestrator(measure=measure, evaluate=Evaluate(), allocate=MockAllocate(), config=config)
+
+    with pytest.raises(OSError, match="storage unavailable"):
+        orchestrator.run()
@@ -1,8 +1,12 @@
 """Tests for the component registry and from_config round-trip."""
 
+import subprocess
+import sys
+
 import pytest
 import yaml
 
+from impact_engine_orchestrator import registry
 from impact_engine_orchestrator.config import StageConfig, load_config
 from impact_engine_orchestrator.orchestrator import Orchestrator
 from impact_engine_orchestrator.registry import build
@@ -33,6 +37,15 @@ def test_build_evaluate():
     assert isinstance(component, Evaluate)
 
 
+def test_build_batch_evaluate():
+    """Registry builds BatchEvaluate."""
+    from impact_engine_orchestrator.components.evaluate.batch import BatchEvaluate
+
+    stage = StageConfig(component="BatchEvaluate")
+    component = build(stage)
+    assert isinstance(component, BatchEvaluate)
+
+
 def test_build_mock_allocate():
     """Registry builds MockAllocate."""
     from impact_engine_orchestrator.components.allocate.mock import MockAllocate
@@ -42,6 +55,15 @@ def test_build_mock_allocate():
     assert isinstance(component, MockAllocate)
 
 
+def test_build_knapsack_allocate():
+    """Registry builds KnapsackAllocate with kwargs."""
+    from impact_engine_orchestrator.components.allocate.knapsack import KnapsackAllocate
+
+    stage = StageConfig(component="KnapsackAllocate", kwargs={"resolution": 500})
+    component = build(stage)
+    assert isinstance(component, KnapsackAllocate)
+
+
 def test_build_minimax_regret_allocate():
     """Registry builds MinimaxRegretAllocate."""
     from portfolio_allocation import MinimaxRegretAllocate
@@ -51,6 +73,48 @@ def test_build_minimax_regret_allocate():
     assert isinstance(component, MinimaxRegretAllocate)
 
 
+def test_build_dotted_path():
+    """A stage config can name a class by dotted path."""
+    from impact_engine_orchestrator.components.allocate.knapsack import KnapsackAllocate
+
+    for path in [
+        "impact_engine_orchestrator.components.allocate.knapsack:KnapsackAllocate",
+        "impact_engine_orchestrator.components.allocate.knapsack.KnapsackAllocate",
+    ]:
+        assert isinstance(build(StageConfig(component=path)), KnapsackAllocate)
+
+
+def test_build_entry_point_component(monkeypatch):
+    """Components registered under the entry-point group are built by name."""
+    from impact_engine_orchestrator.components.allocate.mock import MockAllocate
+
+    class FakeEntryPoint:
+        name = "ThirdPartyAllocate"
+
+        def load(self):
+            return MockAllocate
+
+    monkeypatch.setattr(registry, "_entry_points", lambda: {"ThirdPartyAllocate": FakeEntryPoint()})
+    registry.resolve.cache_clear()
+    try:
+        assert isinstance(build(StageConfig(component="ThirdPartyAllocate")), MockAllocate)
+        assert "ThirdPartyAllocate" in registry.available()
+    finally:
+        registry.resolve.cache_clear()
+
+
+def test_registry_imports_components_lazily():
+    """Importing the registry and loading configs does not import component stacks."""
+    code = (
+        "import sys\n"
+        "import impact_engine_orchestrator.orchestrator, impact_engine_orchestrator.registry\n"
+        "heavy = ['impact_engine', 'portfolio_allocation', 'impact_engine_orchestrator.components.measure']\n"
+        "print([m for m in heavy if m in sys.modules])\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
+
+
 def test_missing_stage_config_file():
     """Missing stage config file raises FileNotFoundError."""
     with pytest.raises(FileNotFoundError, match="Stage config file not found"):
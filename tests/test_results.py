@@ -0,0 +1,147 @@
+import json
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from impact_engine_orchestrator import serialization
+from impact_engine_orchestrator.contracts.types import ModelType
+from impact_engine_orchestrator.results import ResultTable, ResultTableBuilder, RowView, StructColumn
+
+
+def _records():
+    return [
+        {
+            "initiative_id": f"init-{k}",
+            "effect_estimate": 1.5 * k,
+            "sample_size": 100 * k,
+            "model_type": ModelType.EXPERIMENT,
+            "diagnostics": {"r_squared": 0.1 * k},
+        }
+        for k in range(4)
+    ]
+
+
+def test_numeric_fields_become_arrays():
+    table = ResultTable.from_records(_records())
+
+    assert isinstance(table.column("effect_estimate"), np.ndarray)
+    assert table.column("sample_size").dtype == np.int64
+    assert isinstance(table.column("initiative_id"), list)
+    assert table.columns == list(_records()[0])
+
+
+def test_dict_fields_are_stored_per_key():
+    records = _records()
+    records[2]["diagnostics"]["converged"] = True
+    table = ResultTable.from_records(records)
+
+    diagnostics = table.column("diagnostics")
+    assert isinstance(diagnostics, StructColumn)
+    assert diagnostics.field("r_squared").dtype == np.float64
+    assert diagnostics.present("converged").tolist() == [False, False, True, False]
+    assert table == records
+
+
+def test_mixed_numbers_round_trip_exactly():
+    values = [1, 2.5, 2**60 + 1, 2**70, -(2**63), np.int64(7), True]
+    records = [{"initiative_id": f"init-{k}", "value": v, "diagnostics": {"k": v}} for k, v in enumerate(values)]
+    builder = ResultTableBuilder()
+    for position, record in enumerate(records):
+        builder.add(position, record)
+    table = builder.build()
+
+    assert table == records
+    types = [int, float, int, int, int, int, bool]
+    assert [type(row["value"]) for row in table] == types
+    assert [type(row["diagnostics"]["k"]) for row in table] == types
+    assert ResultTable.from_records([{"n": 2**64}])[0]["n"] == 2**64
+
+
+def test_builder_orders_rows_by_position():
+    builder = ResultTableBuilder()
+    for position in [2, 0, 3, 1]:
+        builder.add(position, _records()[position])
+
+    assert builder.build() == _records()
+
+
+def test_rows_behave_like_dicts():
+    table = ResultTable.from_records(_records())
+
+    row = table[2]
+    assert isinstance(row, RowView)
+    assert row["initiative_id"] == "init-2"
+    assert type(row["sample_size"]) is int
+    assert {**row, "cost_to_scale": 1}["effect_estimate"] == 3.0
+    assert dict(table[-1]) == _records()[-1]
+    with pytest.raises(IndexError):
+        table[4]
+    with pytest.raises(AttributeError):
+        row.extra = 1
+
+
+def test_table_equals_records():
+    table = ResultTable.from_records(_records())
+
+    assert table == _records()
+    assert table != _records()[:3]
+    assert table[1:3] == _records()[1:3]
+    assert table.to_records() == _records()
+    assert ResultTable.from_records([]) == []
+
+
+def test_serialization_round_trip():
+    table = ResultTable.from_records(_records())
+
+    assert serialization.loads(serialization.dumps({"rows": table}))["rows"] == _records()
+
+
+def test_export_to_arrow_pandas_and_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = ResultTable.from_records(_records())
+
+    arrow = table.to_arrow()
+    assert arrow.num_rows == 4
+    assert arrow.column("model_type").to_pylist() == ["experiment"] * 4
+
+    frame = table.to_pandas()
+    assert frame["sample_size"].tolist() == [0, 100, 200, 300]
+
+    path = tmp_path / "results.parquet"
+    table.to_parquet(str(path))
+    loaded = pq.read_table(path)
+    assert loaded.column("initiative_id").to_pylist() == [f"init-{k}" for k in range(4)]
+    assert json.loads(json.dumps(loaded.column("diagnostics").to_pylist()))[1] == {"r_squared": 0.1}
+
+
+def _wide_record(k):
+    return {
+        "initiative_id": f"init-{k:06d}",
+        "effect_estimate": 0.1 * k,
+        "sample_size": 1000,
+        "model_type": ModelType.EXPERIMENT,
+        "diagnostics": {f"metric_{j}": float(j * k) for j in range(10)},
+    }
+
+
+def test_incremental_table_needs_a_fraction_of_the_records_memory():
+    n = 20000
+    tracemalloc.start()
+    try:
+        records = [_wide_record(k) for k in range(n)]
+        records_bytes = tracemalloc.get_traced_memory()[0]
+        del records
+
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        builder = ResultTableBuilder()
+        for k in range(n):
+            builder.add(k, _wide_record(k))
+        table = builder.build()
+        table_peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert len(table) == n
+    assert table_peak < records_bytes / 2
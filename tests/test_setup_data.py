@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import yaml
+
+from impact_engine_orchestrator import fingerprint, setup_data
+
+STUBS = Path(__file__).parent / "stubs"
+
+
+@pytest.fixture()
+def simulator(monkeypatch, tmp_path):
+    """Put the stub simulator on the path of this process and of spawned workers; return its call log."""
+    monkeypatch.syspath_prepend(str(STUBS))
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [str(STUBS), os.environ.get("PYTHONPATH")])))
+    log = tmp_path / "simulator.log"
+    monkeypatch.setenv("FAKE_SIMULATOR_LOG", str(log))
+
+    def calls():
+        return [line.split(" ", 1) for line in log.read_text().splitlines()] if log.exists() else []
+
+    return calls
+
+
+@pytest.fixture()
+def project(tmp_path):
+    (tmp_path / "configs" / "simulator").mkdir(parents=True)
+    initiatives = []
+    for iid in ("a", "b", "c"):
+        measure_config = tmp_path / "configs" / f"{iid}.yaml"
+        products = tmp_path / "data" / iid / "products.csv"
+        measure_config.write_text(yaml.dump({"DATA": {"SOURCE": {"CONFIG": {"path": str(products)}}}}))
+        if iid != "c":
+            (tmp_path / "configs" / "simulator" / f"{iid}.yaml").write_text(yaml.dump({"n_products": 3}))
+        initiatives.append({"initiative_id": iid, "cost_to_scale": 100, "measure_config": f"configs/{iid}.yaml"})
+    config = tmp_path / "config.yaml"
+    config.write_text(yaml.dump({"budget": 1000, "initiatives": initiatives}))
+    return tmp_path, str(config)
+
+
+def test_generates_csv_and_parquet(simulator, project):
+    pytest.importorskip("pyarrow")
+    root, config = project
+    status = setup_data.generate(config, max_workers=1)
+
+    assert status == {"a": "generated", "b": "generated", "c": "no simulator config"}
+    csv = pd.read_csv(root / "data" / "a" / "products.csv")
+    pd.testing.assert_frame_equal(pd.read_parquet(root / "data" / "a" / "products.parquet"), csv)
+    assert fingerprint.read_sidecar(root / "data" / "a" / "products.parquet", fingerprint.CSV) == fingerprint.file_hash(
+        root / "data" / "a" / "products.csv"
+    )
+    assert fingerprint.read_sidecar(root / "data" / "a" / "products.csv", fingerprint.SIMULATOR) is not None
+    assert len(csv) == 3
+
+
+def test_skips_unchanged_simulator_configs(simulator, project):
+    root, config = project
+    setup_data.generate(config, max_workers=1)
+    (root / "configs" / "simulator" / "b.yaml").write_text(yaml.dump({"n_products": 5}))
+    calls_before = len(simulator())
+
+    status = setup_data.generate(config, max_workers=1)
+
+    assert status == {"a": "unchanged", "b": "generated", "c": "no simulator config"}
+    assert len(simulator()) == calls_before + 1
+    assert len(pd.read_csv(root / "data" / "b" / "products.csv")) == 5
+
+    assert setup_data.generate(config, max_workers=1, force=True)["a"] == "generated"
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_generates_in_parallel_worker_processes(simulator, project, monkeypatch, start_method):
+    monkeypatch.setattr(
+        setup_data,
+        "ProcessPoolExecutor",
+        partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context(start_method)),
+    )
+    root, config = project
+    status = setup_data.generate(config, max_workers=2)
+
+    assert status == {"a": "generated", "b": "generated", "c": "no simulator config"}
+    pids = {pid for pid, _ in simulator()}
+    assert len(simulator()) == 2
+    assert str(os.getpid()) not in pids
+    for iid in ("a", "b"):
+        assert len(pd.read_csv(root / "data" / iid / "products.csv")) == 3
@@ -0,0 +1,74 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from impact_engine_orchestrator.contracts.types import ModelType
+from impact_engine_orchestrator.store import RunStore
+
+
+def _report(initiative_id, error, model_type=ModelType.EXPERIMENT):
+    return {
+        "initiative_id": initiative_id,
+        "predicted_return": 0.1,
+        "actual_return": 0.1 + error,
+        "prediction_error": error,
+        "sample_size_pilot": 100,
+        "sample_size_scale": 5000,
+        "budget_allocated": 1000.0,
+        "confidence_score": 0.5,
+        "model_type": model_type,
+    }
+
+
+@pytest.fixture()
+def store(tmp_path):
+    with RunStore(str(tmp_path / "runs.db")) as store:
+        store.write("run-1", [_report("a", 0.1), _report("b", -0.3, ModelType.SYNTHETIC_CONTROL)], date(2026, 9, 1))
+        store.write("run-2", [_report("a", 0.3), _report("b", -0.1, ModelType.SYNTHETIC_CONTROL)], date(2026, 10, 1))
+        yield store
+
+
+def test_query_filters(store):
+    rows = store.query(initiative_id="a")
+    assert [(r["run_id"], r["prediction_error"]) for r in rows] == [("run-1", 0.1), ("run-2", 0.3)]
+    assert rows[0]["model_type"] is ModelType.EXPERIMENT
+
+    assert [r["initiative_id"] for r in store.query(run_id="run-2")] == ["a", "b"]
+    assert [r["run_id"] for r in store.query(model_type=ModelType.SYNTHETIC_CONTROL, since="2026-10")] == ["run-2"]
+    assert [r["run_id"] for r in store.query(initiative_id="b", until=date(2026, 10, 1))] == ["run-1"]
+    assert len(store.query(limit=3)) == 3
+
+
+def test_calibration_by_model_type(store):
+    groups = store.calibration()
+    assert [g["model_type"] for g in groups] == [ModelType.EXPERIMENT, ModelType.SYNTHETIC_CONTROL]
+    assert groups[0]["count"] == 2
+    assert groups[0]["mean_error"] == pytest.approx(0.2)
+    assert groups[1]["mean_abs_error"] == pytest.approx(0.2)
+
+    (recent,) = store.calibration(by="day", since=date(2026, 10, 1))
+    assert recent["day"] == "2026-10-01"
+    assert recent["count"] == 2
+
+
+def test_rewriting_a_run_replaces_it(store):
+    store.write("run-2", [_report("c", 0.0)])
+    assert [r["initiative_id"] for r in store.query(run_id="run-2")] == ["c"]
+    assert [run["run_id"] for run in store.runs()] == ["run-1", "run-2"]
+
+
+def test_timestamps_normalized_to_utc(tmp_path):
+    with RunStore(str(tmp_path / "runs.db")) as store:
+        store.write("run", [_report("a", 0.0)], datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc))
+        assert store.query()[0]["recorded_at"] == "2026-10-16T12:00:00Z"
+
+
+def test_queries_use_indexes(store):
+    for sql, params in [
+        ("SELECT * FROM outcome_reports WHERE initiative_id = ?", ("a",)),
+        ("SELECT * FROM outcome_reports WHERE run_id = ?", ("run-1",)),
+        ("SELECT * FROM outcome_reports WHERE recorded_at >= ?", ("2026-10",)),
+        ("SELECT AVG(prediction_error) FROM outcome_reports WHERE model_type = ?", ("experiment",)),
+    ]:
+        plan = " ".join(row["detail"] for row in store._conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+        assert "USING" in plan and "INDEX" in plan, plan